@@ -0,0 +1,36 @@
+"""Add pending run marker to workspaces
+
+Revision ID: 202508010001
+Revises: 202507200001
+Create Date: 2025-08-01 00:01:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "202508010001"
+down_revision: Union[str, Sequence[str], None] = "202507200001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workspaces",
+        sa.Column(
+            "pending_run_dispatched_at", sa.DateTime(timezone=True), nullable=True
+        ),
+    )
+    op.create_index(
+        "ix_workspaces_pending_run_dispatched_at",
+        "workspaces",
+        ["pending_run_dispatched_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_workspaces_pending_run_dispatched_at", table_name="workspaces")
+    op.drop_column("workspaces", "pending_run_dispatched_at")
@@ -0,0 +1,39 @@
+"""Add shared GitHub Actions cache table
+
+Revision ID: 202508050001
+Revises: 202508010001
+Create Date: 2025-08-05 00:01:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "202508050001"
+down_revision: Union[str, Sequence[str], None] = "202508010001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "github_actions_cache",
+        sa.Column("key", sa.String(length=512), nullable=False),
+        sa.Column("value_json", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        "ix_github_actions_cache_expires_at",
+        "github_actions_cache",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_github_actions_cache_expires_at", table_name="github_actions_cache"
+    )
+    op.drop_table("github_actions_cache")
@@ -0,0 +1,121 @@
+"""Add durable workflow_run_results and backfill from workspaces
+
+Revision ID: 202508080001
+Revises: 202508050001
+Create Date: 2025-08-08 00:01:00.000000
+"""
+
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "202508080001"
+down_revision: Union[str, Sequence[str], None] = "202508050001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Workspace summaries do not record artifact errors, so an "error" there may
+# be transient; leave those runs to be fetched again.
+TERMINAL_STATUSES = {"passed", "failed"}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workflow_run_results",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("repo_full_name", sa.String(length=255), nullable=False),
+        sa.Column("run_id", sa.BigInteger(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("conclusion", sa.String(length=50), nullable=True),
+        sa.Column("passed", sa.Integer(), nullable=True),
+        sa.Column("failed", sa.Integer(), nullable=True),
+        sa.Column("total", sa.Integer(), nullable=True),
+        sa.Column("stdout", sa.Text(), nullable=True),
+        sa.Column("stderr", sa.Text(), nullable=True),
+        sa.Column("head_sha", sa.String(length=100), nullable=True),
+        sa.Column("html_url", sa.String(length=500), nullable=True),
+        sa.Column("raw_json", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "repo_full_name", "run_id", name="uq_workflow_run_results_repo_run"
+        ),
+    )
+    _backfill_from_workspaces()
+
+
+def _backfill_from_workspaces() -> None:
+    """Copy finished runs recorded on workspaces into the new table."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            """
+            SELECT repo_full_name, last_workflow_run_id, last_workflow_conclusion,
+                   latest_commit_sha, last_test_summary_json
+            FROM workspaces
+            WHERE last_workflow_run_id IS NOT NULL
+              AND last_test_summary_json IS NOT NULL
+            """
+        )
+    ).fetchall()
+    records = []
+    seen = set()
+    for repo, run_id, conclusion, head_sha, summary_json in rows:
+        try:
+            run_id = int(run_id)
+            summary = json.loads(summary_json)
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(summary, dict):
+            continue
+        status = summary.get("status")
+        if status not in TERMINAL_STATUSES or (repo, run_id) in seen:
+            continue
+        seen.add((repo, run_id))
+        records.append(
+            {
+                "repo_full_name": repo,
+                "run_id": run_id,
+                "status": status,
+                "conclusion": conclusion,
+                "passed": summary.get("passed"),
+                "failed": summary.get("failed"),
+                "total": summary.get("total"),
+                "stdout": summary.get("stdout"),
+                "stderr": summary.get("stderr"),
+                "head_sha": head_sha,
+                "html_url": f"https://github.com/{repo}/actions/runs/{run_id}",
+                "raw_json": (
+                    json.dumps({"summary": summary["summary"]})
+                    if summary.get("summary") is not None
+                    else None
+                ),
+            }
+        )
+    if records:
+        bind.execute(
+            sa.text(
+                """
+                INSERT INTO workflow_run_results (
+                    repo_full_name, run_id, status, conclusion, passed, failed,
+                    total, stdout, stderr, head_sha, html_url, raw_json
+                ) VALUES (
+                    :repo_full_name, :run_id, :status, :conclusion, :passed,
+                    :failed, :total, :stdout, :stderr, :head_sha, :html_url,
+                    :raw_json
+                )
+                """
+            ),
+            records,
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("workflow_run_results")
@@ -0,0 +1,27 @@
+"""Add remembered workflow file to workspaces
+
+Revision ID: 202508120001
+Revises: 202508080001
+Create Date: 2025-08-12 00:01:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "202508120001"
+down_revision: Union[str, Sequence[str], None] = "202508080001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workspaces",
+        sa.Column("workflow_file", sa.String(length=255), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("workspaces", "workflow_file")
@@ -0,0 +1,60 @@
+"""Add submission_jobs and submissions.processing_status
+
+Revision ID: 202508150001
+Revises: 202508120001
+Create Date: 2025-08-15 00:01:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "202508150001"
+down_revision: Union[str, Sequence[str], None] = "202508120001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "submissions",
+        sa.Column("processing_status", sa.String(length=20), nullable=True),
+    )
+    op.create_table(
+        "submission_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("submission_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("lease_owner", sa.String(length=100), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("payload_json", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["submission_id"], ["submissions.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("submission_id", name="uq_submission_jobs_submission_id"),
+    )
+    op.create_index(
+        "ix_submission_jobs_status_next_attempt",
+        "submission_jobs",
+        ["status", "next_attempt_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_submission_jobs_status_next_attempt", table_name="submission_jobs"
+    )
+    op.drop_table("submission_jobs")
+    op.drop_column("submissions", "processing_status")
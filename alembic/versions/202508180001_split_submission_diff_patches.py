@@ -0,0 +1,109 @@
+"""Move diff patches out of submissions.diff_summary_json
+
+Revision ID: 202508180001
+Revises: 202508150001
+Create Date: 2025-08-18 00:01:00.000000
+"""
+
+import json
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "202508180001"
+down_revision: Union[str, Sequence[str], None] = "202508150001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "submission_diff_patches",
+        sa.Column("submission_id", sa.Integer(), nullable=False),
+        sa.Column("patches_zlib", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["submission_id"], ["submissions.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("submission_id"),
+    )
+
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(
+            """
+            SELECT id, diff_summary_json
+            FROM submissions
+            WHERE diff_summary_json LIKE '%"patch"%'
+            """
+        )
+    ).fetchall()
+    for submission_id, raw in rows:
+        try:
+            summary = json.loads(raw)
+        except ValueError:
+            continue
+        if not isinstance(summary, dict) or not isinstance(summary.get("files"), list):
+            continue
+        patches = {}
+        for f in summary["files"]:
+            if not isinstance(f, dict):
+                continue
+            patch = f.pop("patch", None)
+            if patch and f.get("filename"):
+                patches[f["filename"]] = patch
+        if patches:
+            conn.execute(
+                sa.text(
+                    """
+                    INSERT INTO submission_diff_patches (submission_id, patches_zlib)
+                    VALUES (:submission_id, :patches_zlib)
+                    """
+                ),
+                {
+                    "submission_id": submission_id,
+                    "patches_zlib": zlib.compress(
+                        json.dumps(patches, ensure_ascii=False).encode("utf-8")
+                    ),
+                },
+            )
+        conn.execute(
+            sa.text("UPDATE submissions SET diff_summary_json = :raw WHERE id = :id"),
+            {"raw": json.dumps(summary, ensure_ascii=False), "id": submission_id},
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(
+            """
+            SELECT s.id, s.diff_summary_json, p.patches_zlib
+            FROM submissions s
+            JOIN submission_diff_patches p ON p.submission_id = s.id
+            """
+        )
+    ).fetchall()
+    for submission_id, raw, blob in rows:
+        try:
+            summary = json.loads(raw) if raw else None
+            patches = json.loads(zlib.decompress(blob).decode("utf-8"))
+        except (ValueError, zlib.error):
+            continue
+        if not isinstance(summary, dict) or not isinstance(summary.get("files"), list):
+            continue
+        for f in summary["files"]:
+            if isinstance(f, dict) and f.get("filename") in patches:
+                f["patch"] = patches[f["filename"]]
+        conn.execute(
+            sa.text("UPDATE submissions SET diff_summary_json = :raw WHERE id = :id"),
+            {"raw": json.dumps(summary, ensure_ascii=False), "id": submission_id},
+        )
+    op.drop_table("submission_diff_patches")
@@ -0,0 +1,239 @@
+"""Materialize recruiter list fields on submissions
+
+Revision ID: 202508200001
+Revises: 202508180001
+Create Date: 2025-08-20 00:01:00.000000
+"""
+
+import json
+import re
+from typing import Any, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "202508200001"
+down_revision: Union[str, Sequence[str], None] = "202508180001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH_SIZE = 500
+
+_COLUMNS = [
+    ("tests_total", sa.Integer()),
+    ("test_status", sa.String(length=20)),
+    ("test_run_id", sa.String(length=100)),
+    ("test_conclusion", sa.String(length=50)),
+    ("test_timeout", sa.Boolean()),
+    ("test_stdout_preview", sa.Text()),
+    ("test_stdout_truncated", sa.Boolean()),
+    ("test_stderr_preview", sa.Text()),
+    ("test_stderr_truncated", sa.Boolean()),
+    ("test_summary", sa.JSON(none_as_null=True)),
+    ("test_artifact_present", sa.Boolean()),
+    ("test_artifact_error", sa.String(length=100)),
+    ("diff_base", sa.String(length=100)),
+    ("diff_head", sa.String(length=100)),
+    ("diff_files_changed", sa.Integer()),
+    ("diff_additions", sa.Integer()),
+    ("diff_deletions", sa.Integer()),
+]
+
+
+# Frozen copy of the list-field derivation as of this revision (see
+# app/domains/submissions/presenter/materialize.py). Later changes to the app
+# must not change what this migration writes, so nothing is imported from it.
+_MAX_OUTPUT_CHARS = 4000
+_TOKEN_REDACT_PATTERNS = [
+    re.compile(r"gh[pous]_[A-Za-z0-9]{10,}", re.IGNORECASE),
+    re.compile(r"github_pat_[A-Za-z0-9_]{10,}", re.IGNORECASE),
+    re.compile(r"(Authorization:\s*Bearer)\s+[^\s]+", re.IGNORECASE),
+    re.compile(r"(token)\s+[A-Za-z0-9_\-]{10,}", re.IGNORECASE),
+]
+
+
+def _safe_int(val) -> int | None:
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return None
+
+
+def _sanitize_stream(value) -> tuple[str | None, bool | None]:
+    if not isinstance(value, str):
+        return None, None
+    for pattern in _TOKEN_REDACT_PATTERNS:
+        value = (
+            pattern.sub(lambda match: f"{match.group(1)} [redacted]", value)
+            if pattern.groups
+            else pattern.sub("[redacted]", value)
+        )
+    if len(value) <= _MAX_OUTPUT_CHARS:
+        return value, False
+    return value[:_MAX_OUTPUT_CHARS] + "... (truncated)", True
+
+
+def _parse_test_output(test_output: str | None):
+    if not test_output:
+        return None
+    try:
+        parsed = json.loads(test_output)
+    except ValueError:
+        return test_output
+    return parsed if isinstance(parsed, dict) else test_output
+
+
+def _test_status(passed, failed, output) -> str | None:
+    parsed = output if isinstance(output, dict) else None
+    if passed is None and failed is None and parsed is None:
+        if not output or (isinstance(output, str) and not output.strip()):
+            return None
+    if parsed:
+        status_text = str(parsed.get("status") or "").lower()
+        if parsed.get("timeout") is True:
+            return "timeout"
+        if status_text in {"passed", "failed", "timeout", "error"}:
+            return status_text
+    if failed is not None and failed > 0:
+        return "failed"
+    if passed is not None and (failed is None or failed == 0):
+        return "passed"
+    return "unknown"
+
+
+def _test_fields(row) -> dict[str, Any]:
+    output = _parse_test_output(row.test_output) or None
+    passed = failed = total = run_id = conclusion = timeout = None
+    summary = stdout = stderr = stdout_truncated = stderr_truncated = None
+    artifact_error = None
+    if isinstance(output, dict):
+        passed = _safe_int(output.get("passed"))
+        failed = _safe_int(output.get("failed"))
+        total = _safe_int(output.get("total"))
+        run_id = output.get("runId") or output.get("run_id")
+        raw_conclusion = output.get("conclusion")
+        conclusion = str(raw_conclusion).lower() if raw_conclusion else None
+        timeout = output.get("timeout") is True or conclusion == "timed_out"
+        summary = output.get("summary")
+        summary = summary if isinstance(summary, dict) else None
+        stdout, stdout_truncated = _sanitize_stream(output.get("stdout"))
+        stderr, stderr_truncated = _sanitize_stream(output.get("stderr"))
+        artifact_error = output.get("artifactErrorCode") or output.get(
+            "artifact_error_code"
+        )
+        if isinstance(artifact_error, str):
+            artifact_error = artifact_error.lower()
+    elif isinstance(output, str):
+        _text, stdout_truncated = _sanitize_stream(output)
+        stderr_truncated = stdout_truncated
+    if passed is None:
+        passed = _safe_int(row.tests_passed)
+    if failed is None:
+        failed = _safe_int(row.tests_failed)
+    if total is None and (passed is not None or failed is not None):
+        total = (passed or 0) + (failed or 0)
+    if run_id is None and row.workflow_run_id:
+        try:
+            run_id = int(row.workflow_run_id)
+        except (TypeError, ValueError):
+            run_id = row.workflow_run_id
+    return {
+        "tests_passed": passed,
+        "tests_failed": failed,
+        "tests_total": total,
+        "test_status": _test_status(passed, failed, output),
+        "test_run_id": str(run_id) if run_id is not None else None,
+        "test_conclusion": conclusion,
+        "test_timeout": timeout,
+        "test_stdout_preview": stdout,
+        "test_stdout_truncated": stdout_truncated,
+        "test_stderr_preview": stderr,
+        "test_stderr_truncated": stderr_truncated,
+        "test_summary": summary,
+        "test_artifact_present": True if output is not None else None,
+        "test_artifact_error": artifact_error,
+    }
+
+
+def _diff_fields(diff_summary_json: str | None) -> dict[str, Any]:
+    try:
+        diff = json.loads(diff_summary_json) if diff_summary_json else None
+    except ValueError:
+        diff = None
+    if not isinstance(diff, dict):
+        return {
+            "diff_base": None,
+            "diff_head": None,
+            "diff_files_changed": None,
+            "diff_additions": None,
+            "diff_deletions": None,
+        }
+    files = diff.get("files")
+    files = (
+        [f for f in files if isinstance(f, dict)] if isinstance(files, list) else None
+    )
+    return {
+        "diff_base": diff.get("base"),
+        "diff_head": diff.get("head"),
+        "diff_files_changed": len(files) if files is not None else None,
+        "diff_additions": (
+            sum(_safe_int(f.get("additions")) or 0 for f in files)
+            if files is not None
+            else None
+        ),
+        "diff_deletions": (
+            sum(_safe_int(f.get("deletions")) or 0 for f in files)
+            if files is not None
+            else None
+        ),
+    }
+
+
+def _list_fields(row) -> dict[str, Any]:
+    return {**_test_fields(row), **_diff_fields(row.diff_summary_json)}
+
+
+def upgrade() -> None:
+    for column, type_ in _COLUMNS:
+        op.add_column("submissions", sa.Column(column, type_, nullable=True))
+
+    submissions = sa.table(
+        "submissions",
+        sa.column("id", sa.Integer()),
+        sa.column("tests_passed", sa.Integer()),
+        sa.column("tests_failed", sa.Integer()),
+        sa.column("test_output", sa.Text()),
+        sa.column("workflow_run_id", sa.String()),
+        sa.column("diff_summary_json", sa.Text()),
+        *(sa.column(column, type_) for column, type_ in _COLUMNS),
+    )
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(
+                submissions.c.id,
+                submissions.c.tests_passed,
+                submissions.c.tests_failed,
+                submissions.c.test_output,
+                submissions.c.workflow_run_id,
+                submissions.c.diff_summary_json,
+            )
+            .where(submissions.c.id > last_id)
+            .order_by(submissions.c.id)
+            .limit(_BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        for row in rows:
+            conn.execute(
+                sa.update(submissions)
+                .where(submissions.c.id == row.id)
+                .values(**_list_fields(row))
+            )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    for column, _type in reversed(_COLUMNS):
+        op.drop_column("submissions", column)
@@ -0,0 +1,25 @@
+"""Add (submitted_at, id) index for keyset pagination of submissions
+
+Revision ID: 202508210001
+Revises: 202508200001
+Create Date: 2025-08-21 00:01:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "202508210001"
+down_revision: Union[str, Sequence[str], None] = "202508200001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_submissions_submitted_at_id", "submissions", ["submitted_at", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_submissions_submitted_at_id", table_name="submissions")
@@ -0,0 +1,100 @@
+"""Add progress counters to candidate_sessions
+
+Revision ID: 202508220001
+Revises: 202508210001
+Create Date: 2025-08-22 00:01:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "202508220001"
+down_revision: Union[str, Sequence[str], None] = "202508210001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_FK_NAME = "fk_candidate_sessions_current_task_id_tasks"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "candidate_sessions",
+        sa.Column(
+            "completed_task_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+    op.add_column(
+        "candidate_sessions",
+        sa.Column("current_task_id", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "candidate_sessions",
+        sa.Column("last_submitted_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    if op.get_bind().dialect.name != "sqlite":
+        op.create_foreign_key(
+            _FK_NAME,
+            "candidate_sessions",
+            "tasks",
+            ["current_task_id"],
+            ["id"],
+            ondelete="SET NULL",
+        )
+
+    # Backfill sessions with submissions in one statement; the rest keep the
+    # defaults (nothing completed, NULL current task = the first one).
+    sessions = sa.table(
+        "candidate_sessions",
+        sa.column("id", sa.Integer()),
+        sa.column("simulation_id", sa.Integer()),
+        sa.column("completed_task_count", sa.Integer()),
+        sa.column("current_task_id", sa.Integer()),
+        sa.column("last_submitted_at", sa.DateTime(timezone=True)),
+    )
+    tasks = sa.table(
+        "tasks",
+        sa.column("id", sa.Integer()),
+        sa.column("simulation_id", sa.Integer()),
+        sa.column("day_index", sa.Integer()),
+    )
+    submissions = sa.table(
+        "submissions",
+        sa.column("candidate_session_id", sa.Integer()),
+        sa.column("task_id", sa.Integer()),
+        sa.column("submitted_at", sa.DateTime(timezone=True)),
+    )
+    own = submissions.c.candidate_session_id == sessions.c.id
+    op.execute(
+        sa.update(sessions)
+        .where(sa.exists().where(own))
+        .values(
+            completed_task_count=sa.select(
+                sa.func.count(sa.distinct(submissions.c.task_id))
+            )
+            .where(own)
+            .scalar_subquery(),
+            current_task_id=sa.select(tasks.c.id)
+            .where(
+                tasks.c.simulation_id == sessions.c.simulation_id,
+                ~sa.exists()
+                .where(own, submissions.c.task_id == tasks.c.id)
+                .correlate_except(submissions),
+            )
+            .order_by(tasks.c.day_index)
+            .limit(1)
+            .scalar_subquery(),
+            last_submitted_at=sa.select(sa.func.max(submissions.c.submitted_at))
+            .where(own)
+            .scalar_subquery(),
+        )
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        op.drop_constraint(_FK_NAME, "candidate_sessions", type_="foreignkey")
+    op.drop_column("candidate_sessions", "last_submitted_at")
+    op.drop_column("candidate_sessions", "current_task_id")
+    op.drop_column("candidate_sessions", "completed_task_count")
@@ -0,0 +1,36 @@
+"""Add pending run poll timestamp to workspaces
+
+Revision ID: 202508230001
+Revises: 202508220001
+Create Date: 2025-08-23 00:01:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "202508230001"
+down_revision: Union[str, Sequence[str], None] = "202508220001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workspaces",
+        sa.Column(
+            "pending_run_checked_at", sa.DateTime(timezone=True), nullable=True
+        ),
+    )
+    op.create_index(
+        "ix_workspaces_pending_run_checked_at",
+        "workspaces",
+        ["pending_run_checked_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_workspaces_pending_run_checked_at", table_name="workspaces")
+    op.drop_column("workspaces", "pending_run_checked_at")
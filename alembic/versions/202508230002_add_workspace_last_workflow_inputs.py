@@ -0,0 +1,27 @@
+"""Record the inputs of each workspace's last dispatched run
+
+Revision ID: 202508230002
+Revises: 202508230001
+Create Date: 2025-08-23 00:02:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "202508230002"
+down_revision: Union[str, Sequence[str], None] = "202508230001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workspaces",
+        sa.Column("last_workflow_inputs_json", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("workspaces", "last_workflow_inputs_json")
@@ -5,18 +5,63 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.core.db import async_session_maker
+from app.core.perf import register_metrics_provider
 from app.core.settings import settings
 from app.integrations.github import GithubClient
 from app.integrations.github.actions_runner import GithubActionsRunner
+from app.integrations.github.actions_runner.cache import ActionsCache
+from app.integrations.github.artifacts import ArtifactLimits, ArtifactParseExecutor
+from app.integrations.github.webhooks import WorkflowRunEventStore
+from app.repositories.github_native.actions_cache.repository import (
+    DatabaseActionsCacheBackend,
+)
+
+
+@lru_cache(maxsize=1)
+def _workflow_run_events_singleton() -> WorkflowRunEventStore:
+    store = WorkflowRunEventStore(
+        first_event_seconds=settings.github.GITHUB_WEBHOOK_WAIT_SECONDS
+    )
+    register_metrics_provider("github_webhook_runs", store.stats)
+    return store
+
+
+def get_workflow_run_events() -> WorkflowRunEventStore:
+    """Shared store fed by GitHub workflow webhooks."""
+    return _workflow_run_events_singleton()
 
 
 @lru_cache(maxsize=1)
 def _github_client_singleton() -> GithubClient:
-    return GithubClient(
+    client = GithubClient(
         base_url=settings.github.GITHUB_API_BASE,
         token=settings.github.GITHUB_TOKEN,
         default_org=settings.github.GITHUB_ORG or None,
+        conditional_cache_max_bytes=settings.github.GITHUB_CONDITIONAL_CACHE_MAX_BYTES,
+        artifact_max_bytes=settings.github.GITHUB_ARTIFACT_MAX_BYTES,
     )
+    if settings.github.GITHUB_WEBHOOK_SECRET:
+        client.run_events = _workflow_run_events_singleton()
+    client.artifact_parser = ArtifactParseExecutor(
+        mode=settings.github.GITHUB_ARTIFACT_PARSE_MODE,
+        max_workers=settings.github.GITHUB_ARTIFACT_PARSE_WORKERS,
+        timeout_seconds=settings.github.GITHUB_ARTIFACT_PARSE_TIMEOUT_SECONDS,
+        cpu_seconds=settings.github.GITHUB_ARTIFACT_PARSE_CPU_SECONDS or None,
+        limits=ArtifactLimits(
+            max_members=settings.github.GITHUB_ARTIFACT_MAX_MEMBERS,
+            max_uncompressed_bytes=settings.github.GITHUB_ARTIFACT_MAX_UNCOMPRESSED_BYTES,
+        ),
+    )
+    register_metrics_provider("github_artifact_parse", client.artifact_parser.stats)
+    transport = client.transport
+    register_metrics_provider("github_rate_budget", transport.rate_budget.snapshot)
+    register_metrics_provider("github_single_flight", transport.single_flight.stats)
+    if transport.conditional_cache is not None:
+        register_metrics_provider(
+            "github_conditional_cache", transport.conditional_cache.stats
+        )
+    return client
 
 
 def get_github_client() -> GithubClient:
@@ -24,14 +69,31 @@ def get_github_client() -> GithubClient:
     return _github_client_singleton()
 
 
+def _actions_cache() -> ActionsCache:
+    backend = None
+    if settings.github.GITHUB_ACTIONS_CACHE_BACKEND.lower() == "database":
+        backend = DatabaseActionsCacheBackend(async_session_maker)
+    cache = ActionsCache(
+        max_bytes=settings.github.GITHUB_ACTIONS_CACHE_MAX_BYTES,
+        backend=backend,
+        running_ttl_seconds=settings.github.GITHUB_ACTIONS_CACHE_RUNNING_TTL_SECONDS,
+    )
+    register_metrics_provider("github_actions_cache", cache.stats)
+    return cache
+
+
 @lru_cache(maxsize=1)
 def _actions_runner_singleton() -> GithubActionsRunner:
-    return GithubActionsRunner(
+    runner = GithubActionsRunner(
         _github_client_singleton(),
         workflow_file=settings.github.GITHUB_ACTIONS_WORKFLOW_FILE,
         poll_interval_seconds=2.0,
         max_poll_seconds=90.0,
+        correlation_input=settings.github.GITHUB_RUN_CORRELATION_INPUT,
+        cache=_actions_cache(),
     )
+    register_metrics_provider("github_run_poller", runner.run_poller.stats)
+    return runner
 
 
 def get_actions_runner(
@@ -44,5 +106,6 @@ def get_actions_runner(
             workflow_file=settings.github.GITHUB_ACTIONS_WORKFLOW_FILE,
             poll_interval_seconds=2.0,
             max_poll_seconds=90.0,
+            correlation_input=settings.github.GITHUB_RUN_CORRELATION_INPUT,
         )
     return _actions_runner_singleton()
@@ -4,7 +4,40 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.core.db import async_session_maker
 from app.core.db import init_db_if_needed as _init_db_if_needed
+from app.core.settings import settings
+from app.services.submissions.pending_runs import PendingRunPoller
+from app.services.submissions.submission_jobs import SubmissionJobWorker
+
+
+def _start_pending_run_poller() -> PendingRunPoller | None:
+    if not settings.github.GITHUB_ACTIONS_ASYNC_RUNS:
+        return None
+    from app.api.dependencies.github_native import _actions_runner_singleton
+
+    poller = PendingRunPoller(
+        session_maker=async_session_maker,
+        runner_factory=_actions_runner_singleton,
+        interval_seconds=settings.github.GITHUB_ACTIONS_POLL_INTERVAL_SECONDS,
+    )
+    poller.start()
+    return poller
+
+
+def _start_submission_job_worker() -> SubmissionJobWorker | None:
+    if not settings.github.GITHUB_ACTIONS_ASYNC_SUBMIT:
+        return None
+    from app.api.dependencies.github_native import _actions_runner_singleton
+
+    worker = SubmissionJobWorker(
+        session_maker=async_session_maker,
+        runner_factory=_actions_runner_singleton,
+        interval_seconds=settings.github.GITHUB_ACTIONS_POLL_INTERVAL_SECONDS,
+        max_attempts=settings.github.GITHUB_SUBMIT_JOB_MAX_ATTEMPTS,
+    )
+    worker.start()
+    return worker
 
 
 @asynccontextmanager
@@ -13,13 +46,28 @@ async def lifespan(_app: FastAPI):
     from app.api import main as api_main  # late import to aid monkeypatch in tests
 
     await getattr(api_main, "init_db_if_needed", _init_db_if_needed)()
+    poller = _start_pending_run_poller()
+    job_worker = _start_submission_job_worker()
     try:
         yield
     finally:
+        if job_worker is not None:
+            await job_worker.stop()
+        if poller is not None:
+            await poller.stop()
         try:
-            from app.api.dependencies.github_native import _github_client_singleton
+            from app.api.dependencies.github_native import (
+                _actions_runner_singleton,
+                _github_client_singleton,
+            )
+
+            if _actions_runner_singleton.cache_info().currsize:
+                await _actions_runner_singleton().run_poller.aclose()
 
             client = _github_client_singleton()
+            artifact_parser = getattr(client, "artifact_parser", None)
+            if artifact_parser is not None:
+                artifact_parser.shutdown()
             await client.aclose()
         except Exception:
             # Best-effort cleanup; swallow errors to avoid blocking shutdown.
@@ -3,9 +3,11 @@ from __future__ import annotations
 from fastapi import FastAPI
 
 from app.api.routers import (
+    admin_metrics,
     admin_templates,
     auth,
     candidate_sessions,
+    github_webhooks,
     health,
     simulations,
     submissions,
@@ -19,6 +21,10 @@ def register_routers(app: FastAPI) -> None:
     app.include_router(health.router, prefix="", tags=["health"])
     app.include_router(auth.router, prefix=f"{prefix}/auth", tags=["auth"])
     app.include_router(admin_templates.router, prefix=f"{prefix}/admin", tags=["admin"])
+    app.include_router(admin_metrics.router, prefix=f"{prefix}/admin", tags=["admin"])
+    app.include_router(
+        github_webhooks.router, prefix=f"{prefix}/github", tags=["github"]
+    )
     app.include_router(simulations.router, prefix=f"{prefix}", tags=["simulations"])
     app.include_router(
         candidate_sessions.router, prefix=f"{prefix}/candidate", tags=["candidate"]
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, status
+
+from app.core.auth.admin_api_key import require_admin_key
+from app.core.perf import metrics_snapshot
+
+router = APIRouter()
+
+
+@router.get("/perf/metrics", status_code=status.HTTP_200_OK)
+async def get_perf_metrics(
+    _: Annotated[None, Depends(require_admin_key)],
+) -> dict[str, dict[str, Any]]:
+    """Return live in-process counters (GitHub budget, caches) (admin-only)."""
+    return metrics_snapshot()
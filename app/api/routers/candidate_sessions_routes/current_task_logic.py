@@ -23,14 +23,10 @@ async def build_current_task_view(candidate_session_id, request, principal, db):
     cs = await cs_service.fetch_owned_session(
         db, candidate_session_id, principal, now=now
     )
-    (
-        _tasks,
-        completed_ids,
-        current_task,
-        completed,
-        total,
-        is_complete,
-    ) = await cs_service.progress_snapshot(db, cs)
+    current_task, completed, total, is_complete = await cs_service.progress_counters(
+        db, cs
+    )
+    completed_ids = await cs_service.completed_task_ids(db, cs.id)
     if is_complete and cs.status != "completed":
         cs.status = "completed"
         if cs.completed_at is None:
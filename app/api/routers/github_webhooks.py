@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from app.api.dependencies.github_native import get_workflow_run_events
+from app.core.settings import settings
+from app.integrations.github.webhooks import WorkflowRunEventStore, verify_signature
+
+router = APIRouter()
+
+
+@router.post("/webhooks", status_code=status.HTTP_202_ACCEPTED)
+async def receive_github_webhook(
+    request: Request,
+    run_events: Annotated[WorkflowRunEventStore, Depends(get_workflow_run_events)],
+) -> dict[str, str]:
+    """Ingest signed workflow_run/workflow_job deliveries from GitHub."""
+    secret = settings.github.GITHUB_WEBHOOK_SECRET
+    if not secret:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    body = await request.body()
+    if not verify_signature(secret, body, request.headers.get("X-Hub-Signature-256")):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid signature"
+        )
+    event = request.headers.get("X-GitHub-Event", "")
+    if event not in ("workflow_run", "workflow_job"):
+        return {"status": "ignored"}
+    try:
+        payload = json.loads(body)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON payload"
+        ) from exc
+    if not isinstance(payload, dict) or not run_events.ingest(event, payload):
+        return {"status": "ignored"}
+    return {"status": "accepted"}
@@ -17,7 +17,11 @@ async def get_submission_detail(
     sub, task, cs, sim = await recruiter_sub_service.fetch_detail(
         db, submission_id, user.id
     )
-    return RecruiterSubmissionDetailOut(**present_detail(sub, task, cs, sim))
+    job = await recruiter_sub_service.fetch_processing_job(db, sub)
+    patches = await recruiter_sub_service.fetch_diff_patches(db, sub)
+    return RecruiterSubmissionDetailOut(
+        **present_detail(sub, task, cs, sim, job, patches)
+    )
 
 
 async def list_submissions(
@@ -27,11 +31,19 @@ async def list_submissions(
     taskId: int | None = None,
     limit: int | None = None,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> RecruiterSubmissionListOut:
     ensure_recruiter_guard(user)
     rows = await recruiter_sub_service.list_submissions(
-        db, user.id, candidateSessionId, taskId, limit, offset
+        db,
+        user.id,
+        candidateSessionId,
+        taskId,
+        limit + 1 if limit is not None else None,
+        offset,
+        cursor=cursor,
     )
+    rows, next_cursor = recruiter_sub_service.page_rows(rows, limit)
     items: list[RecruiterSubmissionListItemOut] = []
     for row in rows:
         sub = row
@@ -41,7 +53,7 @@ async def list_submissions(
         if task is None:
             continue
         items.append(RecruiterSubmissionListItemOut(**present_list_item(sub, task)))
-    return RecruiterSubmissionListOut(items=items)
+    return RecruiterSubmissionListOut(items=items, nextCursor=next_cursor)
 
 
 __all__ = ["get_submission_detail", "list_submissions"]
@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 
-from app.api.routers.submissions_routes import detail, list
+from app.api.routers.submissions_routes import detail, export, list
 
 router = APIRouter(tags=["submissions"])
+# Registered before detail so /submissions/export is not read as an id.
+router.include_router(export.router)
 router.include_router(detail.router)
 router.include_router(list.router)
 
@@ -25,5 +25,7 @@ async def get_submission_detail_route(
     sub, task, cs, sim = await recruiter_sub_service.fetch_detail(
         db, submission_id, user.id
     )
-    payload = present_detail(sub, task, cs, sim)
+    job = await recruiter_sub_service.fetch_processing_job(db, sub)
+    patches = await recruiter_sub_service.fetch_diff_patches(db, sub)
+    payload = present_detail(sub, task, cs, sim, job, patches)
     return RecruiterSubmissionDetailOut(**payload)
@@ -0,0 +1,49 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.auth.current_user import get_current_user
+from app.core.auth.roles import ensure_recruiter
+from app.core.db import get_session_maker
+from app.domains import User
+from app.domains.submissions import service_recruiter as recruiter_sub_service
+from app.domains.submissions.presenter import present_list_item
+from app.domains.submissions.schemas import RecruiterSubmissionListItemOut
+
+router = APIRouter(prefix="/submissions", tags=["submissions"])
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_submissions_route(
+    session_maker: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_session_maker)
+    ],
+    user: Annotated[User, Depends(get_current_user)],
+    candidateSessionId: int | None = Query(default=None),
+    taskId: int | None = Query(default=None),
+) -> StreamingResponse:
+    """Stream every visible submission as NDJSON, one list item per line.
+
+    Rows come from a server-side cursor, so memory stays flat regardless of
+    how many submissions the recruiter has. The request's session is closed
+    before the body runs, so the cursor lives on a session of its own.
+    """
+    ensure_recruiter(user)
+
+    async def lines():
+        async with session_maker() as db:
+            async for sub in recruiter_sub_service.stream_submissions(
+                db, user.id, candidateSessionId, taskId
+            ):
+                item = RecruiterSubmissionListItemOut(
+                    **present_list_item(sub, sub.task)
+                )
+                yield item.model_dump_json(exclude={"testResults": {"output"}}) + "\n"
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="submissions.ndjson"'},
+    )
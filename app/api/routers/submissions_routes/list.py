@@ -30,12 +30,24 @@ async def list_submissions_route(
     taskId: int | None = Query(default=None),
     limit: int | None = Query(default=None, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
 ) -> RecruiterSubmissionListOut:
-    """List submissions visible to the recruiter with optional filters."""
+    """List submissions visible to the recruiter with optional filters.
+
+    Pass a page's ``nextCursor`` back as ``cursor`` (with the same ``limit``)
+    to continue after it; ``offset`` is ignored when a cursor is given.
+    """
     ensure_recruiter(user)
     rows = await recruiter_sub_service.list_submissions(
-        db, user.id, candidateSessionId, taskId, limit, offset
+        db,
+        user.id,
+        candidateSessionId,
+        taskId,
+        limit + 1 if limit is not None else None,
+        offset,
+        cursor=cursor,
     )
+    rows, next_cursor = recruiter_sub_service.page_rows(rows, limit)
     items: list[RecruiterSubmissionListItemOut] = []
     for row in rows:
         sub = row
@@ -46,4 +58,4 @@ async def list_submissions_route(
             continue
         payload = present_list_item(sub, task)
         items.append(RecruiterSubmissionListItemOut(**payload))
-    return RecruiterSubmissionListOut(items=items)
+    return RecruiterSubmissionListOut(items=items, nextCursor=next_cursor)
@@ -9,7 +9,10 @@ from app.core.errors import ApiError
 from app.domains import CandidateSession
 from app.domains.submissions import service_candidate as submission_service
 from app.domains.submissions.schemas import RunTestsRequest, RunTestsResponse
-from app.domains.submissions.use_cases.run_tests import run_task_tests
+from app.domains.submissions.use_cases.run_tests import (
+    run_task_tests,
+    start_task_tests,
+)
 from app.integrations.github.actions_runner import GithubActionsRunner
 from app.integrations.github.client import GithubError
 
@@ -20,9 +23,13 @@ async def handle_run_tests(
     db: AsyncSession,
     actions_runner: GithubActionsRunner,
     candidate_session: CandidateSession,
+    *,
+    wait: bool = True,
 ) -> RunTestsResponse:
+    """Run tests inline, or dispatch only and leave completion to the poller."""
+    use_case = run_task_tests if wait else start_task_tests
     try:
-        _, workspace, result = await run_task_tests(
+        _, workspace, result = await use_case(
             db,
             candidate_session=candidate_session,
             task_id=task_id,
@@ -42,5 +49,6 @@ async def handle_run_tests(
             retryable=True,
         ) from exc
 
-    await submission_service.record_run_result(db, workspace, result)
+    if wait:
+        await submission_service.record_run_result(db, workspace, result)
     return build_run_response(result)
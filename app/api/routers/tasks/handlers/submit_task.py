@@ -21,6 +21,8 @@ async def handle_submit_task(
     db: AsyncSession,
     github_client: GithubClient,
     actions_runner: GithubActionsRunner,
+    *,
+    enrich_async: bool = False,
 ) -> SubmissionCreateResponse:
     try:
         task, submission, completed, total, is_complete = await submit_task(
@@ -30,6 +32,7 @@ async def handle_submit_task(
             payload=payload,
             github_client=github_client,
             actions_runner=actions_runner,
+            enrich_async=enrich_async,
         )
     except GithubError as exc:
         raise map_github_error(exc) from exc
@@ -41,4 +44,5 @@ async def handle_submit_task(
         submittedAt=submission.submitted_at,
         progress=ProgressSummary(completed=completed, total=total),
         isComplete=is_complete,
+        processingStatus=getattr(submission, "processing_status", None),
     )
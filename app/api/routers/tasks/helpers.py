@@ -24,5 +24,5 @@ async def _concurrency_guard(key: str, limit: int):
 
 async def _compute_current_task(db, cs):
     """Return current task for a candidate session."""
-    tasks, _, current, *_ = await cs_service.progress_snapshot(db, cs)
+    current, *_ = await cs_service.progress_counters(db, cs)
     return current
@@ -1,17 +1,24 @@
+import json
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.api.dependencies.candidate_sessions import candidate_session_from_headers
 from app.api.dependencies.github_native import get_actions_runner
 from app.api.error_utils import map_github_error
-from app.api.routers.tasks.responses import build_run_response
-from app.core.db import get_session
+from app.api.routers.tasks.responses import build_run_event, build_run_response
+from app.core.db import get_session, get_session_maker
+from app.core.settings import settings
 from app.domains import CandidateSession
 from app.domains.submissions import service_candidate as submission_service
 from app.domains.submissions.schemas import RunTestsResponse
-from app.domains.submissions.use_cases.fetch_run import fetch_run_result
+from app.domains.submissions.use_cases.fetch_run import (
+    MAX_WAIT_SECONDS,
+    fetch_run_result,
+    stream_run_updates,
+)
 from app.integrations.github.actions_runner import GithubActionsRunner
 from app.integrations.github.client import GithubError
 
@@ -31,8 +38,15 @@ async def get_run_result_route(
     candidate_session: Annotated[
         CandidateSession, Depends(candidate_session_from_headers)
     ],
+    wait_seconds: Annotated[
+        int, Query(alias="waitSeconds", ge=0, le=MAX_WAIT_SECONDS)
+    ] = 0,
 ) -> RunTestsResponse:
-    """Poll a previously-triggered workflow run."""
+    """Poll a previously-triggered workflow run.
+
+    With ``waitSeconds`` the request is held until the run's state changes
+    or the wait elapses, instead of answering immediately.
+    """
     try:
         task, workspace, result = await fetch_run_result(
             db,
@@ -40,9 +54,68 @@ async def get_run_result_route(
             task_id=task_id,
             run_id=run_id,
             runner=actions_runner,
+            poll_after_ms=int(
+                settings.github.GITHUB_ACTIONS_POLL_INTERVAL_SECONDS * 1000
+            ),
+            wait_seconds=wait_seconds,
         )
     except GithubError as exc:
         raise map_github_error(exc) from exc
 
-    await submission_service.record_run_result(db, workspace, result)
+    if submission_service.run_result_changed(workspace, result):
+        await submission_service.record_run_result(db, workspace, result)
     return build_run_response(result)
+
+
+@router.get("/{task_id}/run/{run_id}/events", response_class=StreamingResponse)
+async def stream_run_events_route(
+    task_id: Annotated[int, Path(..., ge=1)],
+    run_id: Annotated[int, Path(..., ge=1)],
+    db: Annotated[AsyncSession, Depends(get_session)],
+    session_maker: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_session_maker)
+    ],
+    actions_runner: Annotated[GithubActionsRunner, Depends(get_actions_runner)],
+    candidate_session: Annotated[
+        CandidateSession, Depends(candidate_session_from_headers)
+    ],
+) -> StreamingResponse:
+    """Stream run status transitions as server-sent events until it finishes.
+
+    Events are named ``queued``, ``in_progress`` or ``completed`` and carry
+    the same payload as the polling endpoint.
+    """
+    try:
+        _, workspace, result = await fetch_run_result(
+            db,
+            candidate_session=candidate_session,
+            task_id=task_id,
+            run_id=run_id,
+            runner=actions_runner,
+        )
+    except GithubError as exc:
+        raise map_github_error(exc) from exc
+    if submission_service.run_result_changed(workspace, result):
+        await submission_service.record_run_result(db, workspace, result)
+
+    async def events():
+        try:
+            async for update in stream_run_updates(
+                session_maker,
+                workspace=workspace,
+                result=result,
+                runner=actions_runner,
+            ):
+                yield ": keep-alive\n\n" if update is None else build_run_event(update)
+        except GithubError as exc:
+            error = map_github_error(exc)
+            payload = json.dumps(
+                {"detail": error.detail, "errorCode": error.error_code}
+            )
+            yield f"event: error\ndata: {payload}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,5 +1,6 @@
 from app.domains.submissions.schemas import RunTestsResponse
 from app.integrations.github.actions_runner import ActionsRunResult
+from app.integrations.github.actions_runner.run_poller import run_phase
 
 
 def build_run_response(result: ActionsRunResult) -> RunTestsResponse:
@@ -18,3 +19,9 @@ def build_run_response(result: ActionsRunResult) -> RunTestsResponse:
         commitSha=result.head_sha,
         pollAfterMs=result.poll_after_ms,
     )
+
+
+def build_run_event(result: ActionsRunResult) -> str:
+    """Render a run result as a server-sent event named after its phase."""
+    payload = build_run_response(result).model_dump_json()
+    return f"event: {run_phase(result)}\ndata: {payload}\n\n"
@@ -1,12 +1,15 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.candidate_sessions import candidate_session_from_headers
 from app.api.dependencies.github_native import get_actions_runner
 from app.api.routers.tasks.handlers import handle_run_tests
 from app.core.db import get_session
+from app.core.settings import settings
 from app.domains import CandidateSession
 from app.domains.submissions.schemas import RunTestsRequest, RunTestsResponse
 from app.integrations.github.actions_runner import GithubActionsRunner
@@ -26,11 +29,22 @@ async def run_task_tests_route(
         CandidateSession, Depends(candidate_session_from_headers)
     ],
 ) -> RunTestsResponse:
-    """Dispatch GitHub Actions tests for a candidate task."""
-    return await handle_run_tests(
+    """Dispatch GitHub Actions tests for a candidate task.
+
+    With async runs enabled this returns 202 as soon as the run exists; poll
+    ``GET /{task_id}/run/{run_id}`` for the result.
+    """
+    wait = not settings.github.GITHUB_ACTIONS_ASYNC_RUNS
+    result = await handle_run_tests(
         task_id=task_id,
         payload=payload,
         db=db,
         actions_runner=actions_runner,
         candidate_session=candidate_session,
+        wait=wait,
     )
+    if not wait and result.status == "running":
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED, content=jsonable_encoder(result)
+        )
+    return result
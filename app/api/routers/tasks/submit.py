@@ -7,6 +7,7 @@ from app.api.dependencies.candidate_sessions import candidate_session_from_heade
 from app.api.dependencies.github_native import get_actions_runner, get_github_client
 from app.api.routers.tasks.handlers import handle_submit_task
 from app.core.db import get_session
+from app.core.settings import settings
 from app.domains import CandidateSession
 from app.domains.submissions.schemas import (
     SubmissionCreateRequest,
@@ -33,7 +34,11 @@ async def submit_task_route(
     github_client: Annotated[GithubClient, Depends(get_github_client)],
     actions_runner: Annotated[GithubActionsRunner, Depends(get_actions_runner)],
 ) -> SubmissionCreateResponse:
-    """Submit a task, optionally running GitHub tests for code/debug types."""
+    """Submit a task, optionally running GitHub tests for code/debug types.
+
+    With async submit enabled, code submissions return at once with
+    ``processingStatus: processing`` and a background job records the run.
+    """
     return await handle_submit_task(
         task_id=task_id,
         payload=payload,
@@ -41,4 +46,5 @@ async def submit_task_route(
         db=db,
         github_client=github_client,
         actions_runner=actions_runner,
+        enrich_async=settings.github.GITHUB_ACTIONS_ASYNC_SUBMIT,
     )
@@ -0,0 +1 @@
+from app.api.routers.admin_metrics import *  # noqa: F403
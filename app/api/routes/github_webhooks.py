@@ -0,0 +1 @@
+from app.api.routers.github_webhooks import *  # noqa: F403
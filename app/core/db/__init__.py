@@ -49,6 +49,11 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Session factory for work that outlives the request, like streamed bodies."""
+    return async_session_maker
+
+
 async def init_db_if_needed() -> None:
     """Create tables when using the sqlite fallback."""
     if not USING_SQLITE_FALLBACK:
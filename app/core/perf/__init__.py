@@ -14,6 +14,11 @@ from .context import (
     get_request_stats,
     start_request_stats,
 )
+from .metrics import (
+    metrics_snapshot,
+    register_metrics_provider,
+    unregister_metrics_provider,
+)
 from .middleware import _request_id_from_scope, create_request_perf_middleware
 from .sqlalchemy_hooks import register_listeners
 
@@ -55,6 +60,9 @@ __all__ = [
     "PerfStats",
     "RequestPerfMiddleware",
     "attach_sqlalchemy_listeners",
+    "metrics_snapshot",
+    "register_metrics_provider",
+    "unregister_metrics_provider",
     "perf_logging_enabled",
     "_perf_ctx",
     "_start_request_stats",
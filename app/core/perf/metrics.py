@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+MetricsProvider = Callable[[], dict[str, Any]]
+
+_providers: dict[str, MetricsProvider] = {}
+
+
+def register_metrics_provider(name: str, provider: MetricsProvider) -> None:
+    """Register (or replace) a named callable that reports live counters."""
+    _providers[name] = provider
+
+
+def unregister_metrics_provider(name: str) -> None:
+    """Drop a previously registered metrics provider."""
+    _providers.pop(name, None)
+
+
+def metrics_snapshot() -> dict[str, dict[str, Any]]:
+    """Collect current values from every registered provider."""
+    return {name: provider() for name, provider in sorted(_providers.items())}
+
+
+__all__ = [
+    "MetricsProvider",
+    "metrics_snapshot",
+    "register_metrics_provider",
+    "unregister_metrics_provider",
+]
@@ -13,5 +13,23 @@ class GithubSettings(BaseSettings):
     GITHUB_ACTIONS_WORKFLOW_FILE: str = "tenon-ci.yml"
     GITHUB_REPO_PREFIX: str = "tenon-ws-"
     GITHUB_CLEANUP_ENABLED: bool = False
+    GITHUB_CONDITIONAL_CACHE_MAX_BYTES: int = 0
+    GITHUB_ARTIFACT_MAX_BYTES: int = 100 * 1024 * 1024
+    GITHUB_ARTIFACT_PARSE_MODE: str = "thread"
+    GITHUB_ARTIFACT_PARSE_WORKERS: int = 2
+    GITHUB_ARTIFACT_PARSE_TIMEOUT_SECONDS: float = 30.0
+    GITHUB_ARTIFACT_PARSE_CPU_SECONDS: float = 10.0
+    GITHUB_ARTIFACT_MAX_MEMBERS: int = 1000
+    GITHUB_ARTIFACT_MAX_UNCOMPRESSED_BYTES: int = 512 * 1024 * 1024
+    GITHUB_WEBHOOK_SECRET: str = ""
+    GITHUB_WEBHOOK_WAIT_SECONDS: float = 15.0
+    GITHUB_RUN_CORRELATION_INPUT: str = ""
+    GITHUB_ACTIONS_ASYNC_RUNS: bool = False
+    GITHUB_ACTIONS_POLL_INTERVAL_SECONDS: float = 3.0
+    GITHUB_ACTIONS_ASYNC_SUBMIT: bool = False
+    GITHUB_SUBMIT_JOB_MAX_ATTEMPTS: int = 5
+    GITHUB_ACTIONS_CACHE_BACKEND: str = "memory"
+    GITHUB_ACTIONS_CACHE_RUNNING_TTL_SECONDS: float = 5.0
+    GITHUB_ACTIONS_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
 
     model_config = SettingsConfigDict(extra="ignore", env_prefix="TENON_")
@@ -31,6 +31,24 @@ _SECTIONS: dict[str, tuple[list[str], str]] = {
             "GITHUB_ACTIONS_WORKFLOW_FILE",
             "GITHUB_REPO_PREFIX",
             "GITHUB_CLEANUP_ENABLED",
+            "GITHUB_CONDITIONAL_CACHE_MAX_BYTES",
+            "GITHUB_ARTIFACT_MAX_BYTES",
+            "GITHUB_ARTIFACT_PARSE_MODE",
+            "GITHUB_ARTIFACT_PARSE_WORKERS",
+            "GITHUB_ARTIFACT_PARSE_TIMEOUT_SECONDS",
+            "GITHUB_ARTIFACT_PARSE_CPU_SECONDS",
+            "GITHUB_ARTIFACT_MAX_MEMBERS",
+            "GITHUB_ARTIFACT_MAX_UNCOMPRESSED_BYTES",
+            "GITHUB_WEBHOOK_SECRET",
+            "GITHUB_WEBHOOK_WAIT_SECONDS",
+            "GITHUB_RUN_CORRELATION_INPUT",
+            "GITHUB_ACTIONS_ASYNC_RUNS",
+            "GITHUB_ACTIONS_POLL_INTERVAL_SECONDS",
+            "GITHUB_ACTIONS_ASYNC_SUBMIT",
+            "GITHUB_SUBMIT_JOB_MAX_ATTEMPTS",
+            "GITHUB_ACTIONS_CACHE_BACKEND",
+            "GITHUB_ACTIONS_CACHE_RUNNING_TTL_SECONDS",
+            "GITHUB_ACTIONS_CACHE_MAX_BYTES",
         ],
         "TENON_",
     ),
@@ -32,6 +32,7 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool | None = None
     MAX_REQUEST_BODY_BYTES: int = 1_048_576
     DEBUG_PERF: bool = False
+    TASK_CACHE_MAX_SIMULATIONS: int = 1024
     TRUSTED_PROXY_CIDRS: list[str] | str = Field(default_factory=list)
     DEV_AUTH_BYPASS: str | None = Field(
         default=None,
@@ -58,6 +59,24 @@ class Settings(BaseSettings):
     GITHUB_ACTIONS_WORKFLOW_FILE: str | None = None
     GITHUB_REPO_PREFIX: str | None = None
     GITHUB_CLEANUP_ENABLED: bool | None = None
+    GITHUB_CONDITIONAL_CACHE_MAX_BYTES: int | None = None
+    GITHUB_ARTIFACT_MAX_BYTES: int | None = None
+    GITHUB_ARTIFACT_PARSE_MODE: str | None = None
+    GITHUB_ARTIFACT_PARSE_WORKERS: int | None = None
+    GITHUB_ARTIFACT_PARSE_TIMEOUT_SECONDS: float | None = None
+    GITHUB_ARTIFACT_PARSE_CPU_SECONDS: float | None = None
+    GITHUB_ARTIFACT_MAX_MEMBERS: int | None = None
+    GITHUB_ARTIFACT_MAX_UNCOMPRESSED_BYTES: int | None = None
+    GITHUB_WEBHOOK_SECRET: str | None = None
+    GITHUB_WEBHOOK_WAIT_SECONDS: float | None = None
+    GITHUB_RUN_CORRELATION_INPUT: str | None = None
+    GITHUB_ACTIONS_ASYNC_RUNS: bool | None = None
+    GITHUB_ACTIONS_POLL_INTERVAL_SECONDS: float | None = None
+    GITHUB_ACTIONS_ASYNC_SUBMIT: bool | None = None
+    GITHUB_SUBMIT_JOB_MAX_ATTEMPTS: int | None = None
+    GITHUB_ACTIONS_CACHE_BACKEND: str | None = None
+    GITHUB_ACTIONS_CACHE_RUNNING_TTL_SECONDS: float | None = None
+    GITHUB_ACTIONS_CACHE_MAX_BYTES: int | None = None
 
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     auth: AuthSettings = Field(default_factory=AuthSettings)
@@ -1,10 +1,14 @@
 from app.core.db.base import Base, TimestampMixin
 from app.repositories.candidate_sessions.models import CandidateSession
 from app.repositories.companies.models import Company
+from app.repositories.github_native.actions_cache.models import ActionsCacheEntry
+from app.repositories.github_native.workflow_runs.models import WorkflowRunResult
 from app.repositories.github_native.workspaces.models import Workspace
 from app.repositories.simulations.simulation import Simulation
+from app.repositories.submissions.diff_patch import SubmissionDiffPatch
 from app.repositories.submissions.fit_profile import FitProfile
 from app.repositories.submissions.submission import Submission
+from app.repositories.submissions.submission_job import SubmissionJob
 from app.repositories.tasks.models import Task
 from app.repositories.users.models import User
 
@@ -16,7 +20,11 @@ __all__ = [
     "Simulation",
     "Task",
     "Submission",
+    "SubmissionJob",
+    "SubmissionDiffPatch",
     "FitProfile",
     "Workspace",
+    "ActionsCacheEntry",
+    "WorkflowRunResult",
     "User",
 ]
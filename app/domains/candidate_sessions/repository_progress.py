@@ -0,0 +1 @@
+from app.repositories.candidate_sessions.repository_progress import *  # noqa: F403
@@ -0,0 +1 @@
+from app.services.candidate_sessions.progress_check import *  # noqa: F403
@@ -0,0 +1 @@
+from app.integrations.github.actions_runner.cache_backend import *  # noqa: F403
@@ -0,0 +1 @@
+from app.integrations.github.actions_runner.cache_shared import *  # noqa: F403
@@ -0,0 +1 @@
+from app.integrations.github.actions_runner.lru import *  # noqa: F403
@@ -0,0 +1 @@
+from app.integrations.github.artifacts.executor import *  # noqa: F403
@@ -0,0 +1 @@
+from app.integrations.github.artifacts.limits import *  # noqa: F403
@@ -0,0 +1 @@
+from app.integrations.github.client.conditional_cache import *  # noqa: F403
@@ -0,0 +1 @@
+from app.integrations.github.client.rate_budget import *  # noqa: F403
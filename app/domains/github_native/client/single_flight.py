@@ -0,0 +1 @@
+from app.integrations.github.client.single_flight import *  # noqa: F403
@@ -0,0 +1 @@
+from app.integrations.github.webhooks.__init__ import *  # noqa: F403
@@ -0,0 +1 @@
+from app.integrations.github.webhooks.run_events import *  # noqa: F403
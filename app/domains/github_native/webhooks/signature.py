@@ -0,0 +1 @@
+from app.integrations.github.webhooks.signature import *  # noqa: F403
@@ -0,0 +1 @@
+from app.repositories.submissions.diff_patch import *  # noqa: F403
@@ -1,6 +1,7 @@
 from app.domains.submissions.presenter.detail_presenter import present_detail
 from app.domains.submissions.presenter.links import build_diff_url, build_links
 from app.domains.submissions.presenter.list_presenter import present_list_item
+from app.domains.submissions.presenter.materialize import materialize_list_fields
 from app.domains.submissions.presenter.output import (
     max_output_chars,
     parse_diff_summary,
@@ -13,6 +14,7 @@ __all__ = [
     "build_diff_url",
     "build_links",
     "build_test_results",
+    "materialize_list_fields",
     "max_output_chars",
     "parse_diff_summary",
     "present_detail",
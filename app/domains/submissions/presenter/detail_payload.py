@@ -23,4 +23,15 @@ def build_code_payload(sub):
     }
 
 
-__all__ = ["build_task_payload", "build_code_payload"]
+def build_processing_payload(job):
+    if job is None:
+        return None
+    return {
+        "status": job.status,
+        "attempts": job.attempts,
+        "nextAttemptAt": job.next_attempt_at if job.status == "pending" else None,
+        "lastError": job.last_error,
+    }
+
+
+__all__ = ["build_task_payload", "build_code_payload", "build_processing_payload"]
@@ -3,21 +3,23 @@ from __future__ import annotations
 from app.domains.submissions import service_recruiter as recruiter_sub_service
 from app.domains.submissions.presenter.detail_payload import (
     build_code_payload,
+    build_processing_payload,
     build_task_payload,
 )
 from app.domains.submissions.presenter.links import build_diff_url, build_links
 from app.domains.submissions.presenter.output import (
+    attach_patches,
     max_output_chars,
     parse_diff_summary,
 )
 from app.domains.submissions.presenter.test_results import build_test_results
 
 
-def present_detail(sub, task, cs, _sim):
+def present_detail(sub, task, cs, _sim, job=None, patches=None):
     parsed_output = recruiter_sub_service.parse_test_output(
         getattr(sub, "test_output", None)
     )
-    diff_summary = parse_diff_summary(sub.diff_summary_json)
+    diff_summary = attach_patches(parse_diff_summary(sub.diff_summary_json), patches)
     repo_full_name = sub.code_repo_path
     commit_url, workflow_url = build_links(
         repo_full_name, sub.commit_sha, sub.workflow_run_id
@@ -42,4 +44,6 @@ def present_detail(sub, task, cs, _sim):
         "workflowUrl": workflow_url,
         "commitUrl": commit_url,
         "diffUrl": build_diff_url(repo_full_name, diff_summary),
+        "processingStatus": getattr(sub, "processing_status", None),
+        "processing": build_processing_payload(job),
     }
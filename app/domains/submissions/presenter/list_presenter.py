@@ -1,31 +1,22 @@
 from __future__ import annotations
 
-from app.domains.submissions import service_recruiter as recruiter_sub_service
 from app.domains.submissions.presenter.links import build_diff_url, build_links
-from app.domains.submissions.presenter.output import (
-    max_output_chars,
-    parse_diff_summary,
+from app.domains.submissions.presenter.materialize import (
+    materialized_diff_summary,
+    materialized_test_results,
 )
-from app.domains.submissions.presenter.test_results import build_test_results
 
 
 def present_list_item(sub, task):
-    parsed_output = recruiter_sub_service.parse_test_output(
-        getattr(sub, "test_output", None)
-    )
-    diff_summary = parse_diff_summary(sub.diff_summary_json)
+    """Project the materialized list columns; nothing is parsed per request."""
+    diff_summary = materialized_diff_summary(sub)
     repo_full_name = sub.code_repo_path
     commit_url, workflow_url = build_links(
         repo_full_name, sub.commit_sha, sub.workflow_run_id
     )
     diff_url = build_diff_url(repo_full_name, diff_summary)
-    test_results = build_test_results(
-        sub,
-        parsed_output,
-        workflow_url=workflow_url,
-        commit_url=commit_url,
-        include_output=False,
-        max_output_chars=max_output_chars(False),
+    test_results = materialized_test_results(
+        sub, workflow_url=workflow_url, commit_url=commit_url
     )
     return {
         "submissionId": sub.id,
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from app.domains.submissions import service_recruiter as recruiter_sub_service
+from app.domains.submissions.presenter.output import (
+    max_output_chars,
+    parse_diff_summary,
+)
+from app.domains.submissions.presenter.parsed_output_utils import _safe_int
+from app.domains.submissions.presenter.test_results_counts import fill_counts
+from app.domains.submissions.presenter.test_results_guard import should_skip
+from app.domains.submissions.presenter.test_results_payload import extract_payload
+from app.domains.submissions.presenter.test_results_runinfo import enrich_run_info
+
+_DIFF_FIELDS = (
+    "diff_base",
+    "diff_head",
+    "diff_files_changed",
+    "diff_additions",
+    "diff_deletions",
+)
+# Columns written by ``materialize_list_fields`` and read by the list view.
+LIST_FIELDS = (
+    "tests_passed",
+    "tests_failed",
+    "tests_total",
+    "test_status",
+    "test_run_id",
+    "test_conclusion",
+    "test_timeout",
+    "test_stdout_preview",
+    "test_stdout_truncated",
+    "test_stderr_preview",
+    "test_stderr_truncated",
+    "test_summary",
+    "test_artifact_present",
+    "test_artifact_error",
+    *_DIFF_FIELDS,
+)
+
+
+def _diff_totals(diff_summary) -> dict[str, Any]:
+    if not isinstance(diff_summary, dict):
+        return dict.fromkeys(_DIFF_FIELDS)
+    files = diff_summary.get("files")
+    files = (
+        [f for f in files if isinstance(f, dict)] if isinstance(files, list) else None
+    )
+    return {
+        "diff_base": diff_summary.get("base"),
+        "diff_head": diff_summary.get("head"),
+        "diff_files_changed": len(files) if files is not None else None,
+        "diff_additions": (
+            sum(_safe_int(f.get("additions")) or 0 for f in files)
+            if files is not None
+            else None
+        ),
+        "diff_deletions": (
+            sum(_safe_int(f.get("deletions")) or 0 for f in files)
+            if files is not None
+            else None
+        ),
+    }
+
+
+def list_fields(sub) -> dict[str, Any]:
+    """Derive the recruiter list columns from a submission's raw test/diff data.
+
+    ``sub`` only needs the stored attributes (a model or a result row), so the
+    backfill migration can reuse this.
+    """
+    parsed = recruiter_sub_service.parse_test_output(getattr(sub, "test_output", None))
+    payload = extract_payload(
+        parsed or None, include_output=False, max_output_chars=max_output_chars(False)
+    )
+    passed, failed, total = fill_counts(
+        SimpleNamespace(
+            tests_passed=getattr(sub, "tests_passed", None),
+            tests_failed=getattr(sub, "tests_failed", None),
+        ),
+        payload["passed_val"],
+        payload["failed_val"],
+        payload["total_val"],
+    )
+    status = recruiter_sub_service.derive_test_status(passed, failed, parsed or None)
+    run_id, conclusion, timeout, *_ = enrich_run_info(
+        sub, payload["run_id"], payload["conclusion"], payload["timeout"]
+    )
+    return {
+        "tests_passed": passed,
+        "tests_failed": failed,
+        "tests_total": total,
+        "test_status": status,
+        "test_run_id": str(run_id) if run_id is not None else None,
+        "test_conclusion": conclusion,
+        "test_timeout": timeout,
+        "test_stdout_preview": payload["stdout"],
+        "test_stdout_truncated": payload["stdout_truncated"],
+        "test_stderr_preview": payload["stderr"],
+        "test_stderr_truncated": payload["stderr_truncated"],
+        "test_summary": payload["summary"],
+        "test_artifact_present": True if payload["parsed_payload_present"] else None,
+        "test_artifact_error": payload["artifact_error"],
+        **_diff_totals(parse_diff_summary(getattr(sub, "diff_summary_json", None))),
+    }
+
+
+def materialize_list_fields(sub) -> None:
+    """Store the derived list columns on ``sub``; call after writing results."""
+    for field, value in list_fields(sub).items():
+        setattr(sub, field, value)
+
+
+def materialized_diff_summary(sub):
+    base = getattr(sub, "diff_base", None)
+    head = getattr(sub, "diff_head", None)
+    files_changed = getattr(sub, "diff_files_changed", None)
+    if base is None and head is None and files_changed is None:
+        return None
+    return {
+        "base": base,
+        "head": head,
+        "filesChanged": files_changed,
+        "additions": getattr(sub, "diff_additions", None),
+        "deletions": getattr(sub, "diff_deletions", None),
+    }
+
+
+def materialized_test_results(sub, *, workflow_url: str | None, commit_url: str | None):
+    status = getattr(sub, "test_status", None)
+    passed = getattr(sub, "tests_passed", None)
+    failed = getattr(sub, "tests_failed", None)
+    total = getattr(sub, "tests_total", None)
+    workflow_run_id = getattr(sub, "workflow_run_id", None)
+    commit_sha = getattr(sub, "commit_sha", None)
+    last_run_at = getattr(sub, "last_run_at", None)
+    if should_skip(
+        status, passed, failed, total, None, workflow_run_id, commit_sha, last_run_at
+    ):
+        return None
+    run_id = getattr(sub, "test_run_id", None)
+    if isinstance(run_id, str) and run_id.isdigit():
+        run_id = int(run_id)
+    artifact_present = getattr(sub, "test_artifact_present", None)
+    return {
+        "status": status,
+        "passed": passed,
+        "failed": failed,
+        "total": total,
+        "runId": run_id,
+        "runStatus": None,
+        "conclusion": getattr(sub, "test_conclusion", None),
+        "timeout": getattr(sub, "test_timeout", None),
+        "stdout": getattr(sub, "test_stdout_preview", None),
+        "stderr": getattr(sub, "test_stderr_preview", None),
+        "stdoutTruncated": getattr(sub, "test_stdout_truncated", None),
+        "stderrTruncated": getattr(sub, "test_stderr_truncated", None),
+        "summary": getattr(sub, "test_summary", None),
+        "lastRunAt": last_run_at,
+        "workflowRunId": str(workflow_run_id) if workflow_run_id is not None else None,
+        "commitSha": commit_sha,
+        "workflowUrl": workflow_url,
+        "commitUrl": commit_url,
+        "artifactName": "tenon-test-results" if artifact_present else None,
+        "artifactPresent": artifact_present,
+        "artifactErrorCode": getattr(sub, "test_artifact_error", None),
+    }
@@ -17,5 +17,21 @@ def parse_diff_summary(raw: str | None):
         return None
 
 
+def attach_patches(diff_summary, patches: dict[str, str] | None):
+    """Merge separately stored patches back into the summary's file entries."""
+    if not patches or not isinstance(diff_summary, dict):
+        return diff_summary
+    files = diff_summary.get("files")
+    if not isinstance(files, list):
+        return diff_summary
+    merged = [
+        {**f, "patch": patches[f["filename"]]}
+        if isinstance(f, dict) and f.get("filename") in patches
+        else f
+        for f in files
+    ]
+    return {**diff_summary, "files": merged}
+
+
 def max_output_chars(include_output: bool) -> int:
     return MAX_OUTPUT_CHARS_DETAIL if include_output else MAX_OUTPUT_CHARS_LIST
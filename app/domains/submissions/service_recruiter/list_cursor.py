@@ -0,0 +1 @@
+from app.services.submissions.service_recruiter.list_cursor import *  # noqa: F403
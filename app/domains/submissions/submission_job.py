@@ -0,0 +1 @@
+from app.repositories.submissions.submission_job import *  # noqa: F403
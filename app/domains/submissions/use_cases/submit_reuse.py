@@ -0,0 +1 @@
+from app.services.submissions.use_cases.submit_reuse import *  # noqa: F403
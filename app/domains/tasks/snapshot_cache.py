@@ -0,0 +1 @@
+from app.repositories.tasks.snapshot_cache import *  # noqa: F403
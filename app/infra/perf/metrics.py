@@ -0,0 +1 @@
+from app.core.perf.metrics import *  # noqa: F403
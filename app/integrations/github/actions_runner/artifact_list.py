@@ -8,8 +8,8 @@ async def list_artifacts_with_cache(
     client: GithubClient, cache, repo_full_name: str, run_id: int
 ):
     cache_key = run_cache_key(repo_full_name, run_id)
-    artifacts = cache.artifact_list_cache.get(cache_key)
+    artifacts = await cache.load_artifact_list(cache_key)
     if artifacts is None:
         artifacts = await client.list_artifacts(repo_full_name, run_id)
-        cache.cache_artifact_list(cache_key, artifacts)
+        await cache.store_artifact_list(cache_key, artifacts)
     return artifacts
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+from functools import partial
+
 from app.integrations.github.actions_runner.cache import ActionsCache
 from app.integrations.github.artifacts import (
+    ArtifactParseTimeout,
+    ArtifactRejected,
     ParsedTestResults,
+    parse_executor_for,
     parse_test_results_zip,
 )
-from app.integrations.github.client import GithubClient, GithubError
+from app.integrations.github.artifacts.junit_parser import MAX_FAILURE_DETAILS
+from app.integrations.github.client import (
+    GithubArtifactTooLarge,
+    GithubClient,
+    GithubError,
+)
 
 
 async def parse_first_artifact(
@@ -23,21 +33,37 @@ async def parse_first_artifact(
             continue
         found = True
         cache_key = (repo_full_name, run_id, int(artifact_id))
-        cached = cache.artifact_cache.get(cache_key)
+        cached = await cache.load_artifact_result(cache_key)
         if cached:
             parsed_cached, cached_error = cached
             if parsed_cached or cached_error:
                 return parsed_cached, cached_error
         try:
-            content = await client.download_artifact_zip(
+            spool = await client.download_artifact_file(
                 repo_full_name, int(artifact_id)
             )
+        except GithubArtifactTooLarge:
+            last_error = "artifact_too_large"
+            await cache.store_artifact_result(cache_key, None, last_error)
+            continue
         except GithubError:
             last_error = "artifact_download_failed"
             continue
-        parsed = parse_test_results_zip(content)
+        try:
+            # The executor closes the spool once its worker is done with it.
+            parsed = await parse_executor_for(client).run(
+                partial(parse_test_results_zip, max_failures=MAX_FAILURE_DETAILS),
+                spool,
+            )
+        except ArtifactRejected:
+            last_error = "artifact_rejected"
+            await cache.store_artifact_result(cache_key, None, last_error)
+            continue
+        except ArtifactParseTimeout:
+            last_error = "artifact_parse_timeout"
+            continue
         error = None if parsed else "artifact_corrupt"
-        cache.cache_artifact_result(cache_key, parsed, error)
+        await cache.store_artifact_result(cache_key, parsed, error)
         if parsed:
             return parsed, None
         last_error = error
@@ -3,21 +3,82 @@ from __future__ import annotations
 from collections import OrderedDict
 
 from app.integrations.github.actions_runner.cache_artifacts import ArtifactCacheMixin
+from app.integrations.github.actions_runner.cache_backend import ActionsCacheBackend
 from app.integrations.github.actions_runner.cache_runs import RunCacheMixin
-from app.integrations.github.actions_runner.models import ActionsRunResult
-from app.integrations.github.artifacts import ParsedTestResults
-
-
-class ActionsCache(RunCacheMixin, ArtifactCacheMixin):
-    """Shared cache for run results and artifacts with simple LRU eviction."""
-
-    def __init__(self, max_entries: int = 128) -> None:
-        self.max_entries = max_entries
-        self.run_cache: OrderedDict[tuple[str, int], ActionsRunResult] = OrderedDict()
-        self.artifact_cache: OrderedDict[
-            tuple[str, int, int], tuple[ParsedTestResults | None, str | None]
-        ] = OrderedDict()
-        self.artifact_list_cache: OrderedDict[
-            tuple[str, int], list[dict]
-        ] = OrderedDict()
+from app.integrations.github.actions_runner.cache_shared import SharedCacheMixin
+from app.integrations.github.actions_runner.lru import SizedLRU
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_RUNNING_TTL_SECONDS = 5.0
+DEFAULT_STALE_RUNNING_TTL_SECONDS = 15 * 60.0
+DEFAULT_TERMINAL_TTL_SECONDS = 24 * 60 * 60.0
+
+
+class ActionsCache(RunCacheMixin, ArtifactCacheMixin, SharedCacheMixin):
+    """Shared cache for run results and artifacts.
+
+    Each map is an LRU bounded by ``max_entries`` and ``max_bytes`` of
+    estimated payload. Terminal runs and artifacts live for
+    ``terminal_ttl_seconds``; in-progress runs are dropped after
+    ``stale_running_ttl_seconds`` without a refresh. ``backend`` optionally
+    mirrors entries to storage shared across workers, where in-progress
+    results are reusable for ``running_ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backend: ActionsCacheBackend | None = None,
+        running_ttl_seconds: float = DEFAULT_RUNNING_TTL_SECONDS,
+        stale_running_ttl_seconds: float = DEFAULT_STALE_RUNNING_TTL_SECONDS,
+        terminal_ttl_seconds: float = DEFAULT_TERMINAL_TTL_SECONDS,
+    ) -> None:
+        self.backend = backend
+        self.running_ttl_seconds = running_ttl_seconds
+        self.stale_running_ttl_seconds = stale_running_ttl_seconds
+        self.terminal_ttl_seconds = terminal_ttl_seconds
+        self.run_cache = SizedLRU(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            on_evict=self._on_run_evicted,
+        )
+        self.artifact_cache = SizedLRU(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            on_evict=self._on_artifact_evicted,
+        )
+        self.artifact_list_cache = SizedLRU(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            on_evict=self._on_artifact_list_evicted,
+        )
+        self.artifact_keys_by_run: dict[tuple[str, int], set[tuple[str, int, int]]] = {}
         self.poll_attempts: dict[tuple[str, int], int] = {}
+        self.correlated_runs: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        # Repo or template repo -> workflow file that last dispatched there.
+        self.workflow_files: OrderedDict[str, str] = OrderedDict()
+        self._max_entries = max_entries
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int) -> None:
+        self._max_entries = value
+        for lru in (self.run_cache, self.artifact_cache, self.artifact_list_cache):
+            lru.max_entries = value
+
+    def stats(self) -> dict[str, object]:
+        maps = {
+            "runs": self.run_cache.stats(),
+            "artifacts": self.artifact_cache.stats(),
+            "artifactLists": self.artifact_list_cache.stats(),
+        }
+        totals = {
+            name: sum(stats[name] for stats in maps.values())
+            for name in ("entries", "bytes", "hits", "misses", "evictions")
+        }
+        return {**totals, **maps, "pollAttempts": len(self.poll_attempts)}
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from app.integrations.github.actions_runner.lru import SizedLRU
 from app.integrations.github.artifacts import ParsedTestResults
 
 
 class ArtifactCacheMixin:
     """Cache helpers for artifact lists and parsed content."""
 
-    artifact_cache: dict
-    artifact_list_cache: dict
-    max_entries: int
+    artifact_cache: SizedLRU
+    artifact_list_cache: SizedLRU
+    terminal_ttl_seconds: float
+    # (repo, run_id) -> artifact_cache keys, so a run's entries drop in O(1).
+    artifact_keys_by_run: dict[tuple[str, int], set[tuple[str, int, int]]]
 
     def cache_artifact_result(
         self,
@@ -16,20 +19,30 @@ class ArtifactCacheMixin:
         parsed: ParsedTestResults | None,
         error: str | None,
     ) -> None:
-        self.artifact_cache[key] = (parsed, error)
-        self.artifact_cache.move_to_end(key)
-        if len(self.artifact_cache) > self.max_entries:
-            self.artifact_cache.popitem(last=False)
+        self.artifact_cache.put(
+            key, (parsed, error), ttl_seconds=self.terminal_ttl_seconds
+        )
+        if key in self.artifact_cache:
+            self.artifact_keys_by_run.setdefault(key[:2], set()).add(key)
 
     def cache_artifact_list(self, key: tuple[str, int], artifacts: list[dict]) -> None:
-        self.artifact_list_cache[key] = artifacts
-        self.artifact_list_cache.move_to_end(key)
-        if len(self.artifact_list_cache) > self.max_entries:
-            evicted, _ = self.artifact_list_cache.popitem(last=False)
-            to_remove = [
-                cache_key
-                for cache_key in list(self.artifact_cache)
-                if cache_key[0] == evicted[0] and cache_key[1] == evicted[1]
-            ]
-            for cache_key in to_remove:
-                self.artifact_cache.pop(cache_key, None)
+        self.artifact_list_cache.put(
+            key, artifacts, ttl_seconds=self.terminal_ttl_seconds
+        )
+
+    def drop_run_artifacts(self, key: tuple[str, int]) -> None:
+        """Forget the artifact list and every parsed artifact of one run."""
+        self.artifact_list_cache.pop(key, None)
+        for artifact_key in self.artifact_keys_by_run.pop(key, ()):
+            self.artifact_cache.pop(artifact_key, None)
+
+    def _on_artifact_evicted(self, key: tuple[str, int, int], _value) -> None:
+        keys = self.artifact_keys_by_run.get(key[:2])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                self.artifact_keys_by_run.pop(key[:2], None)
+
+    def _on_artifact_list_evicted(self, key: tuple[str, int], _value) -> None:
+        for artifact_key in self.artifact_keys_by_run.pop(key, ()):
+            self.artifact_cache.pop(artifact_key, None)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+
+class ActionsCacheBackend(Protocol):
+    """Shared storage behind ``ActionsCache`` for JSON-compatible values."""
+
+    async def get(self, key: str) -> dict[str, Any] | None: ...
+
+    async def set(
+        self, key: str, value: dict[str, Any], *, ttl_seconds: float | None
+    ) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+    async def delete_prefix(self, prefix: str) -> None: ...
+
+
+class InMemoryActionsCacheBackend:
+    """Process-local backend with per-entry TTLs and LRU eviction."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float | None]] = (
+            OrderedDict()
+        )
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(
+        self, key: str, value: dict[str, Any], *, ttl_seconds: float | None
+    ) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            self._entries.pop(key, None)
@@ -1,24 +1,54 @@
 from __future__ import annotations
 
+from app.integrations.github.actions_runner.lru import SizedLRU
 from app.integrations.github.actions_runner.models import ActionsRunResult
 
 
 class RunCacheMixin:
     """Cache helpers for workflow run results."""
 
-    run_cache: dict
+    run_cache: SizedLRU
     poll_attempts: dict
+    correlated_runs: dict
+    workflow_files: dict
     max_entries: int
+    stale_running_ttl_seconds: float
+    terminal_ttl_seconds: float
 
     def cache_run(self, key: tuple[str, int], result: ActionsRunResult) -> None:
-        self.run_cache[key] = result
-        self.run_cache.move_to_end(key)
-        if len(self.run_cache) > self.max_entries:
-            evicted, _ = self.run_cache.popitem(last=False)
-            self.poll_attempts.pop(evicted, None)
-        if self.is_terminal(result):
+        terminal = self.is_terminal(result)
+        self.run_cache.put(
+            key,
+            result,
+            ttl_seconds=(
+                self.terminal_ttl_seconds
+                if terminal
+                else self.stale_running_ttl_seconds
+            ),
+        )
+        if terminal:
             self.poll_attempts.pop(key, None)
 
+    def _on_run_evicted(self, key: tuple[str, int], _result) -> None:
+        self.poll_attempts.pop(key, None)
+
+    def cache_correlation(self, correlation_id: str, key: tuple[str, int]) -> None:
+        self.correlated_runs[correlation_id] = key
+        self.correlated_runs.move_to_end(correlation_id)
+        if len(self.correlated_runs) > self.max_entries:
+            self.correlated_runs.popitem(last=False)
+
+    def cache_workflow_file(self, repo_full_name: str, workflow_file: str) -> None:
+        self.workflow_files[repo_full_name] = workflow_file
+        self.workflow_files.move_to_end(repo_full_name)
+        if len(self.workflow_files) > self.max_entries:
+            self.workflow_files.popitem(last=False)
+
+    def workflow_file_for(self, repo_full_name: str | None) -> str | None:
+        if not repo_full_name:
+            return None
+        return self.workflow_files.get(repo_full_name)
+
     @staticmethod
     def is_terminal(result: ActionsRunResult) -> bool:
         if result.conclusion:
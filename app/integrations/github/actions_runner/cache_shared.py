@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from app.integrations.github.actions_runner.cache_backend import ActionsCacheBackend
+from app.integrations.github.actions_runner.lru import SizedLRU
+from app.integrations.github.actions_runner.models import ActionsRunResult
+from app.integrations.github.artifacts import ParsedTestResults
+
+
+def _run_key(key: tuple[str, int]) -> str:
+    return f"run:{key[0]}:{key[1]}"
+
+
+def _attempts_key(key: tuple[str, int]) -> str:
+    return f"attempts:{key[0]}:{key[1]}"
+
+
+def _artifact_list_key(key: tuple[str, int]) -> str:
+    return f"artifacts:{key[0]}:{key[1]}"
+
+
+def _artifact_prefix(key: tuple[str, int]) -> str:
+    return f"artifact:{key[0]}:{key[1]}:"
+
+
+class SharedCacheMixin:
+    """Async read-through/write-through layer over an optional shared backend.
+
+    The in-process dictionaries stay the first lookup; the backend lets
+    several workers reuse each other's run results, artifact lists, parsed
+    artifacts and poll backoff state.
+    """
+
+    backend: ActionsCacheBackend | None
+    running_ttl_seconds: float
+    terminal_ttl_seconds: float
+    run_cache: SizedLRU
+    artifact_cache: SizedLRU
+    artifact_list_cache: SizedLRU
+    poll_attempts: dict
+
+    async def load_run(self, key: tuple[str, int]) -> ActionsRunResult | None:
+        """Return a result that can be served without asking GitHub.
+
+        Terminal results are always reusable; a running result is only
+        reusable while its shared entry is within ``running_ttl_seconds``.
+        """
+        cached = self.run_cache.get(key)
+        if cached is not None and self.is_terminal(cached):
+            return cached
+        if self.backend is None:
+            return None
+        stored = await self.backend.get(_run_key(key))
+        if stored is None:
+            return None
+        result = ActionsRunResult(**stored)
+        if self.is_terminal(result):
+            self.cache_run(key, result)
+        return result
+
+    async def store_run(self, key: tuple[str, int], result: ActionsRunResult) -> None:
+        self.cache_run(key, result)
+        if self.backend is None:
+            return
+        if self.is_terminal(result):
+            await self.backend.set(
+                _run_key(key), asdict(result), ttl_seconds=self.terminal_ttl_seconds
+            )
+            await self.backend.delete(_attempts_key(key))
+            return
+        await self.backend.set(
+            _run_key(key), asdict(result), ttl_seconds=self.running_ttl_seconds
+        )
+        if key in self.poll_attempts:
+            await self.backend.set(
+                _attempts_key(key),
+                {"attempts": self.poll_attempts[key]},
+                ttl_seconds=self.terminal_ttl_seconds,
+            )
+
+    async def load_poll_attempts(self, key: tuple[str, int]) -> None:
+        """Adopt the highest poll attempt count recorded by any worker."""
+        if self.backend is None:
+            return
+        stored = await self.backend.get(_attempts_key(key))
+        if stored:
+            self.poll_attempts[key] = max(
+                self.poll_attempts.get(key, 0), int(stored["attempts"])
+            )
+
+    async def invalidate_on_completion(self, key: tuple[str, int]) -> None:
+        """Drop artifact state cached while the run was still in progress."""
+        previous = self.run_cache.get(key)
+        if previous is None and self.backend is not None:
+            stored = await self.backend.get(_run_key(key))
+            previous = ActionsRunResult(**stored) if stored else None
+        if previous is None or self.is_terminal(previous):
+            return
+        self.drop_run_artifacts(key)
+        if self.backend is not None:
+            await self.backend.delete(_artifact_list_key(key))
+            await self.backend.delete_prefix(_artifact_prefix(key))
+
+    async def load_artifact_list(self, key: tuple[str, int]) -> list[dict] | None:
+        artifacts = self.artifact_list_cache.get(key)
+        if artifacts is not None or self.backend is None:
+            return artifacts
+        stored = await self.backend.get(_artifact_list_key(key))
+        if stored is None:
+            return None
+        artifacts = stored["artifacts"]
+        self.cache_artifact_list(key, artifacts)
+        return artifacts
+
+    async def store_artifact_list(
+        self, key: tuple[str, int], artifacts: list[dict]
+    ) -> None:
+        if not artifacts:
+            # Uploads land at the end of a run; an empty list is not final.
+            return
+        self.cache_artifact_list(key, artifacts)
+        if self.backend is not None:
+            await self.backend.set(
+                _artifact_list_key(key),
+                {"artifacts": artifacts},
+                ttl_seconds=self.terminal_ttl_seconds,
+            )
+
+    async def load_artifact_result(
+        self, key: tuple[str, int, int]
+    ) -> tuple[ParsedTestResults | None, str | None] | None:
+        cached = self.artifact_cache.get(key)
+        if cached is not None or self.backend is None:
+            return cached
+        stored = await self.backend.get(f"{_artifact_prefix(key[:2])}{key[2]}")
+        if stored is None:
+            return None
+        parsed = stored.get("parsed")
+        entry = (
+            ParsedTestResults(**parsed) if parsed else None,
+            stored.get("error"),
+        )
+        self.cache_artifact_result(key, *entry)
+        return entry
+
+    async def store_artifact_result(
+        self,
+        key: tuple[str, int, int],
+        parsed: ParsedTestResults | None,
+        error: str | None,
+    ) -> None:
+        self.cache_artifact_result(key, parsed, error)
+        if self.backend is not None:
+            await self.backend.set(
+                f"{_artifact_prefix(key[:2])}{key[2]}",
+                {"parsed": asdict(parsed) if parsed else None, "error": error},
+                ttl_seconds=self.terminal_ttl_seconds,
+            )
@@ -16,7 +16,13 @@ async def dispatch_with_fallbacks(
     ref: str,
     inputs: dict[str, Any] | None,
     preferred_workflow: str,
+    correlation_input: str | None = None,
+    correlation_id: str | None = None,
 ) -> str:
+    if correlation_input and correlation_id:
+        # The workflow surfaces this input in its run-name so the run can be
+        # matched exactly instead of by creation time.
+        inputs = {**(inputs or {}), correlation_input: correlation_id}
     errors: list[tuple[str, GithubError]] = []
     tried: list[str] = []
     for wf in workflow_fallbacks:
@@ -27,7 +33,7 @@ async def dispatch_with_fallbacks(
             await client.trigger_workflow_dispatch(
                 repo_full_name, wf, ref=ref, inputs=inputs
             )
-            if wf != preferred_workflow:
+            if len(tried) > 1:
                 logger.warning(
                     "github_workflow_dispatch_fallback",
                     extra={
@@ -8,25 +8,110 @@ from app.integrations.github.actions_runner.backoff import apply_backoff
 from app.integrations.github.actions_runner.normalize import normalize_run
 from app.integrations.github.actions_runner.result_builder import build_result
 from app.integrations.github.actions_runner.runner_types import RunnerContext
-from app.integrations.github.actions_runner.runs import is_dispatched_run, run_cache_key
-from app.integrations.github.client import GithubError
+from app.integrations.github.actions_runner.runs import (
+    dispatched_since,
+    is_correlated_run,
+    is_dispatched_run,
+    new_correlation_id,
+    run_cache_key,
+)
+from app.integrations.github.client import GithubError, WorkflowRun
+from app.integrations.github.webhooks.run_events import is_completed
+
+# Upper bound on waiting for a dispatched run to show up (not to finish).
+RESOLVE_MAX_SECONDS = 30.0
+
+
+async def _find_dispatched_run(
+    ctx: RunnerContext,
+    repo_full_name: str,
+    workflow_file: str,
+    *,
+    ref: str,
+    dispatch_started_at: datetime,
+    correlation_id: str | None,
+) -> WorkflowRun | None:
+    if correlation_id is None:
+        runs = await ctx.client.list_workflow_runs(
+            repo_full_name, workflow_file, branch=ref, per_page=5
+        )
+        return next(
+            (run for run in runs if is_dispatched_run(run, dispatch_started_at)), None
+        )
+    resolved = ctx.cache.correlated_runs.get(correlation_id)
+    if resolved is not None:
+        return await ctx.client.get_workflow_run(repo_full_name, resolved[1])
+    runs = await ctx.client.list_workflow_runs(
+        repo_full_name,
+        workflow_file,
+        branch=ref,
+        per_page=5,
+        event="workflow_dispatch",
+        created=dispatched_since(dispatch_started_at),
+    )
+    run = next((run for run in runs if is_correlated_run(run, correlation_id)), None)
+    if run is not None:
+        ctx.cache.cache_correlation(
+            correlation_id, run_cache_key(repo_full_name, run.id)
+        )
+    return run
+
+
+async def _store_dispatched(
+    ctx: RunnerContext, cache_key: tuple[str, int], result: Any, workflow_file: str
+) -> Any:
+    result.workflow_file = workflow_file
+    await ctx.cache.store_run(cache_key, result)
+    return result
 
 
 async def dispatch_and_wait(
-    ctx: RunnerContext, *, repo_full_name: str, ref: str, inputs: dict[str, Any] | None
+    ctx: RunnerContext,
+    *,
+    repo_full_name: str,
+    ref: str,
+    inputs: dict[str, Any] | None,
+    workflow_hints: tuple[str | None, str | None] = (None, None),
 ) -> Any:
     dispatch_started_at = datetime.now(UTC)
+    correlation_id = new_correlation_id() if ctx.correlation_input else None
     workflow_file = await ctx._dispatch_with_fallbacks(
-        repo_full_name, ref=ref, inputs=inputs
+        repo_full_name,
+        ref=ref,
+        inputs=inputs,
+        correlation_id=correlation_id,
+        workflow_hints=workflow_hints,
     )
     deadline = asyncio.get_event_loop().time() + ctx.max_poll_seconds
     candidate_run = None
-    while asyncio.get_event_loop().time() < deadline:
-        runs = await ctx.client.list_workflow_runs(
-            repo_full_name, workflow_file, branch=ref, per_page=5
+    run_events = getattr(ctx.client, "run_events", None)
+    if run_events is not None:
+        candidate_run = await run_events.wait_for_run(
+            repo_full_name,
+            workflow_file=workflow_file,
+            branch=ref,
+            match=(
+                (lambda run: is_correlated_run(run, correlation_id))
+                if correlation_id
+                else (lambda run: is_dispatched_run(run, dispatch_started_at))
+            ),
+            timeout=ctx.max_poll_seconds,
         )
-        candidate_run = next(
-            (run for run in runs if is_dispatched_run(run, dispatch_started_at)), None
+        if candidate_run and is_completed(candidate_run):
+            cache_key = run_cache_key(repo_full_name, candidate_run.id)
+            result = await build_result(ctx, repo_full_name, candidate_run)
+            return await _store_dispatched(ctx, cache_key, result, workflow_file)
+        if candidate_run:
+            # Webhooks are flowing for this run; it just has not finished yet.
+            deadline = asyncio.get_event_loop().time()
+    while asyncio.get_event_loop().time() < deadline:
+        candidate_run = await _find_dispatched_run(
+            ctx,
+            repo_full_name,
+            workflow_file,
+            ref=ref,
+            dispatch_started_at=dispatch_started_at,
+            correlation_id=correlation_id,
         )
         if candidate_run:
             status = (candidate_run.status or "").lower()
@@ -38,13 +123,52 @@ async def dispatch_and_wait(
             if conclusion or status == "completed":
                 cache_key = run_cache_key(repo_full_name, candidate_run.id)
                 result = await build_result(ctx, repo_full_name, candidate_run)
-                ctx.cache.cache_run(cache_key, result)
-                return result
+                return await _store_dispatched(ctx, cache_key, result, workflow_file)
         await asyncio.sleep(ctx.poll_interval_seconds)
     if candidate_run:
         cache_key = run_cache_key(repo_full_name, candidate_run.id)
         result = normalize_run(candidate_run, running=True)
         apply_backoff(ctx.cache, cache_key, result, ctx.poll_interval_seconds)
-        ctx.cache.cache_run(cache_key, result)
-        return result
+        return await _store_dispatched(ctx, cache_key, result, workflow_file)
+    raise GithubError("No workflow run found after dispatch")
+
+
+async def dispatch_and_resolve(
+    ctx: RunnerContext,
+    *,
+    repo_full_name: str,
+    ref: str,
+    inputs: dict[str, Any] | None,
+    workflow_hints: tuple[str | None, str | None] = (None, None),
+) -> Any:
+    """Dispatch and return as soon as the run exists, without awaiting completion."""
+    dispatch_started_at = datetime.now(UTC)
+    correlation_id = new_correlation_id() if ctx.correlation_input else None
+    workflow_file = await ctx._dispatch_with_fallbacks(
+        repo_full_name,
+        ref=ref,
+        inputs=inputs,
+        correlation_id=correlation_id,
+        workflow_hints=workflow_hints,
+    )
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + min(ctx.max_poll_seconds, RESOLVE_MAX_SECONDS)
+    while loop.time() < deadline:
+        run = await _find_dispatched_run(
+            ctx,
+            repo_full_name,
+            workflow_file,
+            ref=ref,
+            dispatch_started_at=dispatch_started_at,
+            correlation_id=correlation_id,
+        )
+        if run is not None:
+            cache_key = run_cache_key(repo_full_name, run.id)
+            if is_completed(run):
+                result = await build_result(ctx, repo_full_name, run)
+            else:
+                result = normalize_run(run, running=True)
+                apply_backoff(ctx.cache, cache_key, result, ctx.poll_interval_seconds)
+            return await _store_dispatched(ctx, cache_key, result, workflow_file)
+        await asyncio.sleep(ctx.poll_interval_seconds)
     raise GithubError("No workflow run found after dispatch")
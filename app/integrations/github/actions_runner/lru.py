@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any
+
+# Fixed per-entry overhead so tiny values still count towards the budget.
+ENTRY_OVERHEAD_BYTES = 128
+
+
+def estimate_size(value: Any) -> int:
+    """Rough byte size of a cached value, dominated by its strings."""
+    if value is None or isinstance(value, bool | int | float):
+        return 8
+    if isinstance(value, str | bytes):
+        return len(value)
+    if isinstance(value, dict):
+        return 64 + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, list | tuple | set):
+        return 56 + sum(estimate_size(item) for item in value)
+    if is_dataclass(value):
+        return 56 + sum(
+            estimate_size(getattr(value, item.name)) for item in fields(value)
+        )
+    return sys.getsizeof(value)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float | None
+
+
+class SizedLRU:
+    """LRU map bounded by entry count and estimated bytes, with per-entry TTLs.
+
+    Supports the read side of a mapping (``get``, ``in``, ``[]``, ``len``,
+    iteration) so callers can treat it like the dicts it replaces; writes go
+    through ``put``/``pop``. ``on_evict`` runs for every entry dropped by
+    eviction, expiry or ``pop``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        max_bytes: int,
+        on_evict: Callable[[Hashable, Any], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._on_evict = on_evict
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+
+    def _live(self, key: Hashable) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            return None
+        return entry
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._live(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def __getitem__(self, key: Hashable) -> Any:
+        entry = self._live(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry.value
+
+    def __contains__(self, key: object) -> bool:
+        return self._live(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._entries))
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        *,
+        ttl_seconds: float | None,
+        size: int | None = None,
+    ) -> None:
+        if key in self._entries:
+            self._remove(key, notify=False)
+        entry_size = (estimate_size(value) if size is None else size) + (
+            ENTRY_OVERHEAD_BYTES
+        )
+        expires_at = self._clock() + ttl_seconds if ttl_seconds else None
+        self._entries[key] = _Entry(value, entry_size, expires_at)
+        self.bytes_held += entry_size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self.bytes_held > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        self._remove(key)
+        return entry.value
+
+    def _remove(self, key: Hashable, *, notify: bool = True) -> None:
+        entry = self._entries.pop(key)
+        self.bytes_held -= entry.size
+        if notify and self._on_evict is not None:
+            self._on_evict(key, entry.value)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes_held,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -5,6 +5,12 @@ from typing import Any, Literal
 
 RunStatus = Literal["passed", "failed", "running", "error"]
 
+# Artifact failures a later fetch can clear: network errors, lane shedding
+# (GithubRateLimited surfaces as a failed download) and parser timeouts.
+TRANSIENT_ARTIFACT_ERRORS = frozenset(
+    {"artifact_download_failed", "artifact_parse_timeout", "artifact_unavailable"}
+)
+
 
 @dataclass
 class ActionsRunResult:
@@ -22,6 +28,19 @@ class ActionsRunResult:
     html_url: str | None
     raw: dict[str, Any] | None = None
     poll_after_ms: int | None = None
+    # Workflow file that accepted the dispatch, for callers to remember.
+    workflow_file: str | None = None
+
+    @property
+    def is_settled(self) -> bool:
+        """True once fetching the run again cannot produce a different result."""
+        if self.status == "running":
+            return False
+        if self.status == "error":
+            return (self.raw or {}).get("artifact_error") not in (
+                TRANSIENT_ARTIFACT_ERRORS
+            )
+        return True
 
     @property
     def as_test_output(self) -> dict[str, Any]:
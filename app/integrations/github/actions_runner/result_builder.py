@@ -6,11 +6,17 @@ from app.integrations.github.actions_runner.models import ActionsRunResult
 from app.integrations.github.actions_runner.normalize import normalize_run
 from app.integrations.github.actions_runner.runner_types import RunnerContext
 from app.integrations.github.actions_runner.runs import run_cache_key
+from app.integrations.github.webhooks.run_events import is_completed
 
 
 async def build_result(
     ctx: RunnerContext, repo_full_name: str, run
 ) -> ActionsRunResult:
+    cache_key = run_cache_key(repo_full_name, run.id)
+    if is_completed(run):
+        await ctx.cache.invalidate_on_completion(cache_key)
+    else:
+        await ctx.cache.load_poll_attempts(cache_key)
     base = normalize_run(run)
     parse_fn = getattr(ctx, "_parse_artifacts", None)
     parsed, artifact_error = await (
@@ -34,6 +40,5 @@ async def build_result(
             base.stderr
             or "Test results artifact missing or unreadable. Please re-run tests."
         )
-    cache_key = run_cache_key(repo_full_name, run.id)
     apply_backoff(ctx.cache, cache_key, base, ctx.poll_interval_seconds)
     return base
@@ -4,16 +4,20 @@ from app.integrations.github.actions_runner.models import ActionsRunResult
 from app.integrations.github.actions_runner.result_builder import build_result
 from app.integrations.github.actions_runner.runner_types import RunnerContext
 from app.integrations.github.actions_runner.runs import run_cache_key
+from app.integrations.github.webhooks.run_events import is_completed
 
 
 async def fetch_run_result(
     ctx: RunnerContext, *, repo_full_name: str, run_id: int
 ) -> ActionsRunResult:
     cache_key = run_cache_key(repo_full_name, run_id)
-    cached = ctx.cache.run_cache.get(cache_key)
-    if cached and ctx.cache.is_terminal(cached):
+    cached = await ctx.cache.load_run(cache_key)
+    if cached is not None:
         return cached
-    run = await ctx.client.get_workflow_run(repo_full_name, run_id)
+    run_events = getattr(ctx.client, "run_events", None)
+    run = run_events.get(repo_full_name, run_id) if run_events else None
+    if run is None or not is_completed(run):
+        run = await ctx.client.get_workflow_run(repo_full_name, run_id)
     result = await build_result(ctx, repo_full_name, run)
-    ctx.cache.cache_run(cache_key, result)
+    await ctx.cache.store_run(cache_key, result)
     return result
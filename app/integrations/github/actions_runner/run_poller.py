@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field, replace
+
+from app.integrations.github.actions_runner.models import ActionsRunResult
+from app.integrations.github.client import github_lane
+
+logger = logging.getLogger(__name__)
+
+FetchRun = Callable[[str, int], Awaitable[ActionsRunResult]]
+
+# Runs nobody has asked about for this long are no longer polled.
+DEFAULT_IDLE_SECONDS = 60.0
+
+
+def run_phase(result: ActionsRunResult) -> str:
+    """GitHub lifecycle phase of a result: queued, in_progress or completed."""
+    if result.status != "running":
+        return "completed"
+    github_status = ((result.raw or {}).get("status") or "").lower()
+    if github_status in {"queued", "waiting", "pending", "requested"}:
+        return "queued"
+    return "in_progress"
+
+
+def run_state(result: ActionsRunResult) -> tuple:
+    """What a watcher treats as a change; backoff hints are ignored."""
+    return (
+        run_phase(result),
+        result.status,
+        result.conclusion,
+        result.passed,
+        result.failed,
+        result.total,
+    )
+
+
+@dataclass
+class _TrackedRun:
+    repo_full_name: str
+    run_id: int
+    requested_at: float
+    next_poll_at: float = 0.0
+    result: ActionsRunResult | None = None
+    waiters: list[asyncio.Future] = field(default_factory=list)
+
+
+class RunPoller:
+    """Single scheduler that polls every in-progress run on behalf of all callers.
+
+    Each tracked run is fetched at most once per interval, taken from the
+    result's ``poll_after_ms`` backoff and never shorter than
+    ``min_interval_seconds``. Callers asking between polls get the last
+    result, and callers asking when a poll is due wait for it and share it.
+    Finished runs, failed fetches and runs idle for ``idle_seconds`` stop
+    being tracked.
+    """
+
+    def __init__(
+        self,
+        fetch: FetchRun,
+        *,
+        min_interval_seconds: float = 2.0,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        concurrency: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        self.min_interval_seconds = min_interval_seconds
+        self.idle_seconds = idle_seconds
+        self.concurrency = concurrency
+        self._clock = clock
+        self._runs: dict[tuple[str, int], _TrackedRun] = {}
+        self._polling: set[tuple[str, int]] = set()
+        self._poll_tasks: set[asyncio.Task] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._task: asyncio.Task | None = None
+        self.polls = 0
+        self.shared = 0
+
+    async def get(self, repo_full_name: str, run_id: int) -> ActionsRunResult:
+        """Latest result for a run, polling GitHub only when one is due."""
+        self._bind_loop()
+        now = self._clock()
+        key = (repo_full_name, run_id)
+        tracked = self._runs.get(key)
+        if tracked is None:
+            tracked = _TrackedRun(repo_full_name, run_id, requested_at=now)
+            self._runs[key] = tracked
+        tracked.requested_at = now
+        if tracked.result is not None and now < tracked.next_poll_at:
+            self.shared += 1
+            remaining_ms = int((tracked.next_poll_at - now) * 1000)
+            return replace(tracked.result, poll_after_ms=max(remaining_ms, 1))
+        waiter = asyncio.get_running_loop().create_future()
+        tracked.waiters.append(waiter)
+        tracked.next_poll_at = min(tracked.next_poll_at, now)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wake.set()
+        return await waiter
+
+    async def watch(
+        self, repo_full_name: str, run_id: int
+    ) -> AsyncIterator[ActionsRunResult]:
+        """Yield every observation of a run until it finishes.
+
+        Observations follow the shared poll schedule, so any number of
+        watchers add no GitHub calls beyond one poll per interval.
+        """
+        while True:
+            result = await self.get(repo_full_name, run_id)
+            yield result
+            if result.status != "running":
+                return
+            delay_ms = result.poll_after_ms or self.min_interval_seconds * 1000
+            await asyncio.sleep(delay_ms / 1000)
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        # State tied to a previous event loop cannot be awaited from this one.
+        self._loop = loop
+        self._wake = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._task = None
+        self._runs.clear()
+        self._polling.clear()
+        self._poll_tasks.clear()
+
+    async def _run(self) -> None:
+        while self._runs:
+            self._wake.clear()
+            now = self._clock()
+            for key, tracked in list(self._runs.items()):
+                idle = now - tracked.requested_at > self.idle_seconds
+                if idle and not tracked.waiters and key not in self._polling:
+                    self._runs.pop(key, None)
+            if not self._runs:
+                break
+            pending = [
+                tracked
+                for key, tracked in self._runs.items()
+                if key not in self._polling
+            ]
+            for tracked in pending:
+                if tracked.next_poll_at <= now:
+                    self._polling.add((tracked.repo_full_name, tracked.run_id))
+                    task = asyncio.create_task(self._poll(tracked))
+                    self._poll_tasks.add(task)
+                    task.add_done_callback(self._poll_tasks.discard)
+            waiting = [t.next_poll_at for t in pending if t.next_poll_at > now]
+            # With nothing scheduled, sleep until a poll finishes or a caller asks.
+            timeout = min(waiting) - now if waiting else None
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+
+    async def _poll(self, tracked: _TrackedRun) -> None:
+        key = (tracked.repo_full_name, tracked.run_id)
+        try:
+            async with self._semaphore:
+                with github_lane("poll"):
+                    result = await self._fetch(tracked.repo_full_name, tracked.run_id)
+        except Exception as exc:
+            self._runs.pop(key, None)
+            logger.warning(
+                "github_run_poll_failed",
+                extra={"repo": tracked.repo_full_name, "run_id": tracked.run_id},
+            )
+            self._resolve(tracked, exc=exc)
+            return
+        finally:
+            self._polling.discard(key)
+            self._wake.set()
+        self.polls += 1
+        tracked.result = result
+        interval = max((result.poll_after_ms or 0) / 1000, self.min_interval_seconds)
+        tracked.next_poll_at = self._clock() + interval
+        if result.status != "running":
+            self._runs.pop(key, None)
+        self._resolve(tracked, result=result)
+
+    def _resolve(
+        self,
+        tracked: _TrackedRun,
+        *,
+        result: ActionsRunResult | None = None,
+        exc: Exception | None = None,
+    ) -> None:
+        waiters, tracked.waiters = tracked.waiters, []
+        # Every caller after the first is served without its own GitHub call.
+        self.shared += max(len(waiters) - 1, 0)
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if exc is not None:
+                waiter.set_exception(exc)
+            else:
+                waiter.set_result(result)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "tracked": len(self._runs),
+            "waiting": sum(len(t.waiters) for t in self._runs.values()),
+            "polls": self.polls,
+            "shared": self.shared,
+        }
+
+    async def aclose(self) -> None:
+        if self._loop is asyncio.get_running_loop():
+            tasks = [*self._poll_tasks, *([self._task] if self._task else [])]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._poll_tasks.clear()
+        for tracked in self._runs.values():
+            for waiter in tracked.waiters:
+                waiter.cancel()
+        self._runs.clear()
@@ -4,6 +4,7 @@ from app.integrations.github.actions_runner.cache import ActionsCache
 from app.integrations.github.actions_runner.legacy_accessors import (
     RunnerCompatibilityMixin,
 )
+from app.integrations.github.actions_runner.run_poller import RunPoller
 from app.integrations.github.actions_runner.runner_dispatcher import (
     DispatchRunnerMixin,
 )
@@ -23,10 +24,19 @@ class GithubActionsRunner(DispatchRunnerMixin, RunnerCompatibilityMixin):
         workflow_file: str,
         poll_interval_seconds: float = 2.0,
         max_poll_seconds: float = 120.0,
+        correlation_input: str | None = None,
+        cache: ActionsCache | None = None,
     ):
         self.client = client
         self.workflow_file = workflow_file
         self.poll_interval_seconds = poll_interval_seconds
         self.max_poll_seconds = max_poll_seconds
-        self.cache = ActionsCache()
+        self.correlation_input = correlation_input or None
+        self.cache = cache or ActionsCache()
         self._workflow_fallbacks = build_workflow_fallbacks(workflow_file)
+        self.run_poller = RunPoller(
+            lambda repo_full_name, run_id: self.fetch_run_result(
+                repo_full_name=repo_full_name, run_id=run_id
+            ),
+            min_interval_seconds=poll_interval_seconds,
+        )
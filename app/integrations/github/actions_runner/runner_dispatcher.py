@@ -3,18 +3,49 @@ from __future__ import annotations
 from typing import Any
 
 from app.integrations.github.actions_runner.dispatch import dispatch_with_fallbacks
-from app.integrations.github.actions_runner.dispatch_loop import dispatch_and_wait
+from app.integrations.github.actions_runner.dispatch_loop import (
+    dispatch_and_resolve,
+    dispatch_and_wait,
+)
 from app.integrations.github.actions_runner.run_fetcher import fetch_run_result
+from app.integrations.github.actions_runner.workflow_fallbacks import prefer_workflows
 
 
 class DispatchRunnerMixin:
     """Async helpers for dispatching and fetching workflow runs."""
 
     async def dispatch_and_wait(
-        self, *, repo_full_name: str, ref: str, inputs: dict[str, Any] | None = None
+        self,
+        *,
+        repo_full_name: str,
+        ref: str,
+        inputs: dict[str, Any] | None = None,
+        workflow_file: str | None = None,
+        template_repo_full_name: str | None = None,
     ):
         return await dispatch_and_wait(
-            self, repo_full_name=repo_full_name, ref=ref, inputs=inputs
+            self,
+            repo_full_name=repo_full_name,
+            ref=ref,
+            inputs=inputs,
+            workflow_hints=(workflow_file, template_repo_full_name),
+        )
+
+    async def dispatch_run(
+        self,
+        *,
+        repo_full_name: str,
+        ref: str,
+        inputs: dict[str, Any] | None = None,
+        workflow_file: str | None = None,
+        template_repo_full_name: str | None = None,
+    ):
+        return await dispatch_and_resolve(
+            self,
+            repo_full_name=repo_full_name,
+            ref=ref,
+            inputs=inputs,
+            workflow_hints=(workflow_file, template_repo_full_name),
         )
 
     async def fetch_run_result(self, *, repo_full_name: str, run_id: int):
@@ -22,14 +53,45 @@ class DispatchRunnerMixin:
             self, repo_full_name=repo_full_name, run_id=run_id
         )
 
+    async def poll_run_result(self, *, repo_full_name: str, run_id: int):
+        """Run result through the shared poller, so callers share GitHub calls."""
+        return await self.run_poller.get(repo_full_name, run_id)
+
+    def watch_run(self, *, repo_full_name: str, run_id: int):
+        """Observations of a run from the shared poller until it finishes."""
+        return self.run_poller.watch(repo_full_name, run_id)
+
     async def _dispatch_with_fallbacks(
-        self, repo_full_name: str, *, ref: str, inputs: dict[str, Any] | None
+        self,
+        repo_full_name: str,
+        *,
+        ref: str,
+        inputs: dict[str, Any] | None,
+        correlation_id: str | None = None,
+        workflow_hints: tuple[str | None, str | None] = (None, None),
     ):
-        return await dispatch_with_fallbacks(
+        """Dispatch, trying the workflow file known to work for the repo first.
+
+        ``workflow_hints`` is (workflow file persisted for the repo, template
+        repo it was generated from); the working file is remembered for both.
+        """
+        persisted, template_repo = workflow_hints
+        workflow_file = await dispatch_with_fallbacks(
             self.client,
-            self._workflow_fallbacks,
+            prefer_workflows(
+                self._workflow_fallbacks,
+                self.cache.workflow_file_for(repo_full_name),
+                persisted,
+                self.cache.workflow_file_for(template_repo),
+            ),
             repo_full_name=repo_full_name,
             ref=ref,
             inputs=inputs,
             preferred_workflow=self.workflow_file,
+            correlation_input=self.correlation_input,
+            correlation_id=correlation_id,
         )
+        self.cache.cache_workflow_file(repo_full_name, workflow_file)
+        if template_repo:
+            self.cache.cache_workflow_file(template_repo, workflow_file)
+        return workflow_file
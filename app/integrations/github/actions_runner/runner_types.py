@@ -11,11 +11,18 @@ class RunnerContext(Protocol):
     cache: ActionsCache
     poll_interval_seconds: float
     max_poll_seconds: float
+    correlation_input: str | None
 
     async def _parse_artifacts(self, repo_full_name: str, run_id: int):
         ...
 
     async def _dispatch_with_fallbacks(
-        self, repo_full_name: str, *, ref: str, inputs: dict[str, Any] | None
+        self,
+        repo_full_name: str,
+        *,
+        ref: str,
+        inputs: dict[str, Any] | None,
+        correlation_id: str | None = None,
+        workflow_hints: tuple[str | None, str | None] = (None, None),
     ):
         ...
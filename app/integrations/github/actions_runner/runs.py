@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import uuid
 from datetime import datetime, timedelta
 
 from app.integrations.github.client import WorkflowRun
@@ -17,5 +18,19 @@ def is_dispatched_run(run: WorkflowRun, dispatch_started_at: datetime) -> bool:
     return False
 
 
+def new_correlation_id() -> str:
+    return uuid.uuid4().hex
+
+
+def is_correlated_run(run: WorkflowRun, correlation_id: str) -> bool:
+    return correlation_id in (run.display_title or "")
+
+
+def dispatched_since(dispatch_started_at: datetime) -> str:
+    """``created`` filter covering runs from a dispatch (with clock skew)."""
+    since = dispatch_started_at - timedelta(seconds=10)
+    return f">={since.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+
+
 def run_cache_key(repo_full_name: str, run_id: int) -> tuple[str, int]:
     return (repo_full_name, int(run_id))
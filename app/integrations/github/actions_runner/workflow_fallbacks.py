@@ -5,3 +5,8 @@ def build_workflow_fallbacks(workflow_file: str) -> list[str]:
     return list(
         dict.fromkeys([workflow_file, "tenon-ci.yml", ".github/workflows/tenon-ci.yml"])
     )
+
+
+def prefer_workflows(fallbacks: list[str], *known: str | None) -> list[str]:
+    """Put workflow files known to work for a repo ahead of the fallbacks."""
+    return list(dict.fromkeys([*(wf for wf in known if wf), *fallbacks]))
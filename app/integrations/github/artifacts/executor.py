@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import shutil
+import signal
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from typing import IO, Any, Literal, TypeVar
+
+from app.integrations.github.artifacts.limits import DEFAULT_LIMITS, ArtifactLimits
+
+try:  # pragma: no cover - resource is POSIX only
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+ParseMode = Literal["thread", "process"]
+T = TypeVar("T")
+
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+class ArtifactParseTimeout(Exception):
+    """Raised when parsing an artifact exceeds its time or CPU budget."""
+
+
+def _cpu_exceeded(_signum, _frame) -> None:
+    raise ArtifactParseTimeout("artifact parse exceeded its CPU limit")
+
+
+def _call(fn: Callable[..., T], source: bytes | str, limits: ArtifactLimits) -> T:
+    if isinstance(source, bytes):
+        return fn(source, limits=limits)
+    with open(source, "rb") as fh:
+        return fn(fh, limits=limits)
+
+
+def _run_with_cpu_limit(
+    fn: Callable[..., T],
+    source: bytes | str,
+    limits: ArtifactLimits,
+    cpu_seconds: float | None,
+) -> T:
+    """Worker-process entry point; caps CPU time for a single parse.
+
+    ``source`` is the artifact itself or the path of a file holding it.
+    """
+    if cpu_seconds is None or resource is None:
+        return _call(fn, source, limits)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    # RLIMIT_CPU is cumulative, so the budget is relative to what was used.
+    budget = int(usage.ru_utime + usage.ru_stime + cpu_seconds) + 1
+    if hard != resource.RLIM_INFINITY:
+        budget = min(budget, hard)
+    previous = signal.signal(signal.SIGXCPU, _cpu_exceeded)
+    resource.setrlimit(resource.RLIMIT_CPU, (budget, hard))
+    try:
+        return _call(fn, source, limits)
+    finally:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+        signal.signal(signal.SIGXCPU, previous)
+
+
+def _close(content: bytes | IO[bytes]) -> None:
+    if not isinstance(content, bytes):
+        content.close()
+
+
+def _nothing_to_release() -> None:
+    return None
+
+
+def _unlink(path: str) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+
+
+def _spool_to_path(content: IO[bytes]) -> str:
+    """Copy a spool into a named temp file that a worker process can open."""
+    content.seek(0)
+    with tempfile.NamedTemporaryFile(
+        prefix="artifact-", suffix=".zip", delete=False
+    ) as tmp:
+        shutil.copyfileobj(content, tmp)
+    return tmp.name
+
+
+class ArtifactParseExecutor:
+    """Runs artifact parsers off the event loop with time and size limits.
+
+    ``thread`` mode hands the (possibly spooled) file to a worker thread. A
+    thread cannot be stopped, so the timeout bounds how long the caller waits,
+    not the parse: an overrunning parse keeps its worker and its file until it
+    returns, with only the zip limits bounding the work. Such workers are
+    counted as stuck, and calls fail fast while every worker is stuck.
+    ``process`` mode isolates parsing in worker processes, which also lets a
+    per-parse CPU limit be enforced; a spool is copied to a temp file and the
+    worker opens it by path, so the artifact is never held in memory whole.
+    """
+
+    def __init__(
+        self,
+        *,
+        mode: ParseMode = "thread",
+        max_workers: int = 2,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        cpu_seconds: float | None = None,
+        limits: ArtifactLimits = DEFAULT_LIMITS,
+    ) -> None:
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown artifact parse mode: {mode}")
+        self.mode = mode
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self.cpu_seconds = cpu_seconds
+        self.limits = limits
+        self._pool: Executor | None = None
+        self._stuck: set[Future] = set()
+        self.parsed = 0
+        self.timeouts = 0
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            if self.mode == "process":
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="artifact-parse",
+                )
+        return self._pool
+
+    def _prepare(
+        self, fn: Callable[..., T], content: bytes | IO[bytes]
+    ) -> tuple[Callable[[], T], Callable[[], None]]:
+        """The pool call for ``content`` and the cleanup to run once it is done."""
+        if self.mode == "thread":
+            return partial(fn, content, limits=self.limits), partial(_close, content)
+        if isinstance(content, bytes):
+            source: bytes | str = content
+            release: Callable[[], None] = _nothing_to_release
+        else:
+            try:
+                source = _spool_to_path(content)
+            finally:
+                content.close()
+            release = partial(_unlink, source)
+        call = partial(_run_with_cpu_limit, fn, source, self.limits, self.cpu_seconds)
+        return call, release
+
+    async def run(self, fn: Callable[..., T], content: bytes | IO[bytes]) -> T:
+        """Call ``fn(content, limits=...)`` in the pool.
+
+        ``fn`` must be a module-level function so process workers can import
+        it. File-like ``content`` is closed by the executor once no worker
+        needs it, which after a timeout can be later than this returns, so
+        callers must not close it themselves. Raises ``ArtifactParseTimeout``
+        when the budget is exhausted and lets ``ArtifactRejected`` from the
+        zip-bomb guards propagate.
+        """
+        if len(self._stuck) >= self.max_workers:
+            _close(content)
+            self.timeouts += 1
+            raise ArtifactParseTimeout("every artifact parse worker is still busy")
+        try:
+            call, release = self._prepare(fn, content)
+        except BaseException:
+            _close(content)
+            raise
+        future = self._executor().submit(call)
+        future.add_done_callback(lambda _done: release())
+        try:
+            result = await asyncio.wait_for(
+                asyncio.wrap_future(future), self.timeout_seconds
+            )
+        except TimeoutError as exc:
+            if not future.done():
+                # Already running, so cancelling failed: the slot stays taken.
+                self._stuck.add(future)
+                future.add_done_callback(self._stuck.discard)
+            self.timeouts += 1
+            raise ArtifactParseTimeout("artifact parse timed out") from exc
+        except ArtifactParseTimeout:
+            self.timeouts += 1
+            raise
+        except BrokenProcessPool as exc:
+            # A worker died mid-parse; start a fresh pool for the next call.
+            self._pool = None
+            self.timeouts += 1
+            raise ArtifactParseTimeout("artifact parse worker died") from exc
+        self.parsed += 1
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "maxWorkers": self.max_workers,
+            "parsed": self.parsed,
+            "timeouts": self.timeouts,
+            "stuckWorkers": len(self._stuck),
+        }
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+@lru_cache(maxsize=1)
+def default_parse_executor() -> ArtifactParseExecutor:
+    """Thread-backed executor used when a client has none configured."""
+    return ArtifactParseExecutor()
+
+
+def parse_executor_for(client: object) -> ArtifactParseExecutor:
+    return getattr(client, "artifact_parser", None) or default_parse_executor()
@@ -1,42 +1,155 @@
 from __future__ import annotations
 
-from typing import Any
+from dataclasses import dataclass, field
+from typing import IO, Any
 from xml.etree import ElementTree
 from zipfile import ZipFile
 
 from app.integrations.github.artifacts.models import ParsedTestResults
 
+# Failing tests listed in ``summary["failures"]`` when details are requested.
+MAX_FAILURE_DETAILS = 50
 
-def parse_junit(zf: ZipFile) -> ParsedTestResults | None:
+
+@dataclass
+class _JunitTotals:
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    failures: list[dict[str, Any]] = field(default_factory=list)
+    failures_truncated: bool = False
+
+    def merge(self, other: _JunitTotals, max_failures: int) -> None:
+        self.passed += other.passed
+        self.failed += other.failed
+        self.skipped += other.skipped
+        room = max(max_failures - len(self.failures), 0)
+        self.failures.extend(other.failures[:room])
+        self.failures_truncated = (
+            self.failures_truncated
+            or other.failures_truncated
+            or len(other.failures) > room
+        )
+
+
+def parse_junit(zf: ZipFile, *, max_failures: int = 0) -> ParsedTestResults | None:
+    """Aggregate every JUnit XML file in the archive with bounded memory.
+
+    ``max_failures`` > 0 adds up to that many failing tests (name, class,
+    duration) to the summary.
+    """
+    totals = _JunitTotals()
+    files = 0
     for name in zf.namelist():
         if not name.lower().endswith(".xml"):
             continue
         with zf.open(name) as fp:
             try:
-                tree = ElementTree.parse(fp)
+                file_totals = _stream_counts(fp, max_failures)
             except ElementTree.ParseError:
                 continue
-        passed, failed = _junit_counts(tree.getroot())
-        total = passed + failed
-        return ParsedTestResults(
-            passed=passed,
-            failed=failed,
-            total=total,
-            stdout=None,
-            stderr=None,
-            summary={"format": "junit"},
-        )
-    return None
-
-
-def _junit_counts(root: Any) -> tuple[int, int]:
-    passed = 0
-    failed = 0
-    for testcase in root.iter("testcase"):
-        failures = list(testcase.iter("failure"))
-        errors = list(testcase.iter("error"))
-        if failures or errors:
-            failed += 1
-        else:
-            passed += 1
-    return passed, failed
+        totals.merge(file_totals, max_failures)
+        files += 1
+    if not files:
+        return None
+    summary: dict[str, Any] = {"format": "junit"}
+    if files > 1:
+        summary["files"] = files
+    if totals.skipped:
+        summary["skipped"] = totals.skipped
+    if max_failures > 0:
+        summary["failures"] = totals.failures
+        if totals.failures_truncated:
+            summary["failuresTruncated"] = True
+    return ParsedTestResults(
+        passed=totals.passed,
+        failed=totals.failed,
+        total=totals.passed + totals.failed + totals.skipped,
+        stdout=None,
+        stderr=None,
+        summary=summary,
+    )
+
+
+def _int_attr(elem: Any, name: str) -> int | None:
+    value = elem.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def _suite_counts(elem: Any) -> tuple[int, int, int] | None:
+    """(passed, failed, skipped) from testsuite attributes, if present."""
+    tests = _int_attr(elem, "tests")
+    if tests is None:
+        return None
+    failed = (_int_attr(elem, "failures") or 0) + (_int_attr(elem, "errors") or 0)
+    skipped = _int_attr(elem, "skipped") or _int_attr(elem, "disabled") or 0
+    return max(tests - failed - skipped, 0), failed, skipped
+
+
+def _failure_detail(testcase: Any) -> dict[str, Any]:
+    duration = testcase.get("time")
+    try:
+        seconds = float(duration) if duration is not None else None
+    except ValueError:
+        seconds = None
+    return {
+        "name": testcase.get("name"),
+        "classname": testcase.get("classname"),
+        "time": seconds,
+    }
+
+
+def _stream_counts(fp: IO[bytes], max_failures: int) -> _JunitTotals:
+    totals = _JunitTotals()
+    parents: list[Any] = []
+    # Depth of the outermost suite whose attributes already supplied counts.
+    counted_depth: int | None = None
+    for event, elem in ElementTree.iterparse(fp, events=("start", "end")):
+        if event == "start":
+            if elem.tag == "testsuite" and counted_depth is None:
+                counts = _suite_counts(elem)
+                if counts is not None:
+                    passed, failed, skipped = counts
+                    totals.passed += passed
+                    totals.failed += failed
+                    totals.skipped += skipped
+                    counted_depth = len(parents)
+            parents.append(elem)
+            continue
+        parents.pop()
+        if elem.tag == "testcase":
+            failed = False
+            skipped = False
+            for child in elem:
+                if child.tag in ("failure", "error"):
+                    failed = True
+                elif child.tag == "skipped":
+                    skipped = True
+            if counted_depth is None:
+                if failed:
+                    totals.failed += 1
+                elif skipped:
+                    totals.skipped += 1
+                else:
+                    totals.passed += 1
+            if failed and max_failures > 0:
+                if len(totals.failures) < max_failures:
+                    totals.failures.append(_failure_detail(elem))
+                else:
+                    totals.failures_truncated = True
+            # Finished siblings are no longer needed; keep the tree flat.
+            if parents:
+                del parents[-1][:]
+            elem.clear()
+        elif elem.tag == "testsuite":
+            if counted_depth == len(parents):
+                counted_depth = None
+            if parents:
+                del parents[-1][:]
+            elem.clear()
+    return totals
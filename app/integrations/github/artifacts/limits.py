@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from zipfile import ZipFile
+
+DEFAULT_MAX_MEMBERS = 1000
+DEFAULT_MAX_UNCOMPRESSED_BYTES = 512 * 1024 * 1024
+
+
+class ArtifactRejected(ValueError):
+    """Raised when an artifact archive exceeds the configured safety limits."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class ArtifactLimits:
+    """Zip-bomb guards applied before any member is read."""
+
+    max_members: int = DEFAULT_MAX_MEMBERS
+    max_uncompressed_bytes: int = DEFAULT_MAX_UNCOMPRESSED_BYTES
+
+
+DEFAULT_LIMITS = ArtifactLimits()
+
+
+def check_archive(zf: ZipFile, limits: ArtifactLimits | None) -> None:
+    """Reject archives with too many members or too much uncompressed data.
+
+    ``ZipExtFile`` never yields more than a member's declared ``file_size``,
+    so summing the central directory bounds what parsing can inflate.
+    """
+    if limits is None:
+        return
+    members = zf.infolist()
+    if len(members) > limits.max_members:
+        raise ArtifactRejected("too_many_members")
+    if sum(member.file_size for member in members) > limits.max_uncompressed_bytes:
+        raise ArtifactRejected("uncompressed_too_large")
@@ -2,18 +2,40 @@ from __future__ import annotations
 
 import io
 import zipfile
+from typing import IO
 
 from app.integrations.github.artifacts.json_parser import (
     parse_any_json,
     parse_named_json,
 )
 from app.integrations.github.artifacts.junit_parser import parse_junit
+from app.integrations.github.artifacts.limits import (
+    DEFAULT_LIMITS,
+    ArtifactLimits,
+    check_archive,
+)
 from app.integrations.github.artifacts.models import ParsedTestResults
 
 
-def parse_test_results_zip(content: bytes) -> ParsedTestResults | None:
+def parse_test_results_zip(
+    content: bytes | IO[bytes],
+    *,
+    limits: ArtifactLimits | None = DEFAULT_LIMITS,
+    max_failures: int = 0,
+) -> ParsedTestResults | None:
+    """Parse test results from an artifact zip.
+
+    ``max_failures`` is forwarded to the JUnit fallback. Raises
+    ``ArtifactRejected`` when the archive exceeds ``limits``.
+    """
+    source = io.BytesIO(content) if isinstance(content, bytes) else content
     try:
-        with zipfile.ZipFile(io.BytesIO(content)) as zf:
-            return parse_named_json(zf) or parse_any_json(zf) or parse_junit(zf)
+        with zipfile.ZipFile(source) as zf:
+            check_archive(zf, limits)
+            return (
+                parse_named_json(zf)
+                or parse_any_json(zf)
+                or parse_junit(zf, max_failures=max_failures)
+            )
     except zipfile.BadZipFile:
         return None
@@ -3,7 +3,8 @@ from __future__ import annotations
 from .artifacts import ArtifactOperations
 from .client import GithubClient
 from .content import ContentOperations
-from .errors import GithubError
+from .errors import GithubArtifactTooLarge, GithubError
+from .rate_budget import GithubRateLimited, RateLimitBudget, github_lane
 from .repos import RepoOperations
 from .runs import WorkflowRun
 from .workflows import WorkflowOperations
@@ -11,9 +12,13 @@ from .workflows import WorkflowOperations
 __all__ = [
     "ArtifactOperations",
     "ContentOperations",
+    "GithubArtifactTooLarge",
     "GithubClient",
     "GithubError",
+    "GithubRateLimited",
+    "RateLimitBudget",
     "RepoOperations",
     "WorkflowRun",
     "WorkflowOperations",
+    "github_lane",
 ]
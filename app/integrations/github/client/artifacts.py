@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import tempfile
+
 from .names import split_full_name
 from .transport import GithubTransport
 
@@ -19,3 +21,11 @@ class ArtifactOperations:
         owner, repo = split_full_name(repo_full_name)
         path = f"/repos/{owner}/{repo}/actions/artifacts/{artifact_id}/zip"
         return await self._get_bytes(path)
+
+    async def download_artifact_file(
+        self, repo_full_name: str, artifact_id: int
+    ) -> tempfile.SpooledTemporaryFile:
+        """Stream an artifact zip to a spooled temp file the caller must close."""
+        owner, repo = split_full_name(repo_full_name)
+        path = f"/repos/{owner}/{repo}/actions/artifacts/{artifact_id}/zip"
+        return await self._get_spooled(path)
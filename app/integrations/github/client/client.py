@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from .artifacts import ArtifactOperations
 from .compat import CompatOperations
 from .content import ContentOperations
 from .repos import RepoOperations
-from .transport import GithubTransport
+from .transport import DEFAULT_ARTIFACT_MAX_BYTES, GithubTransport
 from .workflows import WorkflowOperations
 
+if TYPE_CHECKING:
+    from app.integrations.github.artifacts.executor import ArtifactParseExecutor
+    from app.integrations.github.webhooks import WorkflowRunEventStore
+
 
 class GithubClient(
     RepoOperations,
@@ -15,6 +21,11 @@ class GithubClient(
     ArtifactOperations,
     CompatOperations,
 ):
+    # Set when webhook ingestion is configured; lets callers await run events.
+    run_events: WorkflowRunEventStore | None = None
+    # Pool used to parse downloaded artifacts; a shared thread pool when unset.
+    artifact_parser: ArtifactParseExecutor | None = None
+
     def __init__(
         self,
         *,
@@ -22,11 +33,15 @@ class GithubClient(
         token: str,
         default_org: str | None = None,
         transport=None,
+        conditional_cache_max_bytes: int = 0,
+        artifact_max_bytes: int = DEFAULT_ARTIFACT_MAX_BYTES,
     ):
         self.transport = GithubTransport(
             base_url=base_url,
             token=token,
             transport=transport,
+            conditional_cache_max_bytes=conditional_cache_max_bytes,
+            artifact_max_bytes=artifact_max_bytes,
         )
         self.default_org = default_org
 
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import tempfile
+
+from .conditional_cache import ConditionalRequestCache
 from .names import split_full_name
-from .requests import get_bytes, request_json
+from .rate_budget import GithubRateLimited
+from .requests import get_bytes, get_spooled, request_json
 from .transport import GithubTransport
 
 
@@ -29,8 +33,14 @@ class CompatOperations:
             expect_body=expect_body,
         )
 
-    async def _get_json(self, path: str, params=None):
-        return await self._request("GET", path, params=params)
+    async def _get_json(self, path: str, params=None, *, coalesce: bool = True):
+        if not coalesce:
+            return await self._request("GET", path, params=params)
+        return await self.transport.single_flight.run(
+            ConditionalRequestCache.key(path, params),
+            lambda: self._request("GET", path, params=params),
+            retry_on=(GithubRateLimited,),
+        )
 
     async def _post_json(self, path: str, *, json: dict, expect_body: bool = True):
         return await self._request("POST", path, json=json, expect_body=expect_body)
@@ -40,3 +50,13 @@ class CompatOperations:
 
     async def _get_bytes(self, path: str, params=None) -> bytes:
         return await get_bytes(self.transport, path, params=params)
+
+    async def _get_spooled(
+        self, path: str, params=None
+    ) -> tempfile.SpooledTemporaryFile:
+        return await get_spooled(
+            self.transport,
+            path,
+            max_bytes=self.transport.artifact_max_bytes,
+            params=params,
+        )
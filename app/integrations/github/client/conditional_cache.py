@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class CachedResponse:
+    """GitHub response body tagged with its HTTP validators."""
+
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+
+
+class ConditionalRequestCache:
+    """LRU of validator-tagged GET bodies, bounded by total body bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+
+    @staticmethod
+    def key(path: str, params: Mapping[str, Any] | None) -> CacheKey:
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        return (path, tuple(items))
+
+    def validators(self, key: CacheKey) -> dict[str, str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def hit(self, key: CacheKey) -> Any | None:
+        """Return a fresh copy of the cached payload after a 304."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return json.loads(entry.body)
+
+    def record(self, key: CacheKey, headers: Mapping[str, str], body: bytes) -> None:
+        """Count a full response and keep it when GitHub sent validators."""
+        self.misses += 1
+        self._discard(key)
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not (etag or last_modified) or len(body) > self.max_bytes:
+            return
+        self._entries[key] = CachedResponse(etag, last_modified, body)
+        self.bytes_held += len(body)
+        while self.bytes_held > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes_held -= len(evicted.body)
+            self.evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes_held,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _discard(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes_held -= len(entry.body)
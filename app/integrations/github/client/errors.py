@@ -15,6 +15,14 @@ class GithubError(Exception):
         self.status_code = status_code
 
 
+class GithubArtifactTooLarge(GithubError):
+    """Raised when an artifact download exceeds the configured size cap."""
+
+    def __init__(self, url: str, max_bytes: int):
+        super().__init__(f"GitHub artifact exceeds {max_bytes} bytes ({url})")
+        self.max_bytes = max_bytes
+
+
 def raise_for_status(url: str, resp: httpx.Response) -> None:
     if resp.status_code < 400:
         return
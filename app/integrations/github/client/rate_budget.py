@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Literal
+
+from .errors import GithubError
+
+logger = logging.getLogger(__name__)
+
+Lane = Literal["submit", "dispatch", "poll", "health"]
+
+# Share of the hourly limit each lane leaves untouched for higher-priority lanes.
+LANE_RESERVE_FRACTION: dict[Lane, float] = {
+    "submit": 0.0,
+    "dispatch": 0.05,
+    "poll": 0.15,
+    "health": 0.30,
+}
+# Longest a lane will sleep for budget to come back before the call is shed.
+LANE_MAX_DELAY_SECONDS: dict[Lane, float] = {
+    "submit": 60.0,
+    "dispatch": 10.0,
+    "poll": 0.0,
+    "health": 0.0,
+}
+
+_lane_ctx: ContextVar[Lane] = ContextVar("github_lane", default="submit")
+
+
+@contextmanager
+def github_lane(lane: Lane) -> Iterator[None]:
+    """Tag GitHub calls made inside the block with a priority lane."""
+    token = _lane_ctx.set(lane)
+    try:
+        yield
+    finally:
+        _lane_ctx.reset(token)
+
+
+def current_lane() -> Lane:
+    return _lane_ctx.get()
+
+
+class GithubRateLimited(GithubError):
+    """Raised when a call is shed to protect the remaining rate-limit budget."""
+
+    def __init__(self, lane: Lane, retry_after_seconds: float):
+        super().__init__(
+            f"GitHub rate budget reserved; {lane} call shed", status_code=429
+        )
+        self.lane = lane
+        self.retry_after_seconds = retry_after_seconds
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimitBudget:
+    """Live view of the token's GitHub budget that gates calls by lane."""
+
+    def __init__(self) -> None:
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset_at: float | None = None
+        self.paused_until: float | None = None
+        self.requests: dict[str, int] = dict.fromkeys(LANE_RESERVE_FRACTION, 0)
+        self.delayed: dict[str, int] = dict.fromkeys(LANE_RESERVE_FRACTION, 0)
+        self.shed: dict[str, int] = dict.fromkeys(LANE_RESERVE_FRACTION, 0)
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Update the budget from a GitHub response's rate-limit headers."""
+        resource = headers.get("X-RateLimit-Resource")
+        if resource in (None, "core"):
+            limit = _header_int(headers, "X-RateLimit-Limit")
+            remaining = _header_int(headers, "X-RateLimit-Remaining")
+            reset = _header_int(headers, "X-RateLimit-Reset")
+            if limit is not None:
+                self.limit = limit
+            if remaining is not None:
+                self.remaining = remaining
+            if reset is not None:
+                self.reset_at = float(reset)
+        if status_code in (403, 429):
+            retry_after = _header_int(headers, "Retry-After")
+            if retry_after is not None:
+                self.paused_until = time.time() + retry_after
+                logger.warning(
+                    "github_secondary_rate_limit",
+                    extra={"retry_after_seconds": retry_after},
+                )
+
+    async def acquire(self, lane: Lane | None = None) -> None:
+        """Wait for or reject a call so low lanes never drain the budget."""
+        lane = lane or current_lane()
+        wait = self._wait_seconds(lane)
+        if wait > 0:
+            if wait > LANE_MAX_DELAY_SECONDS[lane]:
+                self.shed[lane] += 1
+                logger.warning(
+                    "github_rate_budget_shed",
+                    extra={"lane": lane, "retry_after_seconds": round(wait, 1)},
+                )
+                raise GithubRateLimited(lane, wait)
+            self.delayed[lane] += 1
+            await asyncio.sleep(wait)
+            self._refill_if_reset()
+        self.requests[lane] += 1
+        if self.remaining is not None:
+            self.remaining = max(self.remaining - 1, 0)
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "resetAt": self.reset_at,
+            "pausedUntil": self.paused_until,
+            "requests": dict(self.requests),
+            "delayed": dict(self.delayed),
+            "shed": dict(self.shed),
+        }
+
+    def _reserve(self, lane: Lane) -> int:
+        if not self.limit:
+            return 0
+        return math.ceil(self.limit * LANE_RESERVE_FRACTION[lane])
+
+    def _refill_if_reset(self) -> None:
+        now = time.time()
+        if self.reset_at is not None and now >= self.reset_at:
+            self.remaining = None
+            self.reset_at = None
+        if self.paused_until is not None and now >= self.paused_until:
+            self.paused_until = None
+
+    def _wait_seconds(self, lane: Lane) -> float:
+        self._refill_if_reset()
+        now = time.time()
+        wait = 0.0
+        if self.paused_until is not None:
+            wait = self.paused_until - now
+        if self.remaining is not None and self.remaining <= self._reserve(lane):
+            reset_wait = (self.reset_at - now) if self.reset_at else 60.0
+            wait = max(wait, reset_wait)
+        return wait
@@ -1,32 +1,68 @@
 from __future__ import annotations
 
 import logging
+import tempfile
 
 import httpx
 
-from .errors import GithubError, raise_for_status
+from .errors import GithubArtifactTooLarge, GithubError, raise_for_status
 from .transport import GithubTransport
 
 logger = logging.getLogger(__name__)
 
+# Downloads stay in memory up to this size before spilling to a temp file.
+SPOOL_MEMORY_BYTES = 1024 * 1024
 
-async def request_json(
+
+async def _send(
     transport: GithubTransport,
     method: str,
     path: str,
     *,
     params: dict | None = None,
     json: dict | None = None,
-    expect_body: bool = True,
-) -> dict:
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    await transport.rate_budget.acquire()
     try:
-        resp = await transport.client().request(method, path, params=params, json=json)
+        resp = await transport.client().request(
+            method, path, params=params, json=json, headers=headers
+        )
     except httpx.HTTPError as exc:  # pragma: no cover - network
         logger.error(
             "github_request_failed",
             extra={"url": f"{transport.base_url}{path}", "error": str(exc)},
         )
         raise GithubError("GitHub request failed") from exc
+    transport.rate_budget.observe(resp.status_code, resp.headers)
+    return resp
+
+
+async def request_json(
+    transport: GithubTransport,
+    method: str,
+    path: str,
+    *,
+    params: dict | None = None,
+    json: dict | None = None,
+    expect_body: bool = True,
+) -> dict:
+    cache = transport.conditional_cache if method == "GET" and expect_body else None
+    cache_key = cache.key(path, params) if cache else None
+    resp = await _send(
+        transport,
+        method,
+        path,
+        params=params,
+        json=json,
+        headers=cache.validators(cache_key) if cache else None,
+    )
+    if cache is not None and resp.status_code == 304:
+        cached = cache.hit(cache_key)
+        if cached is not None:
+            return cached
+        # Entry was evicted while the request was in flight; fetch the full body.
+        resp = await _send(transport, method, path, params=params, json=json)
 
     raise_for_status(str(resp.url), resp)
     if not expect_body:
@@ -34,14 +70,18 @@ async def request_json(
     if "application/zip" in resp.headers.get("Content-Type", ""):
         return resp.content  # type: ignore[return-value]
     try:
-        return resp.json()
+        data = resp.json()
     except ValueError as exc:
         raise GithubError("Invalid GitHub response") from exc
+    if cache is not None:
+        cache.record(cache_key, resp.headers, resp.content)
+    return data
 
 
 async def get_bytes(
     transport: GithubTransport, path: str, params: dict | None = None
 ) -> bytes:
+    await transport.rate_budget.acquire()
     try:
         resp = await transport.client().get(path, params=params, follow_redirects=True)
     except httpx.HTTPError as exc:  # pragma: no cover - network
@@ -51,5 +91,48 @@ async def get_bytes(
         )
         raise GithubError("GitHub request failed") from exc
 
+    transport.rate_budget.observe(resp.status_code, resp.headers)
     raise_for_status(str(resp.url), resp)
     return resp.content
+
+
+async def get_spooled(
+    transport: GithubTransport,
+    path: str,
+    *,
+    max_bytes: int,
+    params: dict | None = None,
+) -> tempfile.SpooledTemporaryFile:
+    """Stream a binary GET into a spooled temp file, aborting past ``max_bytes``.
+
+    The caller owns the returned file (rewound to the start) and must close it.
+    """
+    await transport.rate_budget.acquire()
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)  # noqa: SIM115
+    try:
+        async with transport.client().stream(
+            "GET", path, params=params, follow_redirects=True
+        ) as resp:
+            transport.rate_budget.observe(resp.status_code, resp.headers)
+            raise_for_status(str(resp.url), resp)
+            declared = resp.headers.get("Content-Length")
+            if declared and declared.isdigit() and int(declared) > max_bytes:
+                raise GithubArtifactTooLarge(str(resp.url), max_bytes)
+            written = 0
+            async for chunk in resp.aiter_bytes():
+                written += len(chunk)
+                if written > max_bytes:
+                    raise GithubArtifactTooLarge(str(resp.url), max_bytes)
+                spool.write(chunk)
+    except httpx.HTTPError as exc:  # pragma: no cover - network
+        spool.close()
+        logger.error(
+            "github_request_failed",
+            extra={"url": f"{transport.base_url}{path}", "error": str(exc)},
+        )
+        raise GithubError("GitHub request failed") from exc
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
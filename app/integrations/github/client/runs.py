@@ -16,6 +16,7 @@ class WorkflowRun:
     artifact_count: int | None = None
     event: str | None = None
     created_at: str | None = None
+    display_title: str | None = None
 
 
 def parse_run(payload: dict[str, Any]) -> WorkflowRun:
@@ -28,4 +29,5 @@ def parse_run(payload: dict[str, Any]) -> WorkflowRun:
         artifact_count=payload.get("artifacts") or payload.get("artifacts_count"),
         event=payload.get("event"),
         created_at=payload.get("created_at"),
+        display_title=payload.get("display_title"),
     )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls into one shared upstream call."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def run(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        *,
+        retry_on: tuple[type[BaseException], ...] = (),
+    ) -> Any:
+        """Await ``fn`` or join an identical call that is already in flight.
+
+        Waiters receive a deep copy of the leader's result so callers can
+        mutate payloads freely. Errors listed in ``retry_on`` (and leader
+        cancellation) make each waiter issue its own call instead.
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                return await fn()
+            except retry_on:
+                return await fn()
+            return copy.deepcopy(result)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.leaders += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when nobody is waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "inFlight": len(self._inflight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
@@ -4,6 +4,12 @@ import httpx
 
 from app.core.brand import DEFAULT_USER_AGENT
 
+from .conditional_cache import ConditionalRequestCache
+from .rate_budget import RateLimitBudget
+from .single_flight import SingleFlight
+
+DEFAULT_ARTIFACT_MAX_BYTES = 100 * 1024 * 1024
+
 
 class GithubTransport:
     def __init__(
@@ -12,6 +18,8 @@ class GithubTransport:
         base_url: str,
         token: str,
         transport: httpx.BaseTransport | None = None,
+        conditional_cache_max_bytes: int = 0,
+        artifact_max_bytes: int = DEFAULT_ARTIFACT_MAX_BYTES,
     ):
         self.base_url = base_url.rstrip("/")
         self._transport = transport
@@ -21,6 +29,14 @@ class GithubTransport:
             "User-Agent": DEFAULT_USER_AGENT,
         }
         self._client: httpx.AsyncClient | None = None
+        self.artifact_max_bytes = artifact_max_bytes
+        self.rate_budget = RateLimitBudget()
+        self.single_flight = SingleFlight()
+        self.conditional_cache = (
+            ConditionalRequestCache(conditional_cache_max_bytes)
+            if conditional_cache_max_bytes > 0
+            else None
+        )
 
     def client(self) -> httpx.AsyncClient:
         if self._client is None:
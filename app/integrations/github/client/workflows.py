@@ -40,12 +40,20 @@ class WorkflowOperations:
         *,
         branch: str | None = None,
         per_page: int = 5,
+        event: str | None = None,
+        created: str | None = None,
     ) -> list[WorkflowRun]:
         owner, repo = split_full_name(repo_full_name)
         params = {"per_page": per_page}
         if branch:
             params["branch"] = branch
+        if event:
+            params["event"] = event
+        if created:
+            params["created"] = created
         path = f"/repos/{owner}/{repo}/actions/workflows/{workflow_id_or_file}/runs"
-        data = await self._get_json(path, params=params)
+        # Callers poll this right after dispatching; a listing that started
+        # before the dispatch would hide the new run, so never share it.
+        data = await self._get_json(path, params=params, coalesce=False)
         runs = data.get("workflow_runs") or []
         return [parse_run(r) for r in runs]
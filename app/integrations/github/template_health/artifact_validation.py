@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 from app.integrations.github import GithubClient, GithubError
+from app.integrations.github.artifacts import (
+    ArtifactParseTimeout,
+    ArtifactRejected,
+    parse_executor_for,
+)
+from app.integrations.github.client import GithubArtifactTooLarge
 from app.integrations.github.template_health.artifacts import (
     _extract_test_results_json,
     _validate_test_results_schema,
@@ -12,13 +18,21 @@ async def validate_artifact_payload(
     github_client: GithubClient, *, repo_full_name: str, artifact_id: int
 ) -> str | None:
     try:
-        zip_content = await github_client.download_artifact_zip(
-            repo_full_name, artifact_id
-        )
+        spool = await github_client.download_artifact_file(repo_full_name, artifact_id)
+    except GithubArtifactTooLarge:
+        return "artifact_too_large"
     except GithubError as exc:
         return _classify_github_error(exc) or "artifact_missing"
 
-    payload = _extract_test_results_json(zip_content)
+    try:
+        # The executor closes the spool once its worker is done with it.
+        payload = await parse_executor_for(github_client).run(
+            _extract_test_results_json, spool
+        )
+    except ArtifactRejected:
+        return "artifact_rejected"
+    except ArtifactParseTimeout:
+        return "artifact_parse_timeout"
     if payload is None:
         return "artifact_zip_missing_test_results_json"
     if not _validate_test_results_schema(payload):
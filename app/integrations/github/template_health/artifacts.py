@@ -3,8 +3,14 @@ from __future__ import annotations
 import io
 import json
 import zipfile
+from typing import IO
 
 from app.core.brand import TEST_ARTIFACT_NAMESPACE
+from app.integrations.github.artifacts.limits import (
+    DEFAULT_LIMITS,
+    ArtifactLimits,
+    check_archive,
+)
 
 
 def _validate_test_results_schema(payload: dict[str, object]) -> bool:
@@ -24,9 +30,13 @@ def _validate_test_results_schema(payload: dict[str, object]) -> bool:
     return True
 
 
-def _extract_test_results_json(content: bytes) -> dict[str, object] | None:
+def _extract_test_results_json(
+    content: bytes | IO[bytes], *, limits: ArtifactLimits | None = DEFAULT_LIMITS
+) -> dict[str, object] | None:
+    source = io.BytesIO(content) if isinstance(content, bytes) else content
     try:
-        with zipfile.ZipFile(io.BytesIO(content)) as zf:
+        with zipfile.ZipFile(source) as zf:
+            check_archive(zf, limits)
             for name in zf.namelist():
                 if name.endswith(f"{TEST_ARTIFACT_NAMESPACE}.json"):
                     with zf.open(name) as fp:
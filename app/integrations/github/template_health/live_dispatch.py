@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 from app.integrations.github import GithubClient, GithubError
 from app.integrations.github.template_health.classify import _classify_github_error
 from app.integrations.github.template_health.runs import _is_dispatched_run
+from app.integrations.github.webhooks.run_events import is_completed
 
 
 async def dispatch_and_poll(
@@ -28,6 +29,20 @@ async def dispatch_and_poll(
         return errors, None, None
 
     deadline = time.monotonic() + timeout_seconds
+    run_events = getattr(github_client, "run_events", None)
+    if run_events is not None:
+        run = await run_events.wait_for_run(
+            repo_full_name,
+            workflow_file=workflow_file,
+            branch=default_branch,
+            match=lambda item: _is_dispatched_run(item, dispatch_started_at),
+            timeout=timeout_seconds,
+        )
+        if run and is_completed(run):
+            return errors, int(run.id), (run.conclusion or "").lower() or None
+        if run:
+            return ["workflow_run_timeout"], None, None
+
     poll_interval = 2.0
     while time.monotonic() < deadline:
         try:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from app.integrations.github import GithubClient
+from app.integrations.github.client import github_lane
 from app.integrations.github.template_health.repo_check import check_template_repo
 from app.integrations.github.template_health.runner_concurrency import (
     run_with_concurrency,
@@ -22,18 +23,19 @@ async def check_template_health(
     concurrency: int = 1,
 ) -> TemplateHealthResponse:
     selected = template_keys or list(TEMPLATE_CATALOG.keys())
-    items = await run_with_concurrency(
-        selected,
-        concurrency=concurrency,
-        worker=lambda key: check_template_repo(
-            github_client,
-            template_key=key,
-            repo_full_name=TEMPLATE_CATALOG[key]["repo_full_name"],
-            workflow_file=workflow_file,
-            mode=mode,
-            timeout_seconds=timeout_seconds,
-        ),
-    )
+    with github_lane("health"):
+        items = await run_with_concurrency(
+            selected,
+            concurrency=concurrency,
+            worker=lambda key: check_template_repo(
+                github_client,
+                template_key=key,
+                repo_full_name=TEMPLATE_CATALOG[key]["repo_full_name"],
+                workflow_file=workflow_file,
+                mode=mode,
+                timeout_seconds=timeout_seconds,
+            ),
+        )
     return TemplateHealthResponse(
         ok=all(item.ok for item in items), templates=items, mode=mode
     )
@@ -0,0 +1,7 @@
+from app.integrations.github.webhooks.run_events import (
+    TrackedRun,
+    WorkflowRunEventStore,
+)
+from app.integrations.github.webhooks.signature import verify_signature
+
+__all__ = ["TrackedRun", "WorkflowRunEventStore", "verify_signature"]
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.integrations.github.client.runs import WorkflowRun, parse_run
+
+RunKey = tuple[str, int]
+
+
+@dataclass
+class TrackedRun:
+    """Latest webhook-reported state of one workflow run."""
+
+    run: WorkflowRun
+    workflow_path: str | None = None
+    workflow_id: int | None = None
+    head_branch: str | None = None
+    jobs: dict[int, str] = field(default_factory=dict)
+
+    def matches_workflow(self, workflow_file: str) -> bool:
+        if self.workflow_id is not None and str(self.workflow_id) == workflow_file:
+            return True
+        if not self.workflow_path:
+            return False
+        return self.workflow_path.rsplit("/", 1)[-1] == workflow_file
+
+
+def is_completed(run: WorkflowRun) -> bool:
+    return (run.status or "").lower() == "completed" or bool(run.conclusion)
+
+
+class WorkflowRunEventStore:
+    """In-process store of ``workflow_run``/``workflow_job`` webhook state.
+
+    Waiters are woken whenever an event for their repository arrives, so a
+    dispatcher can await completion instead of polling the REST API.
+    """
+
+    def __init__(self, *, first_event_seconds: float = 15.0, max_runs: int = 512):
+        self.first_event_seconds = first_event_seconds
+        self.max_runs = max_runs
+        self._runs: OrderedDict[RunKey, TrackedRun] = OrderedDict()
+        self._waiters: dict[str, set[asyncio.Future]] = {}
+        self.events = 0
+        self.ignored = 0
+
+    @staticmethod
+    def _repo_key(repo_full_name: str) -> str:
+        return repo_full_name.lower()
+
+    def ingest(self, event: str, payload: Mapping[str, Any]) -> bool:
+        """Apply a webhook delivery; returns False when it carried nothing usable."""
+        repo_full_name = (payload.get("repository") or {}).get("full_name")
+        if not repo_full_name:
+            self.ignored += 1
+            return False
+        repo = self._repo_key(repo_full_name)
+        if event == "workflow_run":
+            applied = self._ingest_run(repo, payload.get("workflow_run") or {})
+        elif event == "workflow_job":
+            applied = self._ingest_job(repo, payload.get("workflow_job") or {})
+        else:
+            applied = False
+        if not applied:
+            self.ignored += 1
+            return False
+        self.events += 1
+        self._notify(repo)
+        return True
+
+    def get(self, repo_full_name: str, run_id: int) -> WorkflowRun | None:
+        tracked = self._runs.get((self._repo_key(repo_full_name), int(run_id)))
+        return tracked.run if tracked else None
+
+    async def wait_for_run(
+        self,
+        repo_full_name: str,
+        *,
+        workflow_file: str,
+        branch: str | None,
+        match: Callable[[WorkflowRun], bool],
+        timeout: float,
+    ) -> WorkflowRun | None:
+        """Wait for a matching run to complete.
+
+        Returns ``None`` when no matching event arrives within
+        ``first_event_seconds`` so the caller can fall back to polling;
+        otherwise the run's latest state, which may still be in progress
+        if ``timeout`` elapses first.
+        """
+        repo = self._repo_key(repo_full_name)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        first_deadline = min(deadline, loop.time() + self.first_event_seconds)
+        tracked: TrackedRun | None = None
+        while True:
+            tracked = self._find(repo, workflow_file, branch, match)
+            if tracked is not None and is_completed(tracked.run):
+                return tracked.run
+            limit = deadline if tracked is not None else first_deadline
+            remaining = limit - loop.time()
+            if remaining <= 0:
+                return tracked.run if tracked else None
+            await self._wait_for_event(repo, remaining)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "runs": len(self._runs),
+            "events": self.events,
+            "ignored": self.ignored,
+            "waiters": sum(len(waiters) for waiters in self._waiters.values()),
+        }
+
+    def _ingest_run(self, repo: str, payload: Mapping[str, Any]) -> bool:
+        if not payload.get("id"):
+            return False
+        run = parse_run(dict(payload))
+        key = (repo, run.id)
+        existing = self._runs.get(key)
+        if existing is not None and is_completed(existing.run):
+            # Deliveries can arrive out of order; never regress a finished run.
+            return True
+        self._runs[key] = TrackedRun(
+            run=run,
+            workflow_path=payload.get("path"),
+            workflow_id=payload.get("workflow_id"),
+            head_branch=payload.get("head_branch"),
+            jobs=existing.jobs if existing else {},
+        )
+        self._runs.move_to_end(key)
+        while len(self._runs) > self.max_runs:
+            self._runs.popitem(last=False)
+        return True
+
+    def _ingest_job(self, repo: str, payload: Mapping[str, Any]) -> bool:
+        run_id, job_id = payload.get("run_id"), payload.get("id")
+        tracked = self._runs.get((repo, int(run_id or 0)))
+        if tracked is None or not job_id:
+            return False
+        tracked.jobs[int(job_id)] = str(
+            payload.get("conclusion") or payload.get("status") or ""
+        )
+        if not is_completed(tracked.run) and tracked.run.status != "in_progress":
+            tracked.run.status = "in_progress"
+        return True
+
+    def _find(
+        self,
+        repo: str,
+        workflow_file: str,
+        branch: str | None,
+        match: Callable[[WorkflowRun], bool],
+    ) -> TrackedRun | None:
+        found: TrackedRun | None = None
+        for (run_repo, _), tracked in self._runs.items():
+            if run_repo != repo or not tracked.matches_workflow(workflow_file):
+                continue
+            if branch and tracked.head_branch and tracked.head_branch != branch:
+                continue
+            if match(tracked.run) and (found is None or tracked.run.id > found.run.id):
+                found = tracked
+        return found
+
+    async def _wait_for_event(self, repo: str, timeout: float) -> None:
+        future = asyncio.get_running_loop().create_future()
+        waiters = self._waiters.setdefault(repo, set())
+        waiters.add(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            pass
+        finally:
+            waiters.discard(future)
+            if not waiters:
+                self._waiters.pop(repo, None)
+
+    def _notify(self, repo: str) -> None:
+        for future in self._waiters.get(repo, ()):
+            if not future.done():
+                future.set_result(None)
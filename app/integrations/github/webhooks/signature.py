@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+
+
+def verify_signature(secret: str, body: bytes, signature_header: str | None) -> bool:
+    """Check an ``X-Hub-Signature-256`` header against the raw request body."""
+    if not secret or not signature_header:
+        return False
+    if not signature_header.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(f"sha256={expected}", signature_header)
@@ -73,6 +73,18 @@ class CandidateSession(Base):
     invite_email_sent_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Progress counters maintained by ``create_submission``; a NULL
+    # ``current_task_id`` means the first task before any submission and
+    # "all done" after.
+    completed_task_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    current_task_id: Mapped[int | None] = mapped_column(
+        ForeignKey("tasks.id", ondelete="SET NULL"), nullable=True
+    )
+    last_submitted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     simulation = relationship("Simulation", back_populates="candidate_sessions")
     candidate_user = relationship("User", back_populates="candidate_sessions")
@@ -1,8 +1,16 @@
-from .repository_basic import get_by_id, get_by_id_for_update
+from .repository_basic import get_by_id, get_by_id_for_update, update_if_owner
 from .repository_email import (
     get_by_simulation_and_email,
     get_by_simulation_and_email_for_update,
 )
+from .repository_progress import (
+    ProgressCounters,
+    SessionProgress,
+    advance_counters,
+    counter_drift,
+    next_open_task_id,
+    progress_bulk,
+)
 from .repository_submissions import last_submission_at, last_submission_at_bulk
 from .repository_tasks import completed_task_ids, tasks_for_simulation
 from .repository_tokens import get_by_token, get_by_token_for_update, list_for_email
@@ -10,10 +18,17 @@ from .repository_tokens import get_by_token, get_by_token_for_update, list_for_e
 __all__ = [
     "get_by_id",
     "get_by_id_for_update",
+    "update_if_owner",
     "get_by_simulation_and_email",
     "get_by_simulation_and_email_for_update",
     "last_submission_at",
     "last_submission_at_bulk",
+    "SessionProgress",
+    "progress_bulk",
+    "ProgressCounters",
+    "advance_counters",
+    "counter_drift",
+    "next_open_task_id",
     "completed_task_ids",
     "tasks_for_simulation",
     "get_by_token",
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.domains import CandidateSession
 
 
-async def get_by_id(db: AsyncSession, session_id: int) -> CandidateSession | None:
-    res = await db.execute(
-        select(CandidateSession).where(CandidateSession.id == session_id)
-    )
+async def get_by_id(
+    db: AsyncSession, session_id: int, *, populate_existing: bool = False
+) -> CandidateSession | None:
+    stmt = select(CandidateSession).where(CandidateSession.id == session_id)
+    if populate_existing:
+        stmt = stmt.execution_options(populate_existing=True)
+    res = await db.execute(stmt)
     return res.scalar_one_or_none()
 
 
@@ -24,4 +30,36 @@ async def get_by_id_for_update(
     return res.scalar_one_or_none()
 
 
-__all__ = ["get_by_id", "get_by_id_for_update"]
+async def update_if_owner(
+    db: AsyncSession,
+    candidate_session: CandidateSession,
+    *,
+    expected_sub: str | None,
+    values: dict[str, Any],
+) -> bool:
+    """UPDATE ``values`` only while the session is still owned by ``expected_sub``.
+
+    ``None`` matches an unclaimed session, so concurrent claims cannot both
+    win. On a match the returned columns are applied to ``candidate_session``
+    without marking it dirty; does not commit.
+    """
+    owner = CandidateSession.candidate_auth0_sub
+    stmt = (
+        update(CandidateSession)
+        .where(
+            CandidateSession.id == candidate_session.id,
+            owner.is_(None) if expected_sub is None else owner == expected_sub,
+        )
+        .values(**values)
+        .returning(*(getattr(CandidateSession, field) for field in values))
+        .execution_options(synchronize_session=False)
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        return False
+    for field, value in zip(values, row, strict=True):
+        set_committed_value(candidate_session, field, value)
+    return True
+
+
+__all__ = ["get_by_id", "get_by_id_for_update", "update_if_owner"]
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import and_, case, distinct, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.domains import CandidateSession, Submission, Task
+
+
+@dataclass(frozen=True)
+class SessionProgress:
+    """Task progress of one candidate session."""
+
+    completed: int
+    total: int
+    # day_index of the first unsubmitted task; None once every task is done.
+    current_day_index: int | None
+
+
+async def progress_bulk(
+    db: AsyncSession, candidate_session_ids: list[int]
+) -> dict[int, SessionProgress]:
+    """Progress for many sessions in one grouped query over their tasks."""
+    if not candidate_session_ids:
+        return {}
+    stmt = (
+        select(
+            CandidateSession.id,
+            func.count(Task.id),
+            func.count(Submission.id),
+            func.min(case((Submission.id.is_(None), Task.day_index))),
+        )
+        .join(Task, Task.simulation_id == CandidateSession.simulation_id)
+        .outerjoin(
+            Submission,
+            and_(
+                Submission.candidate_session_id == CandidateSession.id,
+                Submission.task_id == Task.id,
+            ),
+        )
+        .where(CandidateSession.id.in_(candidate_session_ids))
+        .group_by(CandidateSession.id)
+    )
+    res = await db.execute(stmt)
+    return {
+        cs_id: SessionProgress(
+            completed=completed, total=total, current_day_index=current_day
+        )
+        for cs_id, total, completed, current_day in res.all()
+    }
+
+
+def _open_tasks(candidate_session_id, simulation_id):
+    return (
+        select(Task.id)
+        .where(
+            Task.simulation_id == simulation_id,
+            ~exists()
+            .where(
+                Submission.candidate_session_id == candidate_session_id,
+                Submission.task_id == Task.id,
+            )
+            .correlate_except(Submission),
+        )
+        .order_by(Task.day_index.asc())
+        .limit(1)
+    )
+
+
+async def next_open_task_id(
+    db: AsyncSession,
+    candidate_session: CandidateSession,
+    *,
+    submitted_task_id: int,
+) -> int | None:
+    """First task (by day_index) still unsubmitted once ``submitted_task_id`` is in."""
+    stmt = _open_tasks(candidate_session.id, candidate_session.simulation_id).where(
+        Task.id != submitted_task_id
+    )
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+_COUNTER_COLUMNS = (
+    "completed_task_count",
+    "current_task_id",
+    "last_submitted_at",
+    "status",
+    "completed_at",
+)
+
+
+async def advance_counters(
+    db: AsyncSession,
+    candidate_session: CandidateSession,
+    *,
+    submitted_task_id: int,
+    now: datetime,
+) -> None:
+    """Count a new submission of ``submitted_task_id`` in one UPDATE; does not commit.
+
+    The next current task is resolved inside the statement and the session is
+    completed when none is left; the returned values are applied to
+    ``candidate_session`` without marking it dirty.
+    """
+    next_task = (
+        _open_tasks(candidate_session.id, candidate_session.simulation_id)
+        .where(Task.id != submitted_task_id)
+        .scalar_subquery()
+    )
+    done = next_task.is_(None)
+    stmt = (
+        update(CandidateSession)
+        .where(CandidateSession.id == candidate_session.id)
+        .values(
+            completed_task_count=CandidateSession.completed_task_count + 1,
+            current_task_id=next_task,
+            last_submitted_at=now,
+            status=case((done, "completed"), else_=CandidateSession.status),
+            completed_at=case(
+                (and_(done, CandidateSession.completed_at.is_(None)), now),
+                else_=CandidateSession.completed_at,
+            ),
+        )
+        .returning(*(getattr(CandidateSession, col) for col in _COUNTER_COLUMNS))
+        .execution_options(synchronize_session=False)
+    )
+    row = (await db.execute(stmt)).one()
+    for col, value in zip(_COUNTER_COLUMNS, row, strict=True):
+        set_committed_value(candidate_session, col, value)
+
+
+@dataclass(frozen=True)
+class ProgressCounters:
+    """Progress counters of one candidate session as its submissions imply."""
+
+    candidate_session_id: int
+    completed_task_count: int
+    current_task_id: int | None
+    last_submitted_at: datetime | None
+
+
+async def counter_drift(
+    db: AsyncSession, candidate_session_ids: list[int] | None = None
+) -> list[ProgressCounters]:
+    """Sessions whose stored counters disagree with their submissions.
+
+    Returns the recomputed (correct) values, all sessions when no ids are given.
+    """
+    completed = (
+        select(func.count(distinct(Submission.task_id)))
+        .where(Submission.candidate_session_id == CandidateSession.id)
+        .scalar_subquery()
+    )
+    last_submitted = (
+        select(func.max(Submission.submitted_at))
+        .where(Submission.candidate_session_id == CandidateSession.id)
+        .scalar_subquery()
+    )
+    # Sessions without submissions keep a NULL current task (the first one).
+    current = case(
+        (completed == 0, None),
+        else_=_open_tasks(
+            CandidateSession.id, CandidateSession.simulation_id
+        ).scalar_subquery(),
+    )
+    stmt = (
+        select(CandidateSession.id, completed, current, last_submitted)
+        .where(
+            or_(
+                CandidateSession.completed_task_count != completed,
+                CandidateSession.current_task_id.is_distinct_from(current),
+                CandidateSession.last_submitted_at.is_distinct_from(last_submitted),
+            )
+        )
+        .order_by(CandidateSession.id)
+    )
+    if candidate_session_ids is not None:
+        stmt = stmt.where(CandidateSession.id.in_(candidate_session_ids))
+    res = await db.execute(stmt)
+    return [ProgressCounters(*row) for row in res.all()]
+
+
+__all__ = [
+    "ProgressCounters",
+    "SessionProgress",
+    "advance_counters",
+    "counter_drift",
+    "next_open_task_id",
+    "progress_bulk",
+]
@@ -3,17 +3,15 @@ from __future__ import annotations
 from sqlalchemy import distinct, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domains import Submission, Task
+from app.domains import Submission
+from app.repositories.tasks.snapshot_cache import TaskSnapshot, simulation_tasks
 
 
-async def tasks_for_simulation(db: AsyncSession, simulation_id: int) -> list[Task]:
-    tasks_stmt = (
-        select(Task)
-        .where(Task.simulation_id == simulation_id)
-        .order_by(Task.day_index.asc())
-    )
-    tasks_res = await db.execute(tasks_stmt)
-    return list(tasks_res.scalars().all())
+async def tasks_for_simulation(
+    db: AsyncSession, simulation_id: int
+) -> list[TaskSnapshot]:
+    """Ordered task snapshots, served from the process task cache."""
+    return list(await simulation_tasks(db, simulation_id))
 
 
 async def completed_task_ids(db: AsyncSession, candidate_session_id: int) -> set[int]:
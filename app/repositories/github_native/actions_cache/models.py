@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db.base import Base
+
+
+class ActionsCacheEntry(Base):
+    """Cached GitHub Actions state shared by all API workers."""
+
+    __tablename__ = "github_actions_cache"
+
+    key: Mapped[str] = mapped_column(String(512), primary_key=True)
+    value_json: Mapped[str] = mapped_column(Text, nullable=False)
+    expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.repositories.github_native.actions_cache.models import ActionsCacheEntry
+
+# Expired rows are swept after this many writes rather than on every read.
+PURGE_EVERY_WRITES = 256
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+class DatabaseActionsCacheBackend:
+    """``ActionsCacheBackend`` stored in the application database.
+
+    Every worker shares the same rows, so a run fetched or parsed by one
+    worker is reused by the others.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        self._session_maker = session_maker
+        self._writes = 0
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        async with self._session_maker() as db:
+            entry = await db.get(ActionsCacheEntry, key)
+        if entry is None:
+            return None
+        if entry.expires_at and _aware(entry.expires_at) <= datetime.now(UTC):
+            return None
+        return json.loads(entry.value_json)
+
+    async def set(
+        self, key: str, value: dict[str, Any], *, ttl_seconds: float | None
+    ) -> None:
+        now = datetime.now(UTC)
+        value_json = json.dumps(value, ensure_ascii=False)
+        expires_at = now + timedelta(seconds=ttl_seconds) if ttl_seconds else None
+        async with self._session_maker() as db:
+            entry = await db.get(ActionsCacheEntry, key)
+            if entry is None:
+                db.add(
+                    ActionsCacheEntry(
+                        key=key, value_json=value_json, expires_at=expires_at
+                    )
+                )
+            else:
+                entry.value_json = value_json
+                entry.expires_at = expires_at
+            try:
+                await db.commit()
+            except IntegrityError:
+                # Another worker inserted the same key first; last write wins.
+                await db.rollback()
+                entry = await db.get(ActionsCacheEntry, key)
+                if entry is not None:
+                    entry.value_json = value_json
+                    entry.expires_at = expires_at
+                    await db.commit()
+            self._writes += 1
+            if self._writes % PURGE_EVERY_WRITES == 0:
+                await self._purge_expired(db, now)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        async with self._session_maker() as db:
+            await db.execute(
+                delete(ActionsCacheEntry).where(ActionsCacheEntry.key.in_(keys))
+            )
+            await db.commit()
+
+    async def delete_prefix(self, prefix: str) -> None:
+        async with self._session_maker() as db:
+            await db.execute(
+                delete(ActionsCacheEntry).where(
+                    ActionsCacheEntry.key.startswith(prefix, autoescape=True)
+                )
+            )
+            await db.commit()
+
+    @staticmethod
+    async def _purge_expired(db: AsyncSession, now: datetime) -> None:
+        await db.execute(
+            delete(ActionsCacheEntry).where(ActionsCacheEntry.expires_at <= now)
+        )
+        await db.commit()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db.base import Base
+
+
+class WorkflowRunResult(Base):
+    """Normalized result of a finished workflow run; immutable once written."""
+
+    __tablename__ = "workflow_run_results"
+    __table_args__ = (
+        UniqueConstraint(
+            "repo_full_name", "run_id", name="uq_workflow_run_results_repo_run"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    repo_full_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    run_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    conclusion: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    passed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    failed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    stdout: Mapped[str | None] = mapped_column(Text, nullable=True)
+    stderr: Mapped[str | None] = mapped_column(Text, nullable=True)
+    head_sha: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    html_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    raw_json: Mapped[str | None] = mapped_column(
+        Text, nullable=True
+    )  # JSON string with run metadata and parsed summary
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.github_native.workflow_runs.models import WorkflowRunResult
+
+
+async def get_by_repo_and_run(
+    db: AsyncSession, *, repo_full_name: str, run_id: int
+) -> WorkflowRunResult | None:
+    """Fetch the stored result for a workflow run, if it finished before."""
+    stmt = select(WorkflowRunResult).where(
+        WorkflowRunResult.repo_full_name == repo_full_name,
+        WorkflowRunResult.run_id == run_id,
+    )
+    res = await db.execute(stmt)
+    return res.scalar_one_or_none()
+
+
+async def add_if_absent(db: AsyncSession, record: WorkflowRunResult) -> bool:
+    """Stage ``record`` unless a result for the same run already exists.
+
+    Does not commit. Returns False when the run was already stored,
+    including when a concurrent writer inserted it first.
+    """
+    existing = await get_by_repo_and_run(
+        db, repo_full_name=record.repo_full_name, run_id=record.run_id
+    )
+    if existing is not None:
+        return False
+    try:
+        async with db.begin_nested():
+            db.add(record)
+    except IntegrityError:
+        return False
+    return True
@@ -44,6 +44,18 @@ class Workspace(Base):
     last_test_summary_json: Mapped[str | None] = mapped_column(
         String, nullable=True
     )  # JSON string with counts/output
+    # Set while the background poller owns completing last_workflow_run_id.
+    pending_run_dispatched_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+    # Last background poll of the pending run; the poller serves oldest first.
+    pending_run_checked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+    # Inputs of the last dispatched run as sorted JSON; NULL means none given.
+    last_workflow_inputs_json: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Workflow file that last dispatched here; tried first on the next run.
+    workflow_file: Mapped[str | None] = mapped_column(String(255), nullable=True)
     codespace_name: Mapped[str | None] = mapped_column(String(200), nullable=True)
     codespace_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     codespace_state: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -45,3 +45,37 @@ async def create_workspace(
     await db.commit()
     await db.refresh(ws)
     return ws
+
+
+async def list_pending_runs(db: AsyncSession, *, limit: int = 50) -> list[Workspace]:
+    """Workspaces whose last dispatched run is awaiting background completion.
+
+    Never-polled runs come first, then the least recently polled, so a backlog
+    larger than ``limit`` rotates instead of starving the newest runs.
+    """
+    stmt = (
+        select(Workspace)
+        .where(
+            Workspace.pending_run_dispatched_at.is_not(None),
+            Workspace.last_workflow_run_id.is_not(None),
+        )
+        .order_by(
+            Workspace.pending_run_checked_at.asc().nulls_first(),
+            Workspace.pending_run_dispatched_at,
+        )
+        .limit(limit)
+    )
+    res = await db.execute(stmt)
+    return list(res.scalars().all())
+
+
+async def lock_by_ids(db: AsyncSession, workspace_ids: list[int]) -> list[Workspace]:
+    """Re-read workspaces from the database and lock them until commit."""
+    stmt = (
+        select(Workspace)
+        .where(Workspace.id.in_(workspace_ids))
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    res = await db.execute(stmt)
+    return list(res.scalars().all())
@@ -3,7 +3,8 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domains import Simulation, Task
+from app.domains import Simulation
+from app.repositories.tasks.snapshot_cache import TaskSnapshot, simulation_tasks
 
 
 async def get_owned(
@@ -19,14 +20,9 @@ async def get_owned(
 
 async def get_owned_with_tasks(
     db: AsyncSession, simulation_id: int, user_id: int
-) -> tuple[Simulation | None, list[Task]]:
-    """Fetch a simulation with tasks if owned by given user."""
+) -> tuple[Simulation | None, list[TaskSnapshot]]:
+    """Fetch a simulation with its (cached) task snapshots if owned by given user."""
     sim = await get_owned(db, simulation_id, user_id)
     if sim is None:
         return None, []
-
-    tasks_stmt = (
-        select(Task).where(Task.simulation_id == sim.id).order_by(Task.day_index.asc())
-    )
-    tasks = (await db.execute(tasks_stmt)).scalars().all()
-    return sim, tasks
+    return sim, list(await simulation_tasks(db, sim.id))
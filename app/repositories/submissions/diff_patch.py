@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, LargeBinary, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db.base import Base
+
+
+class SubmissionDiffPatch(Base):
+    """Compressed per-file patches of a submission's diff, kept off the main row.
+
+    ``Submission.diff_summary_json`` holds only per-file stats; the patch text
+    lives here and is read by the detail view alone.
+    """
+
+    __tablename__ = "submission_diff_patches"
+
+    submission_id: Mapped[int] = mapped_column(
+        ForeignKey("submissions.id", ondelete="CASCADE"), primary_key=True
+    )
+    patches_zlib: Mapped[bytes] = mapped_column(
+        LargeBinary, nullable=False
+    )  # zlib-compressed JSON object: filename -> patch
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.submissions.submission_job import SubmissionJob
+
+
+async def get_by_submission(
+    db: AsyncSession, submission_id: int
+) -> SubmissionJob | None:
+    """Fetch the enrichment job for a submission, if one was queued."""
+    stmt = select(SubmissionJob).where(SubmissionJob.submission_id == submission_id)
+    res = await db.execute(stmt)
+    return res.scalar_one_or_none()
+
+
+async def enqueue(
+    db: AsyncSession, *, submission_id: int, payload_json: str | None, now: datetime
+) -> SubmissionJob:
+    """Stage a pending job for ``submission_id`` unless one already exists.
+
+    Does not commit. Jobs are keyed by submission, so enqueueing twice
+    returns the job that is already queued.
+    """
+    existing = await get_by_submission(db, submission_id)
+    if existing is not None:
+        return existing
+    job = SubmissionJob(
+        submission_id=submission_id,
+        status="pending",
+        attempts=0,
+        next_attempt_at=now,
+        payload_json=payload_json,
+    )
+    try:
+        async with db.begin_nested():
+            db.add(job)
+    except IntegrityError:
+        return await get_by_submission(db, submission_id)
+    return job
+
+
+def _claimable(now: datetime):
+    return or_(
+        and_(SubmissionJob.status == "pending", SubmissionJob.next_attempt_at <= now),
+        # A running job whose lease lapsed belongs to a worker that died.
+        and_(
+            SubmissionJob.status == "running",
+            SubmissionJob.lease_expires_at < now,
+        ),
+    )
+
+
+async def claim_due(
+    db: AsyncSession,
+    *,
+    owner: str,
+    now: datetime,
+    lease_seconds: float,
+    limit: int = 10,
+) -> list[int]:
+    """Lease up to ``limit`` due jobs for ``owner`` and commit.
+
+    Each job is claimed with a conditional UPDATE that only matches while it
+    is still claimable, so concurrent workers never lease the same job.
+    """
+    stmt = (
+        select(SubmissionJob.id)
+        .where(_claimable(now))
+        .order_by(SubmissionJob.next_attempt_at, SubmissionJob.id)
+        .limit(limit)
+    )
+    candidates = (await db.execute(stmt)).scalars().all()
+    claimed: list[int] = []
+    for job_id in candidates:
+        res = await db.execute(
+            update(SubmissionJob)
+            .where(SubmissionJob.id == job_id, _claimable(now))
+            .values(
+                status="running",
+                lease_owner=owner,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if res.rowcount == 1:
+            claimed.append(job_id)
+    await db.commit()
+    return claimed
+
+
+async def confirm_lease(
+    db: AsyncSession, job_id: int, *, owner: str, now: datetime
+) -> bool:
+    """Whether ``owner`` still holds an unexpired lease on the job; no commit.
+
+    The check is a conditional UPDATE, so the row stays locked until the
+    caller commits and no other worker can claim the job in between.
+    """
+    res = await db.execute(
+        update(SubmissionJob)
+        .where(
+            SubmissionJob.id == job_id,
+            SubmissionJob.status == "running",
+            SubmissionJob.lease_owner == owner,
+            SubmissionJob.lease_expires_at >= now,
+        )
+        .values(updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    return res.rowcount == 1
+
+
+def release(
+    job: SubmissionJob, *, status: str, now: datetime, next_attempt_at=None
+) -> None:
+    """Drop the lease and move ``job`` to ``status``; does not commit."""
+    job.status = status
+    job.lease_owner = None
+    job.lease_expires_at = None
+    job.updated_at = now
+    if next_attempt_at is not None:
+        job.next_attempt_at = next_attempt_at
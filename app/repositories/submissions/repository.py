@@ -3,7 +3,7 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domains import Simulation, Submission
+from app.domains import Simulation, Submission, SubmissionDiffPatch
 
 
 async def find_duplicate(
@@ -30,3 +30,22 @@ async def simulation_template(db: AsyncSession, simulation_id: int) -> str | Non
         return None
     scenario_template, focus = row
     return scenario_template or focus
+
+
+async def get_diff_patches(
+    db: AsyncSession, submission_id: int
+) -> SubmissionDiffPatch | None:
+    """Return the stored patch blob for a submission, if it has one."""
+    return await db.get(SubmissionDiffPatch, submission_id)
+
+
+async def stage_diff_patches(
+    db: AsyncSession, submission_id: int, *, patches_zlib: bytes
+) -> SubmissionDiffPatch:
+    """Stage (or replace) a submission's patch blob; does not commit."""
+    record = await get_diff_patches(db, submission_id)
+    if record is None:
+        record = SubmissionDiffPatch(submission_id=submission_id)
+        db.add(record)
+    record.patches_zlib = patches_zlib
+    return record
@@ -1,6 +1,8 @@
 from datetime import datetime
 
 from sqlalchemy import (
+    JSON,
+    Boolean,
     DateTime,
     ForeignKey,
     Index,
@@ -25,6 +27,7 @@ class Submission(Base):
             name="uq_submissions_candidate_session_task",
         ),
         Index("ix_submissions_candidate_session_id", "candidate_session_id"),
+        Index("ix_submissions_submitted_at_id", "submitted_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -44,6 +47,30 @@ class Submission(Base):
     last_run_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Recruiter list fields derived from test_output/diff_summary_json when
+    # the submission or its run result is written (materialize_list_fields).
+    tests_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    test_status: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    test_run_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    test_conclusion: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    test_timeout: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    test_stdout_preview: Mapped[str | None] = mapped_column(Text, nullable=True)
+    test_stdout_truncated: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    test_stderr_preview: Mapped[str | None] = mapped_column(Text, nullable=True)
+    test_stderr_truncated: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    test_summary: Mapped[dict | None] = mapped_column(
+        JSON(none_as_null=True), nullable=True
+    )
+    test_artifact_present: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    test_artifact_error: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    diff_base: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    diff_head: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    diff_files_changed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    diff_additions: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    diff_deletions: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # processing -> ready | failed while a SubmissionJob enriches the row;
+    # null for submissions completed inline.
+    processing_status: Mapped[str | None] = mapped_column(String(20), nullable=True)
 
     candidate_session = relationship("CandidateSession", back_populates="submissions")
     task = relationship("Task", back_populates="submissions")
@@ -4,9 +4,15 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domains import Task
+from app.repositories.tasks.snapshot_cache import TaskSnapshot, task_by_id
 
 
 async def get_by_id(db: AsyncSession, task_id: int) -> Task | None:
     """Return task by id."""
     res = await db.execute(select(Task).where(Task.id == task_id))
     return res.scalar_one_or_none()
+
+
+async def get_snapshot(db: AsyncSession, task_id: int) -> TaskSnapshot | None:
+    """Return a read-only task snapshot by id from the process task cache."""
+    return await task_by_id(db, task_id)
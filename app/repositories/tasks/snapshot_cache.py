@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from app.core.perf.metrics import register_metrics_provider
+from app.core.settings import settings
+from app.domains import Task
+
+_FIELDS = (
+    "id",
+    "simulation_id",
+    "day_index",
+    "type",
+    "title",
+    "description",
+    "starter_code_path",
+    "test_file_path",
+    "template_repo",
+    "max_score",
+)
+
+
+class TaskSnapshot:
+    """Read-only copy of a task row, detached from any session."""
+
+    __slots__ = _FIELDS
+
+    def __init__(self, **values: Any) -> None:
+        for field in _FIELDS:
+            object.__setattr__(self, field, values[field])
+
+    @classmethod
+    def from_task(cls, task: Task) -> TaskSnapshot:
+        return cls(**{field: getattr(task, field) for field in _FIELDS})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return (
+            f"TaskSnapshot(id={self.id}, simulation_id={self.simulation_id}, "
+            f"day_index={self.day_index})"
+        )
+
+
+class TaskSnapshotCache:
+    """Per-process LRU of each simulation's ordered tasks, indexed by task id too.
+
+    Bounded by ``max_simulations``; evicting a simulation drops its tasks from
+    the id index. Tasks are written once when a simulation is created, so
+    entries never expire; edits go through ``invalidate_simulation``.
+    """
+
+    def __init__(self, *, max_simulations: int) -> None:
+        self.max_simulations = max_simulations
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._by_simulation: OrderedDict[int, tuple[TaskSnapshot, ...]] = OrderedDict()
+        self._by_id: dict[int, TaskSnapshot] = {}
+
+    def get_simulation(self, simulation_id: int) -> tuple[TaskSnapshot, ...] | None:
+        tasks = self._by_simulation.get(simulation_id)
+        if tasks is None:
+            self.misses += 1
+            return None
+        self._by_simulation.move_to_end(simulation_id)
+        self.hits += 1
+        return tasks
+
+    def get_task(self, task_id: int) -> TaskSnapshot | None:
+        task = self._by_id.get(task_id)
+        if task is None:
+            self.misses += 1
+            return None
+        self._by_simulation.move_to_end(task.simulation_id)
+        self.hits += 1
+        return task
+
+    def put(self, simulation_id: int, tasks: list[Task]) -> tuple[TaskSnapshot, ...]:
+        """Snapshot ``tasks`` (ordered by day_index) for ``simulation_id``."""
+        snapshots = tuple(TaskSnapshot.from_task(task) for task in tasks)
+        if not snapshots:
+            # A simulation is seeded in one transaction; never pin "no tasks".
+            return snapshots
+        self._drop(simulation_id)
+        self._by_simulation[simulation_id] = snapshots
+        self._by_id.update((task.id, task) for task in snapshots)
+        while len(self._by_simulation) > self.max_simulations:
+            self._drop(next(iter(self._by_simulation)))
+            self.evictions += 1
+        return snapshots
+
+    def invalidate_simulation(self, simulation_id: int | None) -> None:
+        if simulation_id in self._by_simulation:
+            self._drop(simulation_id)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        if self._by_simulation:
+            self.invalidations += 1
+        self._by_simulation.clear()
+        self._by_id.clear()
+
+    def _drop(self, simulation_id: int) -> None:
+        for task in self._by_simulation.pop(simulation_id, ()):
+            self._by_id.pop(task.id, None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "simulations": len(self._by_simulation),
+            "tasks": len(self._by_id),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+task_cache = TaskSnapshotCache(max_simulations=settings.TASK_CACHE_MAX_SIMULATIONS)
+register_metrics_provider("task_snapshot_cache", task_cache.stats)
+
+
+async def simulation_tasks(
+    db: AsyncSession, simulation_id: int
+) -> tuple[TaskSnapshot, ...]:
+    """Ordered task snapshots for a simulation, loading them on a cache miss."""
+    cached = task_cache.get_simulation(simulation_id)
+    if cached is not None:
+        return cached
+    stmt = (
+        select(Task)
+        .where(Task.simulation_id == simulation_id)
+        .order_by(Task.day_index.asc())
+    )
+    return task_cache.put(simulation_id, list((await db.scalars(stmt)).all()))
+
+
+async def task_by_id(db: AsyncSession, task_id: int) -> TaskSnapshot | None:
+    """Snapshot of one task; a miss caches its whole simulation in one query."""
+    cached = task_cache.get_task(task_id)
+    if cached is not None:
+        return cached
+    simulation_id = (
+        select(Task.simulation_id).where(Task.id == task_id).scalar_subquery()
+    )
+    stmt = (
+        select(Task)
+        .where(Task.simulation_id == simulation_id)
+        .order_by(Task.day_index.asc())
+    )
+    tasks = list((await db.scalars(stmt)).all())
+    if not tasks:
+        return None
+    snapshots = task_cache.put(tasks[0].simulation_id, tasks)
+    return next((task for task in snapshots if task.id == task_id), None)
+
+
+def invalidate_simulation_tasks(simulation_id: int) -> None:
+    """Drop a simulation's cached tasks; call after editing its task rows."""
+    task_cache.invalidate_simulation(simulation_id)
+
+
+def clear_task_cache() -> None:
+    task_cache.clear()
+
+
+# ORM writes to task rows invalidate automatically once their transaction
+# commits: dropping entries at flush would let a concurrent reader re-cache the
+# still-committed rows. Other processes keep their own cache, so out-of-band
+# edits still need a restart or explicit hook call.
+_STALE_KEY = "task_cache_stale_simulations"
+_CLEAR_KEY = "task_cache_clear_all"
+
+
+@event.listens_for(Task, "after_insert")
+@event.listens_for(Task, "after_update")
+@event.listens_for(Task, "after_delete")
+def _collect_on_write(_mapper, _connection, target: Task) -> None:
+    session = object_session(target)
+    if session is None:
+        return
+    stale = session.info.setdefault(_STALE_KEY, set())
+    stale.add(target.simulation_id)
+    # A task moved between simulations leaves its old one stale as well.
+    stale.update(inspect(target).attrs.simulation_id.history.deleted or ())
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_on_bulk_write(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is Task:
+        orm_execute_state.session.info[_CLEAR_KEY] = True
+
+
+def _apply_pending(session: Session) -> None:
+    if session.info.pop(_CLEAR_KEY, False):
+        task_cache.clear()
+    for simulation_id in session.info.pop(_STALE_KEY, ()):
+        task_cache.invalidate_simulation(simulation_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    _apply_pending(session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _invalidate_on_rollback(session: Session, transaction) -> None:
+    # The session may have cached its own flushed rows before rolling back.
+    if transaction.parent is None:
+        _apply_pending(session)
+
+
+__all__ = [
+    "TaskSnapshot",
+    "TaskSnapshotCache",
+    "clear_task_cache",
+    "invalidate_simulation_tasks",
+    "simulation_tasks",
+    "task_by_id",
+    "task_cache",
+]
@@ -81,6 +81,7 @@ class SubmissionCreateResponse(APIModel):
     submittedAt: datetime
     progress: ProgressSummary
     isComplete: bool
+    processingStatus: str | None = None
 
 
 class RecruiterTaskMetaOut(APIModel):
@@ -128,6 +129,30 @@ class RecruiterTestResultsOut(APIModel):
     commitUrl: str | None = None
 
 
+class RecruiterDiffTotalsOut(APIModel):
+    """Diff totals shown in submission lists.
+
+    Per-file entries and the compare's commit counts (``files``,
+    ``ahead_by``, ``behind_by``, ``total_commits``) are only returned by the
+    detail endpoint.
+    """
+
+    base: str | None = None
+    head: str | None = None
+    filesChanged: int | None = None
+    additions: int | None = None
+    deletions: int | None = None
+
+
+class RecruiterSubmissionProcessingOut(APIModel):
+    """Schema for background enrichment state of a submission."""
+
+    status: str
+    attempts: int
+    nextAttemptAt: datetime | None = None
+    lastError: str | None = None
+
+
 class RecruiterSubmissionDetailOut(APIModel):
     """Schema for recruiter submission details output."""
 
@@ -142,6 +167,8 @@ class RecruiterSubmissionDetailOut(APIModel):
     workflowUrl: str | None = None
     commitUrl: str | None = None
     diffUrl: str | None = None
+    processingStatus: str | None = None
+    processing: RecruiterSubmissionProcessingOut | None = None
 
 
 class RecruiterSubmissionListItemOut(APIModel):
@@ -160,7 +187,7 @@ class RecruiterSubmissionListItemOut(APIModel):
     workflowUrl: str | None = None
     commitUrl: str | None = None
     diffUrl: str | None = None
-    diffSummary: dict[str, object] | str | None = None
+    diffSummary: RecruiterDiffTotalsOut | None = None
     testResults: RecruiterTestResultsOut | None = None
 
 
@@ -168,4 +195,5 @@ class RecruiterSubmissionListOut(APIModel):
     """Schema for recruiter submission list output."""
 
     items: list[RecruiterSubmissionListItemOut]
-    # Extend here if pagination is added later; keep per-item fields on the list item.
+    # Opaque keyset cursor for the next page; null on the last page or without limit.
+    nextCursor: str | None = None
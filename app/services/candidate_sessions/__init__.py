@@ -13,10 +13,15 @@ from app.domains.candidate_sessions.service.ownership import (
     ensure_candidate_ownership as _ensure_candidate_ownership,
 )
 from app.domains.candidate_sessions.service.progress import (
+    advance_progress,
     completed_task_ids,
     load_tasks,
+    progress_counters,
     progress_snapshot,
 )
+from app.domains.candidate_sessions.service.progress_check import (
+    check_progress_counters,
+)
 from app.domains.candidate_sessions.service.status import (
     mark_in_progress,
     require_not_expired,
@@ -24,7 +29,9 @@ from app.domains.candidate_sessions.service.status import (
 
 __all__ = [
     "cs_repo",
+    "advance_progress",
     "claim_invite_with_principal",
+    "check_progress_counters",
     "completed_task_ids",
     "fetch_by_token",
     "fetch_by_token_for_update",
@@ -32,6 +39,7 @@ __all__ = [
     "invite_list_for_principal",
     "load_tasks",
     "mark_in_progress",
+    "progress_counters",
     "progress_snapshot",
     "require_not_expired",
     "_normalize_email",
@@ -2,42 +2,51 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
+from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth.principal import Principal
 from app.domains import CandidateSession
 from app.domains.candidate_sessions import repository as cs_repo
 from app.domains.candidate_sessions.service.fetch_owned_helpers import (
-    apply_auth_updates,
+    auth_update_values,
     ensure_can_access,
 )
-from app.domains.candidate_sessions.service.ownership import ensure_candidate_ownership
+from app.domains.candidate_sessions.service.ownership import claim_values
 
 
 async def fetch_owned_session(
     db: AsyncSession, session_id: int, principal: Principal, *, now=None
 ) -> CandidateSession:
+    """Load a session the principal owns, binding an unclaimed invite on first use.
+
+    The common case is one plain SELECT. Binding and auth/status syncs are
+    conditional UPDATEs issued only when something changed, so concurrent
+    requests never wait on a row lock.
+    """
     now = now or datetime.now(UTC)
     cs = ensure_can_access(await cs_repo.get_by_id(db, session_id), principal, now=now)
-    if cs.candidate_auth0_sub:
-        if apply_auth_updates(cs, principal, now=now):
-            await db.commit()
-            await db.refresh(cs)
+    owner = cs.candidate_auth0_sub
+    values = auth_update_values(cs, principal, now=now)
+    if not owner:
+        values.update(claim_values(cs, principal, now=now))
+    if not values:
         return cs
 
-    changed = False
-    async with db.begin_nested():
-        cs = ensure_can_access(
-            await cs_repo.get_by_id_for_update(db, session_id),
-            principal,
-            now=now,
-            allow_missing=False,
-        )
-        changed = ensure_candidate_ownership(cs, principal, now=now) or changed
-        changed = apply_auth_updates(cs, principal, now=now) or changed
-    if changed:
+    if await cs_repo.update_if_owner(db, cs, expected_sub=owner, values=values):
         await db.commit()
-        await db.refresh(cs)
+        return cs
+
+    # Another request claimed or changed the session first; re-check once.
+    cs = ensure_can_access(
+        await cs_repo.get_by_id(db, session_id, populate_existing=True),
+        principal,
+        now=now,
+    )
+    if cs.candidate_auth0_sub != principal.sub:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Candidate session not found"
+        )
     return cs
 
 
@@ -7,10 +7,7 @@ from fastapi import HTTPException, status
 from app.core.auth.principal import Principal
 from app.domains import CandidateSession
 from app.domains.candidate_sessions.service.email import normalize_email
-from app.domains.candidate_sessions.service.status import (
-    mark_in_progress,
-    require_not_expired,
-)
+from app.domains.candidate_sessions.service.status import require_not_expired
 
 _NOT_FOUND = HTTPException(
     status_code=status.HTTP_404_NOT_FOUND, detail="Candidate session not found"
@@ -30,19 +27,19 @@ def ensure_can_access(
     return cs
 
 
-def apply_auth_updates(cs: CandidateSession, principal: Principal, *, now) -> bool:
-    changed = False
+def auth_update_values(cs: CandidateSession, principal: Principal, *, now) -> dict:
+    """Fields to sync from ``principal`` on access; empty when nothing changed."""
+    values = {}
     email = normalize_email(principal.email)
     if email and getattr(cs, "candidate_auth0_email", None) is None:
-        cs.candidate_auth0_email = email
-        changed = True
+        values["candidate_auth0_email"] = email
     if email and cs.candidate_email != email:
-        cs.candidate_email = email
-        changed = True
+        values["candidate_email"] = email
     if cs.status == "not_started":
-        mark_in_progress(cs, now=now)
-        changed = True
-    return changed
+        values["status"] = "in_progress"
+        if getattr(cs, "started_at", None) is None:
+            values["started_at"] = now
+    return values
 
 
-__all__ = ["apply_auth_updates", "ensure_can_access"]
+__all__ = ["auth_update_values", "ensure_can_access"]
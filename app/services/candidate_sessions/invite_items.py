@@ -1,25 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.domains import Task
 from app.domains.candidate_sessions.schemas import (
     CandidateInviteListItem,
     ProgressSummary,
 )
-from app.services.candidate_sessions.progress import progress_snapshot
+from app.repositories.candidate_sessions.repository_progress import SessionProgress
 
 
-async def build_invite_item(
-    db: AsyncSession,
+def build_invite_item(
     candidate_session,
     *,
     now: datetime,
     last_submitted_map: dict[int, datetime | None],
-    tasks_loader: Callable[[int], Awaitable[list[Task]]],
+    progress_map: dict[int, SessionProgress],
 ) -> CandidateInviteListItem:
     expires_at = candidate_session.expires_at
     expires_at = (
@@ -28,10 +23,7 @@ async def build_invite_item(
         else expires_at
     )
     is_expired = bool(expires_at and expires_at < now)
-    task_list = await tasks_loader(candidate_session.simulation_id)
-    _, completed_ids, _, completed, total, _ = await progress_snapshot(
-        db, candidate_session, tasks=task_list
-    )
+    progress = progress_map.get(candidate_session.id)
     last_submitted_at = last_submitted_map.get(candidate_session.id)
     last_activity = (
         last_submitted_at
@@ -47,7 +39,10 @@ async def build_invite_item(
         role=sim.role if sim else "",
         companyName=company_name,
         status=candidate_session.status,
-        progress=ProgressSummary(completed=completed, total=total),
+        progress=ProgressSummary(
+            completed=progress.completed if progress else 0,
+            total=progress.total if progress else 0,
+        ),
         lastActivityAt=last_activity,
         inviteCreatedAt=getattr(candidate_session, "created_at", None),
         expiresAt=candidate_session.expires_at,
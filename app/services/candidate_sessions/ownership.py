@@ -16,6 +16,29 @@ def ensure_email_verified(principal: Principal) -> None:
         _fail(status.HTTP_403_FORBIDDEN, "Email verification required")
 
 
+def claim_values(
+    candidate_session: CandidateSession, principal: Principal, *, now
+) -> dict:
+    """Validate ``principal`` against an unclaimed invite; return the binding fields."""
+    ensure_email_verified(principal)
+    email = normalize_email(principal.email)
+    if not email:
+        _fail(status.HTTP_403_FORBIDDEN, "Email claim missing")
+
+    invite_email = normalize_email(candidate_session.invite_email)
+    if invite_email != email:
+        _fail(status.HTTP_404_NOT_FOUND, "Candidate session not found")
+
+    values = {
+        "candidate_auth0_sub": principal.sub,
+        "candidate_auth0_email": email,
+        "candidate_email": email,
+    }
+    if getattr(candidate_session, "claimed_at", None) is None:
+        values["claimed_at"] = now
+    return values
+
+
 def ensure_candidate_ownership(
     candidate_session: CandidateSession, principal: Principal, *, now
 ) -> bool:
@@ -33,18 +56,6 @@ def ensure_candidate_ownership(
             changed = True
         return changed
 
-    ensure_email_verified(principal)
-    email = normalize_email(principal.email)
-    if not email:
-        _fail(status.HTTP_403_FORBIDDEN, "Email claim missing")
-
-    invite_email = normalize_email(candidate_session.invite_email)
-    if invite_email != email:
-        _fail(status.HTTP_404_NOT_FOUND, "Candidate session not found")
-
-    candidate_session.candidate_auth0_sub = principal.sub
-    candidate_session.candidate_auth0_email = email
-    candidate_session.candidate_email = email
-    if getattr(candidate_session, "claimed_at", None) is None:
-        candidate_session.claimed_at = now
+    for field, value in claim_values(candidate_session, principal, now=now).items():
+        setattr(candidate_session, field, value)
     return True
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domains import CandidateSession, Task
@@ -8,17 +10,22 @@ from app.domains.candidate_sessions.progress import (
     compute_current_task,
     summarize_progress,
 )
+from app.domains.tasks.snapshot_cache import TaskSnapshot
+
+
+def _no_tasks():
+    from fastapi import HTTPException, status
+
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail="Simulation has no tasks",
+    )
 
 
-async def load_tasks(db: AsyncSession, simulation_id: int) -> list[Task]:
+async def load_tasks(db: AsyncSession, simulation_id: int) -> list[TaskSnapshot]:
     tasks = await cs_repo.tasks_for_simulation(db, simulation_id)
     if not tasks:
-        from fastapi import HTTPException, status
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Simulation has no tasks",
-        )
+        raise _no_tasks()
     return tasks
 
 
@@ -30,10 +37,47 @@ async def progress_snapshot(
     db: AsyncSession,
     candidate_session: CandidateSession,
     *,
-    tasks: list[Task] | None = None,
-) -> tuple[list[Task], set[int], Task | None, int, int, bool]:
+    tasks: list[TaskSnapshot] | None = None,
+) -> tuple[list[TaskSnapshot], set[int], TaskSnapshot | None, int, int, bool]:
     task_list = tasks or await load_tasks(db, candidate_session.simulation_id)
     completed_ids = await completed_task_ids(db, candidate_session.id)
     current = compute_current_task(task_list, completed_ids)
     completed, total, is_complete = summarize_progress(len(task_list), completed_ids)
     return task_list, completed_ids, current, completed, total, is_complete
+
+
+async def progress_counters(
+    db: AsyncSession, candidate_session: CandidateSession
+) -> tuple[TaskSnapshot | None, int, int, bool]:
+    """Return (current_task, completed, total, is_complete) from the session's counters.
+
+    The task list comes from the process task cache, so a warm read is free.
+    """
+    tasks = await load_tasks(db, candidate_session.simulation_id)
+    if candidate_session.current_task_id is not None:
+        current = next(
+            (t for t in tasks if t.id == candidate_session.current_task_id), None
+        )
+    elif not candidate_session.completed_task_count:
+        current = tasks[0]
+    else:
+        current = None
+    total = len(tasks)
+    completed = min(candidate_session.completed_task_count or 0, total)
+    return current, completed, total, current is None
+
+
+async def advance_progress(
+    db: AsyncSession,
+    candidate_session: CandidateSession,
+    task: Task | TaskSnapshot,
+    *,
+    now: datetime,
+) -> None:
+    """Stage the counter update for a new submission of ``task``.
+
+    Completes the session when no task is left; the caller commits.
+    """
+    await cs_repo.advance_counters(
+        db, candidate_session, submitted_task_id=task.id, now=now
+    )
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domains import CandidateSession
+from app.domains.candidate_sessions import repository as cs_repo
+
+
+async def check_progress_counters(
+    db: AsyncSession,
+    candidate_session_ids: list[int] | None = None,
+    *,
+    repair: bool = False,
+) -> list[cs_repo.ProgressCounters]:
+    """Compare stored progress counters with the sessions' submissions.
+
+    Returns the recomputed counters of every drifted session; with ``repair``
+    they are written back and committed.
+    """
+    drift = await cs_repo.counter_drift(db, candidate_session_ids)
+    if repair and drift:
+        await db.execute(
+            update(CandidateSession),
+            [
+                {
+                    "id": counters.candidate_session_id,
+                    "completed_task_count": counters.completed_task_count,
+                    "current_task_id": counters.current_task_id,
+                    "last_submitted_at": counters.last_submitted_at,
+                }
+                for counters in drift
+            ],
+        )
+        await db.commit()
+    return drift
+
+
+__all__ = ["check_progress_counters"]
@@ -3,7 +3,8 @@ from __future__ import annotations
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domains import Simulation, Task
+from app.domains import Simulation
+from app.domains.tasks.snapshot_cache import TaskSnapshot
 
 
 async def require_owned_simulation(
@@ -21,7 +22,7 @@ async def require_owned_simulation(
 
 async def require_owned_simulation_with_tasks(
     db: AsyncSession, simulation_id: int, user_id: int
-) -> tuple[Simulation, list[Task]]:
+) -> tuple[Simulation, list[TaskSnapshot]]:
     from app.domains.simulations import service as sim_service
 
     sim, tasks = await sim_service.sim_repo.get_owned_with_tasks(
@@ -13,7 +13,8 @@ from app.services.submissions.repo_naming import (
     build_repo_name,
     validate_repo_full_name,
 )
-from app.services.submissions.run_service import run_actions_tests
+from app.services.submissions.run_results import load_run_result, save_run_result
+from app.services.submissions.run_service import run_actions_tests, start_actions_run
 from app.services.submissions.submission_progress import progress_after_submission
 from app.services.submissions.task_lookup import load_task_or_404
 from app.services.submissions.task_rules import (
@@ -23,13 +24,19 @@ from app.services.submissions.task_rules import (
 )
 from app.services.submissions.workspace_provision import ensure_workspace
 from app.services.submissions.workspace_records import (
+    apply_run_result,
     build_codespace_url,
+    record_pending_run,
     record_run_result,
+    run_result_changed,
+    stage_run_result,
+    stored_run_result,
 )
 
 __all__ = [
     "CODE_TASK_TYPES",
     "TEXT_TASK_TYPES",
+    "apply_run_result",
     "build_codespace_url",
     "build_repo_name",
     "create_submission",
@@ -38,10 +45,17 @@ __all__ = [
     "ensure_task_belongs",
     "ensure_workspace",
     "is_code_task",
+    "load_run_result",
     "load_task_or_404",
     "progress_after_submission",
+    "record_pending_run",
     "record_run_result",
     "run_actions_tests",
+    "run_result_changed",
+    "save_run_result",
+    "stage_run_result",
+    "start_actions_run",
+    "stored_run_result",
     "summarize_diff",
     "validate_branch",
     "validate_github_username",
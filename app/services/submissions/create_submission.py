@@ -5,10 +5,12 @@ from datetime import datetime
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domains import CandidateSession, Submission, Task
+from app.domains import CandidateSession, Submission, SubmissionDiffPatch, Task
+from app.domains.candidate_sessions import service as cs_service
 from app.domains.submissions.exceptions import SubmissionConflict
 from app.integrations.github.actions_runner import ActionsRunResult
 from app.integrations.github.workspaces.workspace import Workspace
+from app.repositories.submissions import job_repository as job_repo
 from app.services.submissions.submission_actions import derive_actions_metadata
 from app.services.submissions.submission_builder import build_submission
 
@@ -23,8 +25,17 @@ async def create_submission(
     actions_result: ActionsRunResult | None = None,
     workspace: Workspace | None = None,
     diff_summary_json: str | None = None,
+    diff_patches_zlib: bytes | None = None,
+    job_payload_json: str | None = None,
 ) -> Submission:
-    """Persist a submission with conflict handling."""
+    """Persist a submission with conflict handling.
+
+    The commit also carries the session's progress counters (and completion)
+    plus any workspace or run-result changes the caller staged on ``db``.
+
+    With ``job_payload_json`` the submission is stored as ``processing`` and
+    its run/diff enrichment is queued as a job in the same transaction.
+    """
     actions_meta = derive_actions_metadata(actions_result, now)
     sub = build_submission(
         candidate_session=candidate_session,
@@ -35,11 +46,26 @@ async def create_submission(
         diff_summary_json=diff_summary_json,
         **actions_meta,
     )
+    if job_payload_json is not None:
+        sub.processing_status = "processing"
     db.add(sub)
     try:
+        if diff_patches_zlib is not None or job_payload_json is not None:
+            await db.flush()
+        if diff_patches_zlib is not None:
+            db.add(
+                SubmissionDiffPatch(
+                    submission_id=sub.id, patches_zlib=diff_patches_zlib
+                )
+            )
+        if job_payload_json is not None:
+            await job_repo.enqueue(
+                db, submission_id=sub.id, payload_json=job_payload_json, now=now
+            )
+        await cs_service.advance_progress(db, candidate_session, task, now=now)
         await db.commit()
     except IntegrityError as exc:
         await db.rollback()
         raise SubmissionConflict() from exc
-    await db.refresh(sub)
+    # Sessions keep attributes after commit, so no refresh round-trip is needed.
     return sub
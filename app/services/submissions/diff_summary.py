@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import json
+import zlib
 from typing import Any
 
+# GitHub's compare API returns at most this many files and does not page them.
+COMPARE_MAX_FILES = 300
+
 
 def summarize_diff(
     compare_payload: dict[str, Any], *, base: str | None, head: str | None
 ) -> dict[str, Any]:
-    """Reduce GitHub compare payload into a compact summary."""
+    """Reduce GitHub compare payload into a compact summary.
+
+    Only per-file stats are kept; patches are stored separately (see
+    ``extract_patches``) so list views never load them. A compare that hit
+    GitHub's file cap is marked ``truncated``, since the rest are not listed.
+    """
     files = []
     for f in compare_payload.get("files") or []:
         files.append(
@@ -16,10 +26,9 @@ def summarize_diff(
                 "additions": f.get("additions"),
                 "deletions": f.get("deletions"),
                 "changes": f.get("changes"),
-                "patch": f.get("patch"),
             }
         )
-    return {
+    summary = {
         "ahead_by": compare_payload.get("ahead_by"),
         "behind_by": compare_payload.get("behind_by"),
         "total_commits": compare_payload.get("total_commits"),
@@ -27,3 +36,31 @@ def summarize_diff(
         "head": head,
         "files": files,
     }
+    if len(files) >= COMPARE_MAX_FILES:
+        summary["truncated"] = True
+    return summary
+
+
+def extract_patches(compare_payload: dict[str, Any]) -> dict[str, str]:
+    """Map filename to patch text for every file GitHub sent a patch for."""
+    return {
+        f["filename"]: f["patch"]
+        for f in compare_payload.get("files") or []
+        if f.get("filename") and f.get("patch")
+    }
+
+
+def pack_patches(patches: dict[str, str]) -> bytes | None:
+    if not patches:
+        return None
+    return zlib.compress(json.dumps(patches, ensure_ascii=False).encode("utf-8"))
+
+
+def unpack_patches(blob: bytes | None) -> dict[str, str]:
+    if not blob:
+        return {}
+    try:
+        patches = json.loads(zlib.decompress(blob).decode("utf-8"))
+    except (zlib.error, ValueError):
+        return {}
+    return patches if isinstance(patches, dict) else {}
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.integrations.github.actions_runner import (
+    ActionsRunResult,
+    GithubActionsRunner,
+)
+from app.integrations.github.client import GithubError, github_lane
+from app.integrations.github.workspaces.workspace import Workspace
+from app.repositories.github_native.workspaces import repository as workspace_repo
+from app.services.submissions.run_results import save_run_result
+from app.services.submissions.workspace_records import apply_run_result
+
+logger = logging.getLogger(__name__)
+
+# Runs still unfinished after this long are released back to on-demand polling.
+PENDING_RUN_EXPIRY = timedelta(hours=2)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def _claim(workspace: Workspace) -> tuple[str | None, datetime | None]:
+    return (
+        workspace.last_workflow_run_id,
+        _as_utc(workspace.pending_run_dispatched_at),
+    )
+
+
+async def _fetch(
+    runner: GithubActionsRunner, workspace: Workspace, semaphore: asyncio.Semaphore
+) -> ActionsRunResult | None:
+    async with semaphore:
+        try:
+            with github_lane("poll"):
+                return await runner.poll_run_result(
+                    repo_full_name=workspace.repo_full_name,
+                    run_id=int(workspace.last_workflow_run_id or 0),
+                )
+        except GithubError as exc:
+            logger.warning(
+                "pending_run_fetch_failed",
+                extra={
+                    "workspace_id": workspace.id,
+                    "run_id": workspace.last_workflow_run_id,
+                    "error": str(exc),
+                },
+            )
+            return None
+
+
+async def poll_pending_runs(
+    db: AsyncSession,
+    runner: GithubActionsRunner,
+    *,
+    limit: int = 50,
+    concurrency: int = 8,
+) -> int:
+    """Check every pending run once and persist finished ones in one commit.
+
+    A candidate may dispatch a new run while the fetches are in flight, so
+    rows are re-read under lock afterwards and skipped when their run changed.
+    """
+    workspaces = await workspace_repo.list_pending_runs(db, limit=limit)
+    if not workspaces:
+        return 0
+    claims = {workspace.id: _claim(workspace) for workspace in workspaces}
+    semaphore = asyncio.Semaphore(concurrency)
+    results = await asyncio.gather(
+        *(_fetch(runner, workspace, semaphore) for workspace in workspaces)
+    )
+    fetched = {
+        workspace.id: result
+        for workspace, result in zip(workspaces, results, strict=True)
+    }
+    now = datetime.now(UTC)
+    expire_before = now - PENDING_RUN_EXPIRY
+    completed = 0
+    for workspace in await workspace_repo.lock_by_ids(db, list(claims)):
+        if _claim(workspace) != claims[workspace.id]:
+            continue
+        result = fetched[workspace.id]
+        if result is not None and result.is_settled:
+            apply_run_result(workspace, result)
+            await save_run_result(
+                db, repo_full_name=workspace.repo_full_name, result=result
+            )
+            completed += 1
+            continue
+        workspace.pending_run_checked_at = now
+        dispatched_at = _as_utc(workspace.pending_run_dispatched_at)
+        if dispatched_at is not None and dispatched_at < expire_before:
+            workspace.pending_run_dispatched_at = None
+            workspace.pending_run_checked_at = None
+    await db.commit()
+    return completed
+
+
+class PendingRunPoller:
+    """Background task that completes runs started by non-blocking /run calls."""
+
+    def __init__(
+        self,
+        *,
+        session_maker: async_sessionmaker[AsyncSession],
+        runner_factory: Callable[[], GithubActionsRunner],
+        interval_seconds: float = 3.0,
+    ) -> None:
+        self._session_maker = session_maker
+        self._runner_factory = runner_factory
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def poll_once(self) -> int:
+        async with self._session_maker() as db:
+            return await poll_pending_runs(db, self._runner_factory())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll_once()
+            except Exception:
+                logger.exception("pending_run_poll_failed")
+            await asyncio.sleep(self.interval_seconds)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.github.actions_runner import ActionsRunResult
+from app.repositories.github_native.workflow_runs import repository as run_results_repo
+from app.repositories.github_native.workflow_runs.models import WorkflowRunResult
+
+
+async def load_run_result(
+    db: AsyncSession, *, repo_full_name: str, run_id: int
+) -> ActionsRunResult | None:
+    """Return the durable result of a finished run without calling GitHub."""
+    record = await run_results_repo.get_by_repo_and_run(
+        db, repo_full_name=repo_full_name, run_id=run_id
+    )
+    if record is None:
+        return None
+    return ActionsRunResult(
+        status=record.status,
+        run_id=int(record.run_id),
+        conclusion=record.conclusion,
+        passed=record.passed,
+        failed=record.failed,
+        total=record.total,
+        stdout=record.stdout,
+        stderr=record.stderr,
+        head_sha=record.head_sha,
+        html_url=record.html_url,
+        raw=json.loads(record.raw_json) if record.raw_json else None,
+    )
+
+
+async def save_run_result(
+    db: AsyncSession, *, repo_full_name: str, result: ActionsRunResult
+) -> bool:
+    """Stage a settled run result for durable storage.
+
+    Running runs and transient artifact failures are skipped so the next
+    fetch can still produce the real outcome.
+    """
+    if not result.is_settled:
+        return False
+    return await run_results_repo.add_if_absent(
+        db,
+        WorkflowRunResult(
+            repo_full_name=repo_full_name,
+            run_id=result.run_id,
+            status=result.status,
+            conclusion=result.conclusion,
+            passed=result.passed,
+            failed=result.failed,
+            total=result.total,
+            stdout=result.stdout,
+            stderr=result.stderr,
+            head_sha=result.head_sha,
+            html_url=result.html_url,
+            raw_json=(
+                json.dumps(result.raw, ensure_ascii=False) if result.raw else None
+            ),
+        ),
+    )
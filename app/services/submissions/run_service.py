@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import Any
 
 from app.integrations.github.actions_runner import (
@@ -9,6 +10,13 @@ from app.integrations.github.actions_runner import (
 from app.integrations.github.workspaces.workspace import Workspace
 
 
+def workflow_inputs_json(workflow_inputs: dict[str, Any] | None) -> str | None:
+    """Canonical form of dispatch inputs, so equal inputs compare equal."""
+    if not workflow_inputs:
+        return None
+    return json.dumps(workflow_inputs, sort_keys=True, ensure_ascii=False)
+
+
 async def run_actions_tests(
     *,
     runner: GithubActionsRunner,
@@ -17,8 +25,31 @@ async def run_actions_tests(
     workflow_inputs: dict[str, Any] | None,
 ) -> ActionsRunResult:
     """Trigger and wait for Actions workflow for a workspace."""
-    return await runner.dispatch_and_wait(
+    result = await runner.dispatch_and_wait(
+        repo_full_name=workspace.repo_full_name,
+        ref=branch,
+        inputs=workflow_inputs or {},
+        workflow_file=workspace.workflow_file,
+        template_repo_full_name=workspace.template_repo_full_name,
+    )
+    workspace.last_workflow_inputs_json = workflow_inputs_json(workflow_inputs)
+    return result
+
+
+async def start_actions_run(
+    *,
+    runner: GithubActionsRunner,
+    workspace: Workspace,
+    branch: str,
+    workflow_inputs: dict[str, Any] | None,
+) -> ActionsRunResult:
+    """Trigger the Actions workflow and return once the run exists."""
+    result = await runner.dispatch_run(
         repo_full_name=workspace.repo_full_name,
         ref=branch,
         inputs=workflow_inputs or {},
+        workflow_file=workspace.workflow_file,
+        template_repo_full_name=workspace.template_repo_full_name,
     )
+    workspace.last_workflow_inputs_json = workflow_inputs_json(workflow_inputs)
+    return result
@@ -12,10 +12,17 @@ from app.services.submissions import (
     ensure_task_belongs,
     ensure_workspace,
     is_code_task,
+    load_run_result,
     load_task_or_404,
     progress_after_submission,
+    record_pending_run,
     record_run_result,
     run_actions_tests,
+    run_result_changed,
+    save_run_result,
+    stage_run_result,
+    start_actions_run,
+    stored_run_result,
     summarize_diff,
     validate_branch,
     validate_github_username,
@@ -35,10 +42,17 @@ __all__ = [
     "ensure_task_belongs",
     "ensure_workspace",
     "is_code_task",
+    "load_run_result",
     "load_task_or_404",
     "progress_after_submission",
+    "record_pending_run",
     "record_run_result",
     "run_actions_tests",
+    "run_result_changed",
+    "save_run_result",
+    "stage_run_result",
+    "start_actions_run",
+    "stored_run_result",
     "summarize_diff",
     "validate_branch",
     "validate_github_username",
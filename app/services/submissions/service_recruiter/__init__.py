@@ -1,11 +1,29 @@
 from app.domains.submissions.service_recruiter.derive_status import derive_test_status
-from app.domains.submissions.service_recruiter.fetch_detail import fetch_detail
-from app.domains.submissions.service_recruiter.list_submissions import list_submissions
+from app.domains.submissions.service_recruiter.fetch_detail import (
+    fetch_detail,
+    fetch_diff_patches,
+    fetch_processing_job,
+)
+from app.domains.submissions.service_recruiter.list_cursor import (
+    decode_cursor,
+    encode_cursor,
+    page_rows,
+)
+from app.domains.submissions.service_recruiter.list_submissions import (
+    list_submissions,
+    stream_submissions,
+)
 from app.domains.submissions.service_recruiter.parse_output import parse_test_output
 
 __all__ = [
+    "decode_cursor",
     "derive_test_status",
+    "encode_cursor",
     "fetch_detail",
+    "fetch_diff_patches",
+    "fetch_processing_job",
     "list_submissions",
+    "page_rows",
     "parse_test_output",
+    "stream_submissions",
 ]
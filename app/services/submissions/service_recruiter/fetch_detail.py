@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import json
+
 from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domains import CandidateSession, Simulation, Submission, Task
+from app.domains import CandidateSession, Simulation, Submission, SubmissionJob, Task
+from app.repositories.submissions import job_repository as job_repo
+from app.repositories.submissions import repository as submissions_repo
+from app.services.submissions.diff_summary import unpack_patches
 
 
 async def fetch_detail(
@@ -25,3 +30,26 @@ async def fetch_detail(
             status_code=status.HTTP_404_NOT_FOUND, detail="Submission not found"
         )
     return row
+
+
+async def fetch_processing_job(
+    db: AsyncSession, submission: Submission
+) -> SubmissionJob | None:
+    """Load the enrichment job of a submission that was processed in the background."""
+    if getattr(submission, "processing_status", None) is None:
+        return None
+    return await job_repo.get_by_submission(db, submission.id)
+
+
+async def fetch_diff_patches(
+    db: AsyncSession, submission: Submission
+) -> dict[str, str]:
+    """Load the separately stored patches of a submission's diff (detail only)."""
+    try:
+        summary = json.loads(getattr(submission, "diff_summary_json", None) or "{}")
+    except ValueError:
+        return {}
+    if not isinstance(summary, dict) or not summary.get("files"):
+        return {}
+    record = await submissions_repo.get_diff_patches(db, submission.id)
+    return unpack_patches(record.patches_zlib if record else None)
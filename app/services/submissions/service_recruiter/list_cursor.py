@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(submitted_at: datetime, submission_id: int) -> str:
+    """Opaque keyset cursor for the (submitted_at, id) position of a row."""
+    raw = json.dumps([submitted_at.isoformat(), submission_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        submitted_at, submission_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(submitted_at), int(submission_id)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
+
+
+def page_rows(rows: list, limit: int | None) -> tuple[list, str | None]:
+    """Trim the look-ahead row fetched with ``limit + 1`` and build ``nextCursor``."""
+    if limit is None or len(rows) <= limit:
+        return list(rows), None
+    rows = list(rows[:limit])
+    last = rows[-1][0]
+    return rows, encode_cursor(last.submitted_at, last.id)
@@ -1,10 +1,49 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+
+from sqlalchemy import Select, and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import load_only
+from sqlalchemy.orm import contains_eager, load_only
 
 from app.domains import CandidateSession, Simulation, Submission, Task
+from app.domains.submissions.presenter.materialize import LIST_FIELDS
+from app.services.submissions.service_recruiter.list_cursor import decode_cursor
+
+EXPORT_BATCH_SIZE = 500
+
+_LIST_COLUMNS = (
+    Submission.id,
+    Submission.candidate_session_id,
+    Submission.task_id,
+    Submission.submitted_at,
+    Submission.code_repo_path,
+    Submission.workflow_run_id,
+    Submission.commit_sha,
+    Submission.last_run_at,
+    *(getattr(Submission, field) for field in LIST_FIELDS),
+)
+
+
+def _filtered(
+    stmt: Select,
+    recruiter_id: int,
+    candidate_session_id: int | None,
+    task_id: int | None,
+) -> Select:
+    stmt = (
+        stmt.join(
+            CandidateSession, CandidateSession.id == Submission.candidate_session_id
+        )
+        .join(Simulation, Simulation.id == CandidateSession.simulation_id)
+        .where(Simulation.created_by == recruiter_id)
+        .order_by(Submission.submitted_at.desc(), Submission.id.desc())
+    )
+    if candidate_session_id is not None:
+        stmt = stmt.where(Submission.candidate_session_id == candidate_session_id)
+    if task_id is not None:
+        stmt = stmt.where(Submission.task_id == task_id)
+    return stmt
 
 
 async def list_submissions(
@@ -14,39 +53,60 @@ async def list_submissions(
     task_id: int | None,
     limit: int | None = None,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> list[tuple[Submission, Task]]:
-    stmt = (
+    """Newest-first rows; ``cursor`` continues after a previous page's last row."""
+    stmt = _filtered(
         select(Submission, Task)
         .join(Task, Task.id == Submission.task_id)
-        .join(CandidateSession, CandidateSession.id == Submission.candidate_session_id)
-        .join(Simulation, Simulation.id == CandidateSession.simulation_id)
-        .where(Simulation.created_by == recruiter_id)
-        .order_by(Submission.submitted_at.desc())
         .options(
-            load_only(
-                Submission.id,
-                Submission.candidate_session_id,
-                Submission.task_id,
-                Submission.submitted_at,
-                Submission.code_repo_path,
-                Submission.workflow_run_id,
-                Submission.commit_sha,
-                Submission.diff_summary_json,
-                Submission.tests_passed,
-                Submission.tests_failed,
-                Submission.test_output,
-                Submission.last_run_at,
-            ),
+            load_only(*_LIST_COLUMNS),
             load_only(Task.id, Task.day_index, Task.type),
-        )
+        ),
+        recruiter_id,
+        candidate_session_id,
+        task_id,
     )
-    if candidate_session_id is not None:
-        stmt = stmt.where(Submission.candidate_session_id == candidate_session_id)
-    if task_id is not None:
-        stmt = stmt.where(Submission.task_id == task_id)
-    if offset:
+    if cursor is not None:
+        submitted_at, submission_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                Submission.submitted_at < submitted_at,
+                and_(
+                    Submission.submitted_at == submitted_at,
+                    Submission.id < submission_id,
+                ),
+            )
+        )
+    elif offset:
         stmt = stmt.offset(offset)
     if limit is not None:
         stmt = stmt.limit(limit)
 
     return (await db.execute(stmt)).all()
+
+
+async def stream_submissions(
+    db: AsyncSession,
+    recruiter_id: int,
+    candidate_session_id: int | None,
+    task_id: int | None,
+) -> AsyncIterator[Submission]:
+    """Yield every matching submission (task eagerly attached) via a server-side cursor."""
+    stmt = _filtered(
+        select(Submission)
+        .join(Submission.task)
+        .options(
+            load_only(*_LIST_COLUMNS),
+            contains_eager(Submission.task).load_only(
+                Task.id, Task.day_index, Task.type
+            ),
+        )
+        .execution_options(yield_per=EXPORT_BATCH_SIZE),
+        recruiter_id,
+        candidate_session_id,
+        task_id,
+    )
+    result = await db.stream_scalars(stmt)
+    async for submission in result:
+        yield submission
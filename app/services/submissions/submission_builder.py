@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from app.domains import CandidateSession, Submission, Task
+from app.domains.submissions.presenter.materialize import materialize_list_fields
 from app.integrations.github.workspaces.workspace import Workspace
 
 
@@ -21,7 +22,7 @@ def build_submission(
     test_output,
     last_run_at,
 ) -> Submission:
-    return Submission(
+    submission = Submission(
         candidate_session_id=candidate_session.id,
         task_id=task.id,
         submitted_at=now,
@@ -35,3 +36,5 @@ def build_submission(
         test_output=test_output,
         last_run_at=last_run_at,
     )
+    materialize_list_fields(submission)
+    return submission
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domains import Submission, SubmissionJob
+from app.domains.submissions.presenter.materialize import materialize_list_fields
+from app.integrations.github.actions_runner import (
+    ActionsRunResult,
+    GithubActionsRunner,
+)
+from app.integrations.github.client import github_lane
+from app.repositories.github_native.workspaces import repository as workspace_repo
+from app.repositories.submissions import job_repository as job_repo
+from app.repositories.submissions import repository as submissions_repo
+from app.services.submissions.run_results import save_run_result
+from app.services.submissions.run_service import start_actions_run
+from app.services.submissions.submission_actions import derive_actions_metadata
+from app.services.submissions.use_cases.submit_diff import build_diff_summary
+from app.services.submissions.use_cases.submit_reuse import find_reusable_run
+from app.services.submissions.workspace_records import apply_run_result
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_LEASE_SECONDS = 120.0
+# Failed attempts back off exponentially from the base up to the cap.
+RETRY_BASE_SECONDS = 5.0
+RETRY_MAX_SECONDS = 300.0
+# How soon a job whose run is still going is looked at again.
+RUNNING_RECHECK_SECONDS = 3.0
+# Jobs whose run is still unfinished this long after queueing are failed.
+RUNNING_JOB_EXPIRY = timedelta(hours=2)
+
+
+class LeaseLost(Exception):
+    """Another worker took over the job; this worker's work is discarded."""
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before retry number ``attempts`` (1-based)."""
+    seconds = RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, RETRY_MAX_SECONDS))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+async def _ensure_lease(db: AsyncSession, job: SubmissionJob, owner: str) -> None:
+    if not await job_repo.confirm_lease(db, job.id, owner=owner, now=datetime.now(UTC)):
+        raise LeaseLost(f"submission job {job.id} lease lost by {owner}")
+
+
+def build_job_payload(*, branch: str, workflow_inputs: dict | None) -> str:
+    return json.dumps(
+        {"branch": branch, "workflowInputs": workflow_inputs or {}, "runId": None},
+        ensure_ascii=False,
+    )
+
+
+async def _advance(
+    db: AsyncSession,
+    job: SubmissionJob,
+    submission: Submission,
+    runner: GithubActionsRunner,
+    now: datetime,
+    owner: str,
+) -> ActionsRunResult | None:
+    """Move the job one step; returns the run result once it has finished."""
+    payload = json.loads(job.payload_json or "{}")
+    workspace = await workspace_repo.get_by_session_and_task(
+        db,
+        candidate_session_id=submission.candidate_session_id,
+        task_id=submission.task_id,
+    )
+    if workspace is None:
+        raise LookupError("workspace missing for submission")
+    branch = payload.get("branch") or workspace.default_branch or "main"
+    run_id = payload.get("runId")
+    if run_id is not None:
+        with github_lane("poll"):
+            result = await runner.poll_run_result(
+                repo_full_name=workspace.repo_full_name, run_id=int(run_id)
+            )
+    else:
+        with github_lane("submit"):
+            result = await find_reusable_run(
+                db,
+                runner.client,
+                workspace,
+                branch,
+                workflow_inputs=payload.get("workflowInputs"),
+            )
+            if result is None:
+                result = await start_actions_run(
+                    runner=runner,
+                    workspace=workspace,
+                    branch=branch,
+                    workflow_inputs=payload.get("workflowInputs"),
+                )
+        # Remember the run before waiting so a retry polls it instead of
+        # dispatching a second workflow.
+        payload["runId"] = result.run_id
+        job.payload_json = json.dumps(payload, ensure_ascii=False)
+        apply_run_result(workspace, result)
+        await _ensure_lease(db, job, owner)
+        await db.commit()
+    if result.status == "running":
+        return None
+    if not result.is_settled:
+        # The run finished but its results could not be read yet; fail the
+        # attempt so the backoff polls it again instead of storing the error.
+        artifact_error = (result.raw or {}).get("artifact_error")
+        raise RuntimeError(f"run {result.run_id} results unavailable: {artifact_error}")
+
+    apply_run_result(workspace, result)
+    await save_run_result(db, repo_full_name=workspace.repo_full_name, result=result)
+    diff = None
+    if result.head_sha:
+        with github_lane("submit"):
+            diff = await build_diff_summary(
+                runner.client, workspace, branch, result.head_sha
+            )
+    for field, value in derive_actions_metadata(result, now).items():
+        setattr(submission, field, value)
+    submission.diff_summary_json = diff.summary_json if diff else None
+    materialize_list_fields(submission)
+    if diff is not None and diff.patches_zlib is not None:
+        await submissions_repo.stage_diff_patches(
+            db, submission.id, patches_zlib=diff.patches_zlib
+        )
+    return result
+
+
+async def process_submission_job(
+    db: AsyncSession,
+    job_id: int,
+    *,
+    runner: GithubActionsRunner,
+    owner: str,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> str | None:
+    """Run one leased job step and persist the outcome; returns the job status.
+
+    Runs still in progress put the job back without using an attempt, until
+    ``RUNNING_JOB_EXPIRY`` after the job was queued. Errors are retried with
+    exponential backoff until ``max_attempts``, after which the job and its
+    submission are marked failed. Work done after another worker took over
+    an expired lease is rolled back instead of committed.
+    """
+    job = await db.get(SubmissionJob, job_id, populate_existing=True)
+    if job is None or job.status != "running" or job.lease_owner != owner:
+        return None
+    submission = await db.get(Submission, job.submission_id)
+    now = datetime.now(UTC)
+    try:
+        result = await _advance(db, job, submission, runner, now, owner)
+        await _ensure_lease(db, job, owner)
+    except LeaseLost:
+        await db.rollback()
+        logger.warning(
+            "submission_job_lease_lost",
+            extra={"job_id": job_id, "owner": owner},
+        )
+        return None
+    except Exception as exc:
+        await db.rollback()
+        await db.refresh(job)
+        await db.refresh(submission)
+        if not await job_repo.confirm_lease(
+            db, job.id, owner=owner, now=datetime.now(UTC)
+        ):
+            await db.rollback()
+            return None
+        job.attempts += 1
+        job.last_error = f"{type(exc).__name__}: {exc}"[:1000]
+        if job.attempts >= max_attempts:
+            job_repo.release(job, status="failed", now=now)
+            submission.processing_status = "failed"
+        else:
+            job_repo.release(
+                job,
+                status="pending",
+                now=now,
+                next_attempt_at=now + retry_delay(job.attempts),
+            )
+        logger.warning(
+            "submission_job_failed",
+            extra={
+                "job_id": job.id,
+                "submission_id": job.submission_id,
+                "attempts": job.attempts,
+                "error": job.last_error,
+            },
+        )
+        await db.commit()
+        return job.status
+
+    if result is None and now - _as_utc(job.created_at) >= RUNNING_JOB_EXPIRY:
+        run_id = json.loads(job.payload_json or "{}").get("runId")
+        job.last_error = (
+            f"run {run_id} still unfinished {RUNNING_JOB_EXPIRY} after queueing"
+        )
+        job_repo.release(job, status="failed", now=now)
+        submission.processing_status = "failed"
+        logger.warning(
+            "submission_job_expired",
+            extra={"job_id": job.id, "submission_id": job.submission_id},
+        )
+    elif result is None:
+        job_repo.release(
+            job,
+            status="pending",
+            now=now,
+            next_attempt_at=now + timedelta(seconds=RUNNING_RECHECK_SECONDS),
+        )
+    else:
+        job.last_error = None
+        job_repo.release(job, status="succeeded", now=now)
+        submission.processing_status = "ready"
+    await db.commit()
+    return job.status
+
+
+class SubmissionJobWorker:
+    """Background task that leases and runs queued submission jobs."""
+
+    def __init__(
+        self,
+        *,
+        session_maker: async_sessionmaker[AsyncSession],
+        runner_factory: Callable[[], GithubActionsRunner],
+        interval_seconds: float = 3.0,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        batch_size: int = 10,
+    ) -> None:
+        self._session_maker = session_maker
+        self._runner_factory = runner_factory
+        self.interval_seconds = interval_seconds
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.batch_size = batch_size
+        self.owner = uuid.uuid4().hex
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run_once(self) -> list[str | None]:
+        """Claim due jobs and advance each one in its own session."""
+        async with self._session_maker() as db:
+            job_ids = await job_repo.claim_due(
+                db,
+                owner=self.owner,
+                now=datetime.now(UTC),
+                lease_seconds=self.lease_seconds,
+                limit=self.batch_size,
+            )
+        return await asyncio.gather(*(self._process(job_id) for job_id in job_ids))
+
+    async def _process(self, job_id: int) -> str | None:
+        async with self._session_maker() as db:
+            return await process_submission_job(
+                db,
+                job_id,
+                runner=self._runner_factory(),
+                owner=self.owner,
+                max_attempts=self.max_attempts,
+            )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("submission_job_poll_failed")
+            await asyncio.sleep(self.interval_seconds)
@@ -9,23 +9,34 @@ from app.domains.candidate_sessions import service as cs_service
 
 
 async def progress_after_submission(
-    db: AsyncSession, candidate_session: CandidateSession, *, now: datetime
+    db: AsyncSession,
+    candidate_session: CandidateSession,
+    *,
+    now: datetime,
+    total_tasks: int | None = None,
+    commit: bool = True,
 ) -> tuple[int, int, bool]:
-    """Recompute progress and update completion status if applicable."""
-    (
-        _,
-        _completed_task_ids,
-        _current,
-        completed,
-        total,
-        is_complete,
-    ) = await cs_service.progress_snapshot(db, candidate_session)
+    """Read progress from the session's counters and complete it if applicable.
+
+    ``create_submission`` already advances the counters (and completion); a
+    caller that knows the task count passes ``total_tasks`` to skip the lookup.
+    With ``commit=False`` any status change is left for the caller's transaction.
+    """
+    if total_tasks is None:
+        _current, completed, total, is_complete = await cs_service.progress_counters(
+            db, candidate_session
+        )
+    else:
+        total = max(int(total_tasks), 0)
+        completed = min(candidate_session.completed_task_count or 0, total)
+        is_complete = total > 0 and completed >= total
 
     if is_complete and candidate_session.status != "completed":
         candidate_session.status = "completed"
         if candidate_session.completed_at is None:
             candidate_session.completed_at = now
-        await db.commit()
-        await db.refresh(candidate_session)
+        if commit:
+            await db.commit()
+            await db.refresh(candidate_session)
 
     return completed, total, is_complete
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.domains import CandidateSession
 from app.domains.submissions import service_candidate as submission_service
@@ -10,7 +14,18 @@ from app.domains.submissions.rate_limits import (
     concurrency_guard,
     throttle_poll,
 )
-from app.integrations.github.actions_runner import GithubActionsRunner
+from app.integrations.github.actions_runner import (
+    ActionsRunResult,
+    GithubActionsRunner,
+)
+from app.integrations.github.actions_runner.run_poller import run_state
+from app.integrations.github.client import github_lane
+from app.integrations.github.workspaces.workspace import Workspace
+
+# Longest a single long-poll request may hold the connection.
+MAX_WAIT_SECONDS = 25
+# Streams end after this long; EventSource clients reconnect on their own.
+RUN_EVENTS_MAX_SECONDS = 600.0
 
 
 async def fetch_run_result(
@@ -20,10 +35,19 @@ async def fetch_run_result(
     task_id: int,
     run_id: int,
     runner: GithubActionsRunner,
+    poll_after_ms: int | None = None,
+    wait_seconds: float = 0,
 ):
-    """Fetch a specific workflow run result for polling."""
-    apply_rate_limit(candidate_session.id, "poll")
-    throttle_poll(candidate_session.id, run_id)
+    """Fetch a workflow run result, from stored state when authoritative.
+
+    Finished runs are read from ``workflow_run_results`` and written there
+    the first time they are seen, so they never hit GitHub again. With
+    ``wait_seconds`` an unfinished run is held open until its state changes;
+    such long polls pace themselves, so only immediate polls are throttled.
+    """
+    if not wait_seconds:
+        apply_rate_limit(candidate_session.id, "poll")
+        throttle_poll(candidate_session.id, run_id)
     task = await submission_service.load_task_or_404(db, task_id)
     submission_service.ensure_task_belongs(task, candidate_session)
     submission_service.validate_run_allowed(task)
@@ -33,11 +57,106 @@ async def fetch_run_result(
     )
     if workspace is None:
         raise WorkspaceMissing()
+    stored = submission_service.stored_run_result(
+        workspace, run_id, poll_after_ms=poll_after_ms
+    )
+    if stored is not None and not (wait_seconds and stored.status == "running"):
+        return task, workspace, stored
+    durable = await submission_service.load_run_result(
+        db, repo_full_name=workspace.repo_full_name, run_id=run_id
+    )
+    if durable is not None:
+        return task, workspace, durable
     async with concurrency_guard(candidate_session.id, "fetch"):
-        return (
-            task,
-            workspace,
-            await runner.fetch_run_result(
+        with github_lane("poll"):
+            result = await runner.poll_run_result(
                 repo_full_name=workspace.repo_full_name, run_id=run_id
-            ),
+            )
+    if wait_seconds and result.status == "running":
+        # Park without the fetch guard or a pooled connection, so a waiting
+        # request does not lock the candidate out of other fetches.
+        await db.commit()
+        with github_lane("poll"):
+            result = await wait_for_run_change(
+                runner,
+                repo_full_name=workspace.repo_full_name,
+                run_id=run_id,
+                wait_seconds=min(wait_seconds, MAX_WAIT_SECONDS),
+            )
+    if await submission_service.save_run_result(
+        db, repo_full_name=workspace.repo_full_name, result=result
+    ):
+        await db.commit()
+    return task, workspace, result
+
+
+async def wait_for_run_change(
+    runner: GithubActionsRunner,
+    *,
+    repo_full_name: str,
+    run_id: int,
+    wait_seconds: float,
+) -> ActionsRunResult:
+    """Latest observation once it differs from the first, or when time is up."""
+    baseline = None
+    latest = None
+    try:
+        async with asyncio.timeout(wait_seconds):
+            async with aclosing(
+                runner.watch_run(repo_full_name=repo_full_name, run_id=run_id)
+            ) as updates:
+                async for update in updates:
+                    latest = update
+                    if baseline is None:
+                        baseline = run_state(update)
+                    elif run_state(update) != baseline:
+                        break
+    except TimeoutError:
+        pass
+    if latest is None:
+        return await runner.poll_run_result(
+            repo_full_name=repo_full_name, run_id=run_id
         )
+    return latest
+
+
+async def stream_run_updates(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    workspace: Workspace,
+    result: ActionsRunResult,
+    runner: GithubActionsRunner,
+    max_seconds: float = RUN_EVENTS_MAX_SECONDS,
+) -> AsyncIterator[ActionsRunResult | None]:
+    """Yield each change of a run's state, starting with ``result``.
+
+    ``None`` marks an observation without a change, so callers can keep the
+    connection alive. The request's session is closed before a streamed body
+    runs, so the finished run is recorded through a short-lived session of
+    its own.
+    """
+    yield result
+    if result.status != "running":
+        return
+    last = run_state(result)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_seconds
+    async with aclosing(
+        runner.watch_run(repo_full_name=workspace.repo_full_name, run_id=result.run_id)
+    ) as updates:
+        async for update in updates:
+            if run_state(update) == last:
+                yield None
+            else:
+                last = run_state(update)
+                yield update
+            if update.status != "running":
+                async with session_maker() as db:
+                    current = await db.get(Workspace, workspace.id)
+                    if current is not None and submission_service.run_result_changed(
+                        current, update
+                    ):
+                        await submission_service.record_run_result(db, current, update)
+                return
+            if loop.time() >= deadline:
+                return
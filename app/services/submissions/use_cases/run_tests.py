@@ -7,18 +7,16 @@ from app.domains.submissions import service_candidate as submission_service
 from app.domains.submissions.exceptions import WorkspaceMissing
 from app.domains.submissions.rate_limits import apply_rate_limit, concurrency_guard
 from app.integrations.github.actions_runner import GithubActionsRunner
+from app.integrations.github.client import github_lane
 
 
-async def run_task_tests(
+async def _load_run_target(
     db: AsyncSession,
     *,
     candidate_session: CandidateSession,
     task_id: int,
-    runner: GithubActionsRunner,
     branch: str | None,
-    workflow_inputs: dict | None,
 ):
-    """Dispatch workflow run for the task and return result."""
     apply_rate_limit(candidate_session.id, "run")
     task = await submission_service.load_task_or_404(db, task_id)
     submission_service.ensure_task_belongs(task, candidate_session)
@@ -32,14 +30,56 @@ async def run_task_tests(
     branch_to_use = submission_service.validate_branch(
         branch or workspace.default_branch or "main"
     )
+    return task, workspace, branch_to_use or "main"
+
+
+async def run_task_tests(
+    db: AsyncSession,
+    *,
+    candidate_session: CandidateSession,
+    task_id: int,
+    runner: GithubActionsRunner,
+    branch: str | None,
+    workflow_inputs: dict | None,
+):
+    """Dispatch workflow run for the task and return result."""
+    task, workspace, branch_to_use = await _load_run_target(
+        db, candidate_session=candidate_session, task_id=task_id, branch=branch
+    )
+    async with concurrency_guard(candidate_session.id, "dispatch"):
+        with github_lane("dispatch"):
+            return (
+                task,
+                workspace,
+                await submission_service.run_actions_tests(
+                    runner=runner,
+                    workspace=workspace,
+                    branch=branch_to_use,
+                    workflow_inputs=workflow_inputs,
+                ),
+            )
+
+
+async def start_task_tests(
+    db: AsyncSession,
+    *,
+    candidate_session: CandidateSession,
+    task_id: int,
+    runner: GithubActionsRunner,
+    branch: str | None,
+    workflow_inputs: dict | None,
+):
+    """Dispatch workflow run for the task and persist it as pending."""
+    task, workspace, branch_to_use = await _load_run_target(
+        db, candidate_session=candidate_session, task_id=task_id, branch=branch
+    )
     async with concurrency_guard(candidate_session.id, "dispatch"):
-        return (
-            task,
-            workspace,
-            await submission_service.run_actions_tests(
+        with github_lane("dispatch"):
+            result = await submission_service.start_actions_run(
                 runner=runner,
                 workspace=workspace,
-                branch=branch_to_use or "main",
+                branch=branch_to_use,
                 workflow_inputs=workflow_inputs,
-            ),
-        )
+            )
+    await submission_service.record_pending_run(db, workspace, result)
+    return task, workspace, result
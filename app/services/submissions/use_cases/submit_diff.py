@@ -1,20 +1,33 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 
 from app.domains.submissions import service_candidate as submission_service
 from app.integrations.github.client import GithubClient
 from app.repositories.github_native.workspaces.models import Workspace
+from app.services.submissions.diff_summary import extract_patches, pack_patches
+
+
+@dataclass
+class DiffSummary:
+    """Compact summary for the submission row plus its separately stored patches."""
+
+    summary_json: str
+    patches_zlib: bytes | None = None
 
 
 async def build_diff_summary(
     github_client: GithubClient, workspace: Workspace, branch: str, head_sha: str
-) -> str | None:
+) -> DiffSummary:
     base_sha = workspace.base_template_sha or branch
     compare = await github_client.get_compare(
         workspace.repo_full_name, base_sha, head_sha
     )
-    return json.dumps(
-        submission_service.summarize_diff(compare, base=base_sha, head=head_sha),
-        ensure_ascii=False,
+    return DiffSummary(
+        summary_json=json.dumps(
+            submission_service.summarize_diff(compare, base=base_sha, head=head_sha),
+            ensure_ascii=False,
+        ),
+        patches_zlib=pack_patches(extract_patches(compare)),
     )
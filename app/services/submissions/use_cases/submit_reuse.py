@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domains.submissions import service_candidate as submission_service
+from app.integrations.github.client import GithubClient, GithubError
+from app.repositories.github_native.workspaces.models import Workspace
+from app.services.submissions.run_service import (
+    ActionsRunResult,
+    workflow_inputs_json,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def find_reusable_run(
+    db: AsyncSession,
+    github_client: GithubClient,
+    workspace: Workspace,
+    branch: str,
+    *,
+    workflow_inputs: dict | None = None,
+) -> ActionsRunResult | None:
+    """Return the workspace's last finished run if the branch head has not moved.
+
+    Only a passed or failed run dispatched with the same inputs qualifies.
+    Costs one branch lookup; any doubt (no recorded run, a run still in
+    progress or errored, a failed lookup) returns None so the caller
+    dispatches.
+    """
+    if not workspace.last_workflow_run_id or not workspace.latest_commit_sha:
+        return None
+    if workspace.last_workflow_inputs_json != workflow_inputs_json(workflow_inputs):
+        return None
+    try:
+        run_id = int(workspace.last_workflow_run_id)
+    except ValueError:
+        return None
+    try:
+        branch_data = await github_client.get_branch(workspace.repo_full_name, branch)
+    except GithubError as exc:
+        logger.info(
+            "submit_reuse_head_lookup_failed",
+            extra={"workspace_id": workspace.id, "error": str(exc)},
+        )
+        return None
+    head_sha = (branch_data.get("commit") or {}).get("sha")
+    if not head_sha or head_sha != workspace.latest_commit_sha:
+        return None
+    result = await submission_service.load_run_result(
+        db, repo_full_name=workspace.repo_full_name, run_id=run_id
+    ) or submission_service.stored_run_result(workspace, run_id)
+    if (
+        result is None
+        or result.status not in {"passed", "failed"}
+        or result.head_sha != head_sha
+    ):
+        return None
+    logger.info(
+        "submit_reused_run",
+        extra={"workspace_id": workspace.id, "run_id": run_id, "head_sha": head_sha},
+    )
+    return result
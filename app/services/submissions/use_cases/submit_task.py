@@ -9,7 +9,11 @@ from app.domains.submissions import service_candidate as submission_service
 from app.domains.submissions.rate_limits import apply_rate_limit
 from app.domains.submissions.use_cases.submit_task_runner import run_code_submission
 from app.domains.submissions.use_cases.submit_validation import validate_submission_flow
+from app.domains.submissions.use_cases.submit_workspace import (
+    fetch_workspace_and_branch,
+)
 from app.integrations.github.client import GithubClient
+from app.services.submissions.submission_jobs import build_job_payload
 
 
 async def submit_task(
@@ -20,13 +24,28 @@ async def submit_task(
     payload,
     github_client: GithubClient,
     actions_runner,
+    enrich_async: bool = False,
 ):
+    """Persist a submission, running code-task tests inline or via a job.
+
+    Every write (workspace run state, run result, submission, job and session
+    progress) is staged first and committed once by ``create_submission``.
+    """
     apply_rate_limit(candidate_session.id, "submit")
-    task = await validate_submission_flow(db, candidate_session, task_id, payload)
+    task, total_tasks = await validate_submission_flow(
+        db, candidate_session, task_id, payload
+    )
     now = datetime.now(UTC)
-    actions_result = diff_summary_json = workspace = None
-    if submission_service.is_code_task(task):
-        actions_result, diff_summary_json, workspace = await run_code_submission(
+    actions_result = diff = workspace = job_payload_json = None
+    if submission_service.is_code_task(task) and enrich_async:
+        workspace, branch = await fetch_workspace_and_branch(
+            db, candidate_session.id, task.id, payload
+        )
+        job_payload_json = build_job_payload(
+            branch=branch, workflow_inputs=getattr(payload, "workflowInputs", None)
+        )
+    elif submission_service.is_code_task(task):
+        actions_result, diff, workspace = await run_code_submission(
             db=db,
             candidate_session_id=candidate_session.id,
             task_id=task.id,
@@ -42,9 +61,11 @@ async def submit_task(
         now=now,
         actions_result=actions_result,
         workspace=workspace,
-        diff_summary_json=diff_summary_json,
+        diff_summary_json=diff.summary_json if diff else None,
+        diff_patches_zlib=diff.patches_zlib if diff else None,
+        job_payload_json=job_payload_json,
     )
     completed, total, is_complete = await submission_service.progress_after_submission(
-        db, candidate_session, now=now
+        db, candidate_session, now=now, total_tasks=total_tasks
     )
     return task, submission, completed, total, is_complete
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,12 +10,52 @@ from app.domains.submissions import service_candidate as submission_service
 from app.integrations.github.client import GithubClient, GithubError
 from app.repositories.github_native.workspaces.models import Workspace
 from app.services.submissions.run_service import ActionsRunResult
-from app.services.submissions.use_cases.submit_diff import build_diff_summary
+from app.services.submissions.use_cases.submit_diff import (
+    DiffSummary,
+    build_diff_summary,
+)
+from app.services.submissions.use_cases.submit_reuse import find_reusable_run
 from app.services.submissions.use_cases.submit_workspace import (
     fetch_workspace_and_branch,
 )
 
 
+async def _stage_and_diff(
+    db: AsyncSession,
+    github_client: GithubClient,
+    workspace: Workspace,
+    branch: str,
+    actions_result: ActionsRunResult,
+    *,
+    stage: bool,
+) -> DiffSummary | None:
+    """Stage the run's DB writes while the compare diff is fetched from GitHub.
+
+    Only the staging step touches the session, so the two can overlap.
+    """
+
+    async def _stage() -> None:
+        if stage:
+            await submission_service.stage_run_result(db, workspace, actions_result)
+
+    async def _diff() -> DiffSummary | None:
+        if not actions_result.head_sha:
+            return None
+        return await build_diff_summary(
+            github_client, workspace, branch, actions_result.head_sha
+        )
+
+    staged, diff = await asyncio.gather(_stage(), _diff(), return_exceptions=True)
+    if isinstance(staged, BaseException):
+        raise staged
+    if isinstance(diff, BaseException):
+        if stage:
+            # Keep the finished run even though the submission cannot proceed.
+            await db.commit()
+        raise diff
+    return diff
+
+
 async def run_code_submission(
     *,
     db: AsyncSession,
@@ -22,24 +64,33 @@ async def run_code_submission(
     payload,
     github_client: GithubClient,
     actions_runner,
-) -> tuple[ActionsRunResult | None, str | None, Workspace | None]:
+) -> tuple[ActionsRunResult | None, DiffSummary | None, Workspace | None]:
+    """Run (or reuse) the workspace's tests and build the diff summary.
+
+    Workspace and run-result writes are staged but not committed; the
+    caller commits them together with the submission.
+    """
     workspace, branch = await fetch_workspace_and_branch(
         db, candidate_session_id, task_id, payload
     )
+    branch = branch or "main"
+    workflow_inputs = getattr(payload, "workflowInputs", None)
     try:
-        actions_result = await submission_service.run_actions_tests(
-            runner=actions_runner,
-            workspace=workspace,
-            branch=branch or "main",
-            workflow_inputs=getattr(payload, "workflowInputs", None),
+        actions_result = await find_reusable_run(
+            db, github_client, workspace, branch, workflow_inputs=workflow_inputs
         )
-        await submission_service.record_run_result(db, workspace, actions_result)
-        if not actions_result.head_sha:
-            return actions_result, None, workspace
-        diff_summary_json = await build_diff_summary(
-            github_client, workspace, branch, actions_result.head_sha
+        reused = actions_result is not None
+        if not reused:
+            actions_result = await submission_service.run_actions_tests(
+                runner=actions_runner,
+                workspace=workspace,
+                branch=branch,
+                workflow_inputs=workflow_inputs,
+            )
+        diff = await _stage_and_diff(
+            db, github_client, workspace, branch, actions_result, stage=not reused
         )
-        return actions_result, diff_summary_json, workspace
+        return actions_result, diff, workspace
     except GithubError:
         raise
     except Exception as exc:  # pragma: no cover - safety net
@@ -13,10 +13,17 @@ async def validate_submission_flow(
     task_id: int,
     payload,
 ):
+    """Validate a submission; returns the task and the simulation's task count.
+
+    The in-order check reads the session's progress counters, and the task
+    count lets the caller report post-submission progress without querying again.
+    """
     task = await submission_service.load_task_or_404(db, task_id)
     submission_service.ensure_task_belongs(task, candidate_session)
     await submission_service.ensure_not_duplicate(db, candidate_session.id, task_id)
-    _, _, current_task, *_ = await cs_service.progress_snapshot(db, candidate_session)
+    current_task, _, total, _ = await cs_service.progress_counters(
+        db, candidate_session
+    )
     submission_service.ensure_in_order(current_task, task_id)
     submission_service.validate_submission_payload(task, payload)
-    return task
+    return task, total
@@ -1,28 +1,105 @@
 from __future__ import annotations
 
 import json
+from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.integrations.github.actions_runner import ActionsRunResult
 from app.integrations.github.workspaces.workspace import Workspace
+from app.services.submissions.run_results import save_run_result
 
 
-async def record_run_result(
-    db: AsyncSession, workspace: Workspace, result: ActionsRunResult
-) -> Workspace:
-    """Persist latest workflow result on the workspace."""
+def apply_run_result(workspace: Workspace, result: ActionsRunResult) -> None:
+    """Copy a workflow result onto the workspace without committing."""
     workspace.last_workflow_run_id = str(result.run_id)
     workspace.last_workflow_conclusion = result.conclusion
     workspace.latest_commit_sha = result.head_sha
     workspace.last_test_summary_json = json.dumps(
         result.as_test_output, ensure_ascii=False
     )
+    if result.status != "running":
+        workspace.pending_run_dispatched_at = None
+        workspace.pending_run_checked_at = None
+    if result.workflow_file:
+        workspace.workflow_file = result.workflow_file
+
+
+async def stage_run_result(
+    db: AsyncSession, workspace: Workspace, result: ActionsRunResult
+) -> None:
+    """Copy a workflow result onto the workspace and stage its record; no commit."""
+    apply_run_result(workspace, result)
+    await save_run_result(db, repo_full_name=workspace.repo_full_name, result=result)
+
+
+async def record_run_result(
+    db: AsyncSession, workspace: Workspace, result: ActionsRunResult
+) -> Workspace:
+    """Persist latest workflow result on the workspace."""
+    await stage_run_result(db, workspace, result)
     await db.commit()
     await db.refresh(workspace)
     return workspace
 
 
+async def record_pending_run(
+    db: AsyncSession, workspace: Workspace, result: ActionsRunResult
+) -> Workspace:
+    """Persist a dispatched run and hand its completion to the background poller."""
+    if result.status == "running":
+        workspace.pending_run_dispatched_at = datetime.now(UTC)
+        workspace.pending_run_checked_at = None
+    return await record_run_result(db, workspace, result)
+
+
+def run_result_changed(workspace: Workspace, result: ActionsRunResult) -> bool:
+    return (
+        workspace.last_workflow_run_id != str(result.run_id)
+        or workspace.last_workflow_conclusion != result.conclusion
+        or workspace.latest_commit_sha != result.head_sha
+    )
+
+
+def stored_run_result(
+    workspace: Workspace, run_id: int, *, poll_after_ms: int | None = None
+) -> ActionsRunResult | None:
+    """Rebuild a run result from workspace state when it is authoritative.
+
+    Passed and failed runs never change, and pending runs are kept current
+    by the background poller, so neither needs a GitHub call. Errors are not
+    trusted: the workspace summary cannot tell a transient artifact failure
+    from a final one.
+    """
+    if workspace.last_workflow_run_id != str(run_id):
+        return None
+    if not workspace.last_test_summary_json:
+        return None
+    try:
+        summary = json.loads(workspace.last_test_summary_json)
+    except ValueError:
+        return None
+    status = summary.get("status")
+    if status == "running" and workspace.pending_run_dispatched_at is None:
+        return None
+    if status not in {"passed", "failed", "running"}:
+        return None
+    return ActionsRunResult(
+        status=status,
+        run_id=run_id,
+        conclusion=workspace.last_workflow_conclusion,
+        passed=summary.get("passed"),
+        failed=summary.get("failed"),
+        total=summary.get("total"),
+        stdout=summary.get("stdout"),
+        stderr=summary.get("stderr"),
+        head_sha=workspace.latest_commit_sha,
+        html_url=f"https://github.com/{workspace.repo_full_name}/actions/runs/{run_id}",
+        raw={"summary": summary["summary"]} if "summary" in summary else None,
+        poll_after_ms=poll_after_ms if status == "running" else None,
+    )
+
+
 def build_codespace_url(repo_full_name: str) -> str:
     """Return a Codespaces deep link to resume or create a workspace."""
     return f"https://codespaces.new/{repo_full_name}?quickstart=1"
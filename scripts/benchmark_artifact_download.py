@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import os
+import time
+import tracemalloc
+import zipfile
+
+import httpx
+
+from app.integrations.github import GithubClient
+from app.integrations.github.artifacts import parse_test_results_zip
+
+CHUNK_BYTES = 64 * 1024
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare peak memory of buffered vs spooled artifact downloads"
+    )
+    parser.add_argument(
+        "--size-mb", type=int, default=50, help="Artifact size in megabytes"
+    )
+    return parser.parse_args()
+
+
+def _build_artifact(size_bytes: int) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("tenon-test-results.json", '{"passed":1,"failed":0,"total":1}')
+        zf.writestr("logs/output.bin", os.urandom(size_bytes))
+    return buf.getvalue()
+
+
+def _client(payload: bytes) -> GithubClient:
+    async def _chunks():
+        view = memoryview(payload)
+        for offset in range(0, len(view), CHUNK_BYTES):
+            yield bytes(view[offset : offset + CHUNK_BYTES])
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"Content-Type": "application/zip"}, content=_chunks()
+        )
+
+    return GithubClient(
+        base_url="https://api.github.com",
+        token="benchmark",
+        transport=httpx.MockTransport(handler),
+        artifact_max_bytes=len(payload) + 1,
+    )
+
+
+async def _buffered(client: GithubClient) -> None:
+    content = await client.download_artifact_zip("org/repo", 1)
+    assert parse_test_results_zip(content) is not None
+
+
+async def _spooled(client: GithubClient) -> None:
+    with await client.download_artifact_file("org/repo", 1) as spool:
+        assert parse_test_results_zip(spool) is not None
+
+
+async def _measure(name: str, payload: bytes, fn) -> None:
+    client = _client(payload)
+    tracemalloc.start()
+    started = time.perf_counter()
+    await fn(client)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await client.aclose()
+    print(f"{name:<10} peak={peak / 1024 / 1024:8.1f} MiB  time={elapsed:6.2f}s")
+
+
+async def main() -> int:
+    args = _parse_args()
+    payload = _build_artifact(args.size_mb * 1024 * 1024)
+    print(f"artifact size: {len(payload) / 1024 / 1024:.1f} MiB")
+    await _measure("buffered", payload, _buffered)
+    await _measure("spooled", payload, _spooled)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
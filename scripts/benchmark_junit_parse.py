@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import io
+import time
+import tracemalloc
+import zipfile
+from xml.etree import ElementTree
+
+from app.integrations.github.artifacts import parse_test_results_zip
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare the streaming JUnit parser with a full ElementTree parse"
+    )
+    parser.add_argument(
+        "--testcases", type=int, default=20_000, help="Testcases in the report"
+    )
+    parser.add_argument(
+        "--files", type=int, default=4, help="XML files the report is split across"
+    )
+    return parser.parse_args()
+
+
+def _build_artifact(testcases: int, files: int) -> bytes:
+    buf = io.BytesIO()
+    per_file = max(testcases // files, 1)
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for index in range(files):
+            cases = []
+            for case in range(per_file):
+                body = (
+                    '<failure message="boom">trace</failure>'
+                    if case % 50 == 0
+                    else "<system-out>" + "x" * 200 + "</system-out>"
+                )
+                cases.append(
+                    f'<testcase classname="pkg.Mod{index}" name="test_{case}" '
+                    f'time="0.01">{body}</testcase>'
+                )
+            zf.writestr(
+                f"reports/junit-{index}.xml",
+                f'<testsuite name="suite{index}">{"".join(cases)}</testsuite>',
+            )
+    return buf.getvalue()
+
+
+def _full_tree(payload: bytes) -> int:
+    """The previous approach: one ElementTree per file, per-testcase iter()."""
+    total = 0
+    with zipfile.ZipFile(io.BytesIO(payload)) as zf:
+        for name in zf.namelist():
+            with zf.open(name) as fp:
+                root = ElementTree.parse(fp).getroot()
+            for testcase in root.iter("testcase"):
+                list(testcase.iter("failure"))
+                list(testcase.iter("error"))
+                total += 1
+    return total
+
+
+def _streaming(payload: bytes) -> int:
+    parsed = parse_test_results_zip(payload, limits=None, max_failures=50)
+    assert parsed is not None
+    return parsed.total
+
+
+def _measure(name: str, payload: bytes, fn) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    total = fn(payload)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<10} testcases={total:<7} peak={peak / 1024 / 1024:7.1f} MiB  "
+        f"time={elapsed:6.2f}s"
+    )
+
+
+def main() -> int:
+    args = _parse_args()
+    payload = _build_artifact(args.testcases, args.files)
+    print(f"artifact size: {len(payload) / 1024:.0f} KiB, files: {args.files}")
+    _measure("tree", payload, _full_tree)
+    _measure("streaming", payload, _streaming)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
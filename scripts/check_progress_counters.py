@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from app.core.db import async_session_maker
+from app.services.candidate_sessions.progress_check import check_progress_counters
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check candidate session progress counters against submissions"
+    )
+    parser.add_argument(
+        "--session-ids",
+        nargs="*",
+        type=int,
+        default=None,
+        help="Only check these candidate session ids",
+    )
+    parser.add_argument(
+        "--repair",
+        action="store_true",
+        help="Write the recomputed counters back",
+    )
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> int:
+    async with async_session_maker() as db:
+        drift = await check_progress_counters(
+            db, args.session_ids or None, repair=args.repair
+        )
+    for counters in drift:
+        print(
+            f"- session {counters.candidate_session_id}: "
+            f"completed={counters.completed_task_count} "
+            f"current_task_id={counters.current_task_id} "
+            f"last_submitted_at={counters.last_submitted_at}"
+        )
+    action = "repaired" if args.repair else "drifted"
+    print(f"progress counters: {len(drift)} session(s) {action}")
+    return 1 if drift and not args.repair else 0
+
+
+def main() -> None:
+    """CLI entrypoint."""
+    sys.exit(asyncio.run(_run(_parse_args())))
+
+
+if __name__ == "__main__":
+    main()
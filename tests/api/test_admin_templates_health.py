@@ -132,9 +132,9 @@ async def test_admin_template_health_run_live(
         async def list_artifacts(self, *args, **kwargs):
             return [{"id": 1, "name": "tenon-test-results", "expired": False}]
 
-        async def download_artifact_zip(self, *args, **kwargs):
+        async def download_artifact_file(self, *args, **kwargs):
             body = '{"passed": 1, "failed": 0, "total": 1, "stdout": "", "stderr": ""}'
-            return _make_zip({"tenon-test-results.json": body})
+            return io.BytesIO(_make_zip({"tenon-test-results.json": body}))
 
     monkeypatch.setattr(settings, "ADMIN_API_KEY", "test-admin-key")
     template_key = next(iter(TEMPLATE_CATALOG))
@@ -209,3 +209,24 @@ async def test_admin_template_health_run_rejects_too_many_keys(
         headers={"X-Admin-Key": "test-admin-key"},
     )
     assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_admin_perf_metrics_reports_registered_providers(
+    async_client, monkeypatch
+):
+    from app.core.perf import register_metrics_provider, unregister_metrics_provider
+
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "test-admin-key")
+    register_metrics_provider("test_provider", lambda: {"value": 1})
+    try:
+        resp = await async_client.get(
+            "/api/admin/perf/metrics", headers={"X-Admin-Key": "test-admin-key"}
+        )
+        missing_key = await async_client.get("/api/admin/perf/metrics")
+    finally:
+        unregister_metrics_provider("test_provider")
+
+    assert resp.status_code == 200
+    assert resp.json()["test_provider"] == {"value": 1}
+    assert missing_key.status_code == 404
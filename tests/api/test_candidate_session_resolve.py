@@ -3,7 +3,8 @@ from datetime import UTC, datetime, timedelta
 import pytest
 from sqlalchemy import select
 
-from app.domains import CandidateSession, Company, Submission, Task, User
+from app.domains import CandidateSession, Company, Task, User
+from tests.factories import create_submission
 
 # -------------------------
 # Shared helpers (mirrors resolve tests)
@@ -131,13 +132,14 @@ async def test_current_task_advances_after_submission(
     ).scalar_one()
 
     # Insert submission for Day 1
-    submission = Submission(
-        candidate_session_id=cs_id,
-        task_id=day1_task.id,
+    cs = await async_session.get(CandidateSession, cs_id)
+    await create_submission(
+        async_session,
+        candidate_session=cs,
+        task=day1_task,
         submitted_at=datetime.now(UTC),
         content_text="My design solution",
     )
-    async_session.add(submission)
     await async_session.commit()
 
     res = await async_client.get(
@@ -178,14 +180,14 @@ async def test_current_task_completed_after_all_tasks(
 
     now = datetime.now(UTC)
 
+    cs = await async_session.get(CandidateSession, cs_id)
     for task in tasks:
-        async_session.add(
-            Submission(
-                candidate_session_id=cs_id,
-                task_id=task.id,
-                submitted_at=now,
-                content_text="done",
-            )
+        await create_submission(
+            async_session,
+            candidate_session=cs,
+            task=task,
+            submitted_at=now,
+            content_text="done",
         )
 
     await async_session.commit()
@@ -0,0 +1,68 @@
+import hashlib
+import hmac
+import json
+
+import pytest
+
+from app.api.dependencies.github_native import get_workflow_run_events
+from app.core.settings import settings
+from app.integrations.github.webhooks import WorkflowRunEventStore
+
+
+def _signed(body: bytes, secret: str = "hook-secret") -> dict[str, str]:
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return {"X-Hub-Signature-256": f"sha256={digest}"}
+
+
+@pytest.mark.asyncio
+async def test_github_webhook_ingests_signed_workflow_run(
+    async_client, monkeypatch, override_dependencies
+):
+    monkeypatch.setattr(settings.github, "GITHUB_WEBHOOK_SECRET", "hook-secret")
+    store = WorkflowRunEventStore()
+    body = json.dumps(
+        {
+            "repository": {"full_name": "org/repo"},
+            "workflow_run": {"id": 42, "status": "completed", "conclusion": "success"},
+        }
+    ).encode()
+
+    with override_dependencies({get_workflow_run_events: lambda: store}):
+        resp = await async_client.post(
+            "/api/github/webhooks",
+            content=body,
+            headers={**_signed(body), "X-GitHub-Event": "workflow_run"},
+        )
+        assert resp.status_code == 202
+        assert resp.json() == {"status": "accepted"}
+        assert store.get("org/repo", 42).conclusion == "success"
+
+        ping = await async_client.post(
+            "/api/github/webhooks",
+            content=b"{}",
+            headers={**_signed(b"{}"), "X-GitHub-Event": "ping"},
+        )
+        assert ping.json() == {"status": "ignored"}
+
+        bad_json = await async_client.post(
+            "/api/github/webhooks",
+            content=b"not-json",
+            headers={**_signed(b"not-json"), "X-GitHub-Event": "workflow_job"},
+        )
+        assert bad_json.status_code == 400
+
+        forged = await async_client.post(
+            "/api/github/webhooks",
+            content=body,
+            headers={**_signed(body, "wrong"), "X-GitHub-Event": "workflow_run"},
+        )
+        assert forged.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_github_webhook_disabled_without_secret(async_client, monkeypatch):
+    monkeypatch.setattr(settings.github, "GITHUB_WEBHOOK_SECRET", "")
+    resp = await async_client.post(
+        "/api/github/webhooks", content=b"{}", headers={"X-GitHub-Event": "ping"}
+    )
+    assert resp.status_code == 404
@@ -188,7 +188,7 @@ async def test_recruiter_list_includes_links(async_client, async_session: AsyncS
     )
     assert resp.status_code == 200, resp.text
     body = resp.json()
-    assert set(body.keys()) == {"items"}
+    assert set(body.keys()) == {"items", "nextCursor"}
     items = body["items"]
     found = next(i for i in items if i["submissionId"] == sub.id)
     assert found["repoFullName"] == "org/repo"
@@ -351,6 +351,40 @@ async def test_recruiter_submission_list_includes_test_results(
     assert test_results["artifactPresent"] is True
 
 
+@pytest.mark.asyncio
+async def test_recruiter_submission_list_reads_materialized_columns(
+    async_session: AsyncSession,
+):
+    from sqlalchemy import inspect
+
+    from app.domains.submissions import service_recruiter
+
+    recruiter = await create_recruiter(async_session, email="listcols@test.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(async_session, simulation=sim, status="started")
+    await create_submission(
+        async_session,
+        candidate_session=cs,
+        task=tasks[0],
+        diff_summary_json=json.dumps({"base": "a", "head": "b", "files": []}),
+        test_output=json.dumps({"status": "passed", "passed": 2, "failed": 0}),
+    )
+    await async_session.commit()
+    async_session.expunge_all()
+
+    rows = await service_recruiter.list_submissions(
+        async_session, recruiter.id, cs.id, None
+    )
+    sub, _task = rows[0]
+    unloaded = inspect(sub).unloaded
+    assert {"test_output", "diff_summary_json"} <= unloaded
+    assert (sub.test_status, sub.tests_total, sub.diff_files_changed) == (
+        "passed",
+        2,
+        0,
+    )
+
+
 @pytest.mark.asyncio
 async def test_recruiter_submission_handles_missing_artifacts(
     async_client, async_session: AsyncSession
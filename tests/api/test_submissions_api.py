@@ -1,5 +1,12 @@
+import json
+from datetime import UTC, datetime, timedelta
+
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core import db as core_db
+from app.core.db import get_session, get_session_maker
+from app.main import app
 from tests.factories import (
     create_candidate_session,
     create_recruiter,
@@ -44,3 +51,115 @@ async def test_submissions_detail_404_when_not_owner(async_client, async_session
         headers={"x-dev-user-email": other.email},
     )
     assert res.status_code == 404
+
+
+async def _three_submissions(async_session, email: str):
+    recruiter = await create_recruiter(async_session, email=email)
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    now = datetime.now(UTC)
+    subs = [
+        await create_submission(
+            async_session,
+            candidate_session=cs,
+            task=task,
+            content_text=f"day {idx}",
+            submitted_at=submitted_at,
+        )
+        for idx, (task, submitted_at) in enumerate(
+            [(tasks[0], now - timedelta(hours=1)), (tasks[1], now), (tasks[2], now)]
+        )
+    ]
+    await async_session.commit()
+    return recruiter, subs
+
+
+@pytest.mark.asyncio
+async def test_submissions_list_keyset_pages(async_client, async_session):
+    recruiter, subs = await _three_submissions(async_session, "keyset@sim.com")
+    headers = {"x-dev-user-email": recruiter.email}
+
+    first = await async_client.get("/api/submissions?limit=2", headers=headers)
+    assert first.status_code == 200, first.text
+    body = first.json()
+    # Ties on submitted_at are broken by id, newest first.
+    assert [i["submissionId"] for i in body["items"]] == [subs[2].id, subs[1].id]
+    assert body["nextCursor"]
+
+    second = await async_client.get(
+        f"/api/submissions?limit=2&cursor={body['nextCursor']}", headers=headers
+    )
+    assert second.status_code == 200, second.text
+    assert [i["submissionId"] for i in second.json()["items"]] == [subs[0].id]
+    assert second.json()["nextCursor"] is None
+
+    unpaged = await async_client.get("/api/submissions", headers=headers)
+    assert len(unpaged.json()["items"]) == 3
+    assert unpaged.json()["nextCursor"] is None
+
+    bad = await async_client.get(
+        "/api/submissions?cursor=not-a-cursor", headers=headers
+    )
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_submissions_export_streams_ndjson(async_client, async_session):
+    recruiter, subs = await _three_submissions(async_session, "export@sim.com")
+    other = await create_recruiter(async_session, email="export-other@sim.com")
+    await async_session.commit()
+
+    res = await async_client.get(
+        "/api/submissions/export", headers={"x-dev-user-email": recruiter.email}
+    )
+    assert res.status_code == 200, res.text
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert [line["submissionId"] for line in lines] == [s.id for s in subs[::-1]]
+    assert lines[0]["dayIndex"] == 3
+
+    res = await async_client.get(
+        "/api/submissions/export", headers={"x-dev-user-email": other.email}
+    )
+    assert res.status_code == 200
+    assert res.text == ""
+
+
+class _SingleUseSession(AsyncSession):
+    """Fails loudly when used after close instead of quietly reconnecting."""
+
+    closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+        await super().close()
+
+    async def stream_scalars(self, *args, **kwargs):
+        assert not self.closed, "session used after the request closed it"
+        return await super().stream_scalars(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_submissions_export_uses_its_own_session(
+    async_client, async_session, monkeypatch
+):
+    recruiter, subs = await _three_submissions(async_session, "export-own@sim.com")
+    # Real dependencies: the request session is closed before the body streams.
+    app.dependency_overrides.pop(get_session, None)
+    app.dependency_overrides.pop(get_session_maker, None)
+    monkeypatch.setattr(
+        core_db,
+        "async_session_maker",
+        async_sessionmaker(
+            bind=async_session.bind, expire_on_commit=False, class_=_SingleUseSession
+        ),
+    )
+
+    res = await async_client.get(
+        "/api/submissions/export", headers={"x-dev-user-email": recruiter.email}
+    )
+    assert res.status_code == 200, res.text
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert [line["submissionId"] for line in lines] == [s.id for s in subs[::-1]]
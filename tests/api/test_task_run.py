@@ -5,10 +5,12 @@ import pytest
 from sqlalchemy import select
 
 from app.api.routers import tasks_codespaces as candidate_submissions
+from app.core.settings import settings
 from app.integrations.github.actions_runner import ActionsRunResult
 from app.integrations.github.client import GithubError
 from app.integrations.github.workspaces import repository as workspace_repo
 from app.integrations.github.workspaces.workspace import Workspace
+from app.services.submissions.pending_runs import poll_pending_runs
 from tests.factories import (
     create_candidate_session,
     create_recruiter,
@@ -720,6 +722,94 @@ async def test_get_run_result_returns_parsed_counts(
     assert body["total"] == 1
 
 
+@pytest.mark.asyncio
+async def test_async_run_returns_202_and_background_poller_completes_it(
+    async_client, async_session, candidate_header_factory, actions_stubber, monkeypatch
+):
+    monkeypatch.setattr(settings.github, "GITHUB_ACTIONS_ASYNC_RUNS", True)
+    recruiter = await create_recruiter(async_session, email="run-async@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    await create_submission(
+        async_session, candidate_session=cs, task=tasks[0], content_text="day1"
+    )
+    await async_session.commit()
+
+    running = ActionsRunResult(
+        status="running",
+        run_id=555,
+        conclusion=None,
+        passed=None,
+        failed=None,
+        total=None,
+        stdout=None,
+        stderr=None,
+        head_sha="abc123",
+        html_url="https://example.com/run/555",
+        raw=None,
+        poll_after_ms=2000,
+    )
+    runner = actions_stubber(result=running)
+    headers = candidate_header_factory(cs)
+    await async_client.post(
+        f"/api/tasks/{tasks[1].id}/codespace/init",
+        headers=headers,
+        json={"githubUsername": "octocat"},
+    )
+
+    resp = await async_client.post(
+        f"/api/tasks/{tasks[1].id}/run", headers=headers, json={}
+    )
+    assert resp.status_code == 202, resp.text
+    assert resp.json()["runId"] == 555
+    assert resp.json()["status"] == "running"
+
+    workspace = (
+        await async_session.execute(
+            select(Workspace).where(Workspace.candidate_session_id == cs.id)
+        )
+    ).scalar_one()
+    await async_session.refresh(workspace)
+    assert workspace.pending_run_dispatched_at is not None
+
+    # Polling reads the stored pending state; GitHub is not consulted.
+    runner._error = AssertionError("GitHub should not be called")
+    pending = await async_client.get(
+        f"/api/tasks/{tasks[1].id}/run/555", headers=headers
+    )
+    assert pending.status_code == 200, pending.text
+    assert pending.json()["status"] == "running"
+    assert pending.json()["pollAfterMs"] == 3000
+
+    runner._error = None
+    runner._result = ActionsRunResult(
+        status="passed",
+        run_id=555,
+        conclusion="success",
+        passed=4,
+        failed=0,
+        total=4,
+        stdout="ok",
+        stderr=None,
+        head_sha="abc123",
+        html_url="https://example.com/run/555",
+        raw=None,
+    )
+    assert await poll_pending_runs(async_session, runner) == 1
+    await async_session.refresh(workspace)
+    assert workspace.pending_run_dispatched_at is None
+    assert workspace.last_workflow_conclusion == "success"
+
+    runner._error = AssertionError("GitHub should not be called")
+    done = await async_client.get(f"/api/tasks/{tasks[1].id}/run/555", headers=headers)
+    assert done.status_code == 200, done.text
+    assert done.json()["status"] == "passed"
+    assert done.json()["passed"] == 4
+    assert done.json()["workflowUrl"].endswith("/actions/runs/555")
+
+
 @pytest.mark.asyncio
 async def test_get_run_result_throttled_when_polling_too_fast(
     async_client, async_session, candidate_header_factory, actions_stubber, monkeypatch
@@ -763,6 +853,13 @@ async def test_get_run_result_throttled_when_polling_too_fast(
     )
     assert second.status_code == 429
 
+    # Long polls pace themselves and are not throttled.
+    waiting = await async_client.get(
+        f"/api/tasks/{tasks[1].id}/run/123?waitSeconds=1",
+        headers=headers,
+    )
+    assert waiting.status_code == 200, waiting.text
+
     monkeypatch.setattr(candidate_submissions.settings, "ENV", "local")
     candidate_submissions._RATE_LIMIT_RULE.update(original_rule)
     candidate_submissions.rate_limit.limiter.reset()
@@ -833,7 +930,7 @@ async def test_get_run_result_github_error_maps_to_502(
     await async_session.commit()
 
     class ErrorRunner:
-        async def fetch_run_result(self, **_kwargs):
+        async def poll_run_result(self, **_kwargs):
             raise GithubError("nope")
 
     class StubGithubClient:
@@ -880,3 +977,203 @@ async def test_get_run_result_github_error_maps_to_502(
         )
 
     assert resp.status_code == 502
+
+
+@pytest.mark.asyncio
+async def test_get_run_result_serves_finished_runs_from_durable_store(
+    async_client, async_session, candidate_header_factory, actions_stubber
+):
+    runner = actions_stubber()
+    recruiter = await create_recruiter(async_session, email="run-durable@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    await create_submission(
+        async_session, candidate_session=cs, task=tasks[0], content_text="day1"
+    )
+    await async_session.commit()
+
+    headers = candidate_header_factory(cs)
+    await async_client.post(
+        f"/api/tasks/{tasks[1].id}/codespace/init",
+        headers=headers,
+        json={"githubUsername": "octocat"},
+    )
+    first = await async_client.get(f"/api/tasks/{tasks[1].id}/run/123", headers=headers)
+    assert first.status_code == 200, first.text
+
+    # A newer run replaces the workspace state; the old run must not refetch.
+    workspace = (await async_session.execute(select(Workspace))).scalar_one()
+    workspace.last_workflow_run_id = "999"
+    await async_session.commit()
+    runner._error = GithubError("should not be called", status_code=500)
+
+    again = await async_client.get(f"/api/tasks/{tasks[1].id}/run/123", headers=headers)
+    assert again.status_code == 200, again.text
+    body = again.json()
+    assert body["runId"] == 123
+    assert body["passed"] == 1
+    assert body["total"] == 1
+    assert body["stdout"] == "ok"
+
+
+def _running(run_id: int, github_status: str = "in_progress") -> ActionsRunResult:
+    return ActionsRunResult(
+        status="running",
+        run_id=run_id,
+        conclusion=None,
+        passed=None,
+        failed=None,
+        total=None,
+        stdout=None,
+        stderr=None,
+        head_sha="abc123",
+        html_url=None,
+        raw={"status": github_status},
+        poll_after_ms=2000,
+    )
+
+
+async def _init_code_task(async_client, async_session, candidate_header_factory, email):
+    recruiter = await create_recruiter(async_session, email=email)
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    await create_submission(
+        async_session, candidate_session=cs, task=tasks[0], content_text="day1"
+    )
+    await async_session.commit()
+    headers = candidate_header_factory(cs)
+    await async_client.post(
+        f"/api/tasks/{tasks[1].id}/codespace/init",
+        headers=headers,
+        json={"githubUsername": "octocat"},
+    )
+    return cs, tasks[1], headers
+
+
+@pytest.mark.asyncio
+async def test_get_run_result_long_polls_until_status_changes(
+    async_client, async_session, candidate_header_factory, actions_stubber, monkeypatch
+):
+    from contextlib import asynccontextmanager
+
+    from app.services.submissions.use_cases import fetch_run
+
+    guard_held = []
+
+    @asynccontextmanager
+    async def tracking_guard(*_args):
+        guard_held.append(True)
+        try:
+            yield
+        finally:
+            guard_held.pop()
+
+    monkeypatch.setattr(fetch_run, "concurrency_guard", tracking_guard)
+    runner = actions_stubber(result=_running(321))
+    cs, task, headers = await _init_code_task(
+        async_client, async_session, candidate_header_factory, "run-wait@sim.com"
+    )
+    finished = ActionsRunResult(
+        status="passed",
+        run_id=321,
+        conclusion="success",
+        passed=4,
+        failed=0,
+        total=4,
+        stdout="ok",
+        stderr=None,
+        head_sha="abc123",
+        html_url=None,
+    )
+
+    async def watch_run(**_kwargs):
+        # Parked requests must not hold the candidate's fetch slot.
+        assert not guard_held
+        for update in (_running(321), _running(321), finished):
+            yield update
+
+    runner.watch_run = watch_run
+    resp = await async_client.get(
+        f"/api/tasks/{task.id}/run/321?waitSeconds=5", headers=headers
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["status"] == "passed"
+    assert resp.json()["passed"] == 4
+
+    workspace = (
+        await async_session.execute(
+            select(Workspace).where(Workspace.candidate_session_id == cs.id)
+        )
+    ).scalar_one()
+    assert workspace.last_workflow_conclusion == "success"
+
+    too_long = await async_client.get(
+        f"/api/tasks/{task.id}/run/321?waitSeconds=600", headers=headers
+    )
+    assert too_long.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_run_events_stream_status_transitions(
+    async_client, async_session, candidate_header_factory, actions_stubber
+):
+    runner = actions_stubber(result=_running(654, "queued"))
+    cs, task, headers = await _init_code_task(
+        async_client, async_session, candidate_header_factory, "run-sse@sim.com"
+    )
+    finished = ActionsRunResult(
+        status="failed",
+        run_id=654,
+        conclusion="failure",
+        passed=1,
+        failed=2,
+        total=3,
+        stdout=None,
+        stderr=None,
+        head_sha="abc123",
+        html_url=None,
+    )
+
+    async def watch_run(**_kwargs):
+        for update in (_running(654, "queued"), _running(654), _running(654), finished):
+            yield update
+
+    runner.watch_run = watch_run
+    resp = await async_client.get(
+        f"/api/tasks/{task.id}/run/654/events", headers=headers
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = [block for block in resp.text.split("\n\n") if block]
+    assert [block.splitlines()[0] for block in events] == [
+        "event: queued",
+        ": keep-alive",
+        "event: in_progress",
+        ": keep-alive",
+        "event: completed",
+    ]
+    completed = json.loads(events[-1].splitlines()[1].removeprefix("data: "))
+    assert completed["failed"] == 2 and completed["status"] == "failed"
+
+    workspace = (
+        await async_session.execute(
+            select(Workspace).where(Workspace.candidate_session_id == cs.id)
+        )
+    ).scalar_one()
+    assert workspace.last_workflow_conclusion == "failure"
+
+    async def failing_watch(**_kwargs):
+        raise GithubError("down", status_code=502)
+        yield  # pragma: no cover
+
+    runner.watch_run = failing_watch
+    runner._result = _running(655)
+    errored = await async_client.get(
+        f"/api/tasks/{task.id}/run/655/events", headers=headers
+    )
+    assert "event: error" in errored.text
+    assert "GITHUB_UNAVAILABLE" in errored.text
@@ -1,3 +1,5 @@
+from datetime import UTC, datetime
+
 import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -490,3 +492,169 @@ async def test_submitting_all_tasks_marks_session_complete(
     ).scalar_one()
     assert cs_row.status == "completed"
     assert cs_row.completed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_async_code_submission_is_enriched_by_job(
+    async_client, async_session: AsyncSession, monkeypatch, actions_stubber
+):
+    from app.api.routers import tasks_codespaces as candidate_submissions
+    from app.core.settings import settings
+    from app.domains import SubmissionJob
+    from app.main import app
+    from app.repositories.submissions import job_repository as job_repo
+    from app.services.submissions.submission_jobs import process_submission_job
+
+    monkeypatch.setenv("DEV_AUTH_BYPASS", "1")
+    monkeypatch.setattr(settings.github, "GITHUB_ACTIONS_ASYNC_SUBMIT", True)
+    runner = actions_stubber()
+
+    recruiter_email = "recruiterA@tenon.com"
+    await seed_recruiter(
+        async_session, email=recruiter_email, company_name="Recruiter A"
+    )
+    sim = await create_simulation(async_client, recruiter_email)
+    invite = await invite_candidate(async_client, sim["id"], recruiter_email)
+    await claim_session(async_client, invite["token"], "jane@example.com")
+    cs_id = invite["candidateSessionId"]
+    access_token = "candidate:jane@example.com"
+
+    day1 = await get_current_task(async_client, cs_id, access_token)
+    ok = await async_client.post(
+        f"/api/tasks/{day1['currentTask']['id']}/submit",
+        headers=candidate_headers(cs_id, access_token),
+        json={"contentText": "design answer"},
+    )
+    assert ok.status_code == 201, ok.text
+    assert ok.json()["processingStatus"] is None
+
+    day2_task_id = (await get_current_task(async_client, cs_id, access_token))[
+        "currentTask"
+    ]["id"]
+    init_resp = await async_client.post(
+        f"/api/tasks/{day2_task_id}/codespace/init",
+        headers=candidate_headers(cs_id, access_token),
+        json={"githubUsername": "octocat"},
+    )
+    assert init_resp.status_code == 200, init_resp.text
+
+    # The runner must not be touched while the request is in flight.
+    runner._error = AssertionError("submit should not dispatch inline")
+    res = await async_client.post(
+        f"/api/tasks/{day2_task_id}/submit",
+        headers=candidate_headers(cs_id, access_token),
+        json={"branch": "main"},
+    )
+    assert res.status_code == 201, res.text
+    body = res.json()
+    assert body["processingStatus"] == "processing"
+    assert body["progress"]["completed"] == 2
+
+    detail = await async_client.get(
+        f"/api/submissions/{body['submissionId']}",
+        headers={"x-dev-user-email": recruiter_email},
+    )
+    assert detail.status_code == 200, detail.text
+    assert detail.json()["processingStatus"] == "processing"
+    assert detail.json()["processing"]["status"] == "pending"
+    assert detail.json()["workflowUrl"] is None
+
+    runner._error = None
+    runner.client = app.dependency_overrides[candidate_submissions.get_github_client]()
+    claimed = await job_repo.claim_due(
+        async_session, owner="test", now=datetime.now(UTC), lease_seconds=60
+    )
+    assert len(claimed) == 1
+    status = await process_submission_job(
+        async_session, claimed[0], runner=runner, owner="test"
+    )
+    assert status == "succeeded"
+
+    detail = await async_client.get(
+        f"/api/submissions/{body['submissionId']}",
+        headers={"x-dev-user-email": recruiter_email},
+    )
+    payload = detail.json()
+    assert payload["processingStatus"] == "ready"
+    assert payload["processing"]["status"] == "succeeded"
+    assert payload["processing"]["attempts"] == 0
+    assert payload["workflowUrl"]
+    job = (await async_session.execute(select(SubmissionJob))).scalar_one()
+    assert job.submission_id == body["submissionId"]
+
+
+@pytest.mark.asyncio
+async def test_code_submission_writes_in_one_transaction(
+    async_client, async_session: AsyncSession, db_engine, monkeypatch, actions_stubber
+):
+    from sqlalchemy import event
+
+    monkeypatch.setenv("DEV_AUTH_BYPASS", "1")
+    actions_stubber()
+
+    recruiter_email = "recruiterA@tenon.com"
+    await seed_recruiter(
+        async_session, email=recruiter_email, company_name="Recruiter A"
+    )
+    sim = await create_simulation(async_client, recruiter_email)
+    invite = await invite_candidate(async_client, sim["id"], recruiter_email)
+    await claim_session(async_client, invite["token"], "jane@example.com")
+    cs_id = invite["candidateSessionId"]
+    access_token = "candidate:jane@example.com"
+
+    day1 = await get_current_task(async_client, cs_id, access_token)
+    ok = await async_client.post(
+        f"/api/tasks/{day1['currentTask']['id']}/submit",
+        headers=candidate_headers(cs_id, access_token),
+        json={"contentText": "design answer"},
+    )
+    assert ok.status_code == 201, ok.text
+    day2_task_id = (await get_current_task(async_client, cs_id, access_token))[
+        "currentTask"
+    ]["id"]
+    init_resp = await async_client.post(
+        f"/api/tasks/{day2_task_id}/codespace/init",
+        headers=candidate_headers(cs_id, access_token),
+        json={"githubUsername": "octocat"},
+    )
+    assert init_resp.status_code == 200, init_resp.text
+
+    statements: list[str] = []
+    commits: list[int] = []
+
+    def _on_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement.split(None, 1)[0].upper())
+
+    def _on_commit(_conn):
+        commits.append(1)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _on_execute)
+    event.listen(db_engine.sync_engine, "commit", _on_commit)
+    try:
+        res = await async_client.post(
+            f"/api/tasks/{day2_task_id}/submit",
+            headers=candidate_headers(cs_id, access_token),
+            json={},
+        )
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", _on_execute)
+        event.remove(db_engine.sync_engine, "commit", _on_commit)
+    assert res.status_code == 201, res.text
+    # Workspace run state, run result and submission land in one commit, and
+    # progress reuses the validation snapshot instead of re-querying (this
+    # used to take 16 statements over two commits).
+    assert len(commits) == 1
+    assert statements.count("INSERT") == 2
+    assert len(statements) <= 12, statements
+
+    sub = (
+        await async_session.execute(
+            select(Submission).where(Submission.task_id == day2_task_id)
+        )
+    ).scalar_one()
+    workspace = (
+        await async_session.execute(
+            select(Workspace).where(Workspace.task_id == day2_task_id)
+        )
+    ).scalar_one()
+    assert sub.workflow_run_id == workspace.last_workflow_run_id == "123"
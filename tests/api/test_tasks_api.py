@@ -256,6 +256,78 @@ async def test_submit_code_task_persists_actions_results(
     assert detail_body["diffUrl"].endswith("base-sha-123...abc123")
 
 
+@pytest.mark.asyncio
+async def test_diff_patches_are_stored_apart_and_only_served_on_detail(
+    async_client, async_session, candidate_header_factory, actions_stubber, monkeypatch
+):
+    from app.api.routers import tasks_codespaces as candidate_submissions
+    from app.domains import SubmissionDiffPatch
+    from app.main import app
+
+    recruiter = await create_recruiter(async_session, email="patches@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    await create_submission(
+        async_session, candidate_session=cs, task=tasks[0], content_text="day1"
+    )
+    await async_session.commit()
+    actions_stubber()
+
+    async def _compare(self, repo_full_name, base, head, *, page=None):
+        return {
+            "files": [
+                {"filename": "app.py", "status": "modified", "patch": "@@ -1 +1 @@"},
+                {"filename": "logo.png", "status": "added"},
+            ]
+        }
+
+    client_cls = type(
+        app.dependency_overrides[candidate_submissions.get_github_client]()
+    )
+    monkeypatch.setattr(client_cls, "get_compare", _compare)
+
+    headers = candidate_header_factory(cs)
+    await async_client.post(
+        f"/api/tasks/{tasks[1].id}/codespace/init",
+        headers=headers,
+        json={"githubUsername": "octocat"},
+    )
+    resp = await async_client.post(
+        f"/api/tasks/{tasks[1].id}/submit", headers=headers, json={}
+    )
+    assert resp.status_code == 201, resp.text
+    sub_id = resp.json()["submissionId"]
+
+    sub = await async_session.get(Submission, sub_id)
+    assert "patch" not in (sub.diff_summary_json or "")
+    assert await async_session.get(SubmissionDiffPatch, sub_id) is not None
+
+    recruiter_headers = {"x-dev-user-email": recruiter.email}
+    listing = await async_client.get(
+        f"/api/submissions?candidateSessionId={cs.id}", headers=recruiter_headers
+    )
+    assert listing.status_code == 200, listing.text
+    item = next(i for i in listing.json()["items"] if i["submissionId"] == sub_id)
+    assert item["diffSummary"]["filesChanged"] == 2
+    assert set(item["diffSummary"]) == {
+        "base",
+        "head",
+        "filesChanged",
+        "additions",
+        "deletions",
+    }
+
+    detail = await async_client.get(
+        f"/api/submissions/{sub_id}", headers=recruiter_headers
+    )
+    assert detail.status_code == 200, detail.text
+    files = detail.json()["diffSummary"]["files"]
+    assert files[0]["patch"] == "@@ -1 +1 @@"
+    assert "patch" not in files[1]
+
+
 @pytest.mark.asyncio
 async def test_submit_text_task_leaves_test_fields_null(
     async_client, async_session, candidate_header_factory
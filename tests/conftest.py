@@ -18,11 +18,12 @@ from app.api.dependencies.github_native import get_github_client
 from app.api.routers import tasks_codespaces as candidate_submissions
 from app.core.auth.current_user import get_current_user
 from app.core.auth.principal import Principal, get_principal
-from app.core.db import get_session
+from app.core.db import get_session, get_session_maker
 from app.core.settings import settings
 from app.domains import Base, User
 from app.integrations.github.actions_runner import ActionsRunResult
 from app.main import app
+from app.repositories.tasks.snapshot_cache import clear_task_cache
 
 settings.ENV = "test"
 settings.RATE_LIMIT_ENABLED = None
@@ -51,6 +52,8 @@ async def db_session(db_engine):
     async with db_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+    # Row ids repeat across the per-test databases, so cached tasks must go too.
+    clear_task_cache()
     session_maker = async_sessionmaker(
         bind=db_engine, expire_on_commit=False, autoflush=False, class_=AsyncSession
     )
@@ -119,6 +122,11 @@ async def async_client(db_session: AsyncSession):
     async def override_get_session():
         yield db_session
 
+    # Streamed bodies open their own sessions, against the same test database.
+    stream_session_maker = async_sessionmaker(
+        bind=db_session.bind, expire_on_commit=False, autoflush=False, class_=AsyncSession
+    )
+
     async def override_get_current_user(request: Request) -> User:
         email = (request.headers.get("x-dev-user-email") or "").strip()
         if not email:
@@ -174,6 +182,7 @@ async def async_client(db_session: AsyncSession):
         )
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_session_maker] = lambda: stream_session_maker
     app.dependency_overrides[get_current_user] = override_get_current_user
     app.dependency_overrides[get_principal] = override_get_principal
     app.dependency_overrides[get_github_client] = lambda: StubGithubClient()
@@ -182,6 +191,7 @@ async def async_client(db_session: AsyncSession):
         yield client
 
     app.dependency_overrides.pop(get_session, None)
+    app.dependency_overrides.pop(get_session_maker, None)
     app.dependency_overrides.pop(get_current_user, None)
     app.dependency_overrides.pop(get_principal, None)
     app.dependency_overrides.pop(get_github_client, None)
@@ -214,11 +224,26 @@ def actions_stubber():
                     raise self._error
                 return self._result
 
+            async def dispatch_run(self, **_kwargs):
+                if self._error:
+                    raise self._error
+                return self._result
+
             async def fetch_run_result(self, **_kwargs):
                 if self._error:
                     raise self._error
                 return self._result
 
+            async def poll_run_result(self, **_kwargs):
+                if self._error:
+                    raise self._error
+                return self._result
+
+            async def watch_run(self, **_kwargs):
+                if self._error:
+                    raise self._error
+                yield self._result
+
         class StubGithubClient:
             async def generate_repo_from_template(
                 self,
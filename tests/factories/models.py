@@ -6,7 +6,9 @@ from datetime import UTC, datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domains import CandidateSession, Company, Simulation, Submission, Task, User
+from app.domains.candidate_sessions import repository as cs_repo
 from app.domains.simulations.blueprints import DEFAULT_5_DAY_BLUEPRINT
+from app.domains.submissions.presenter.materialize import materialize_list_fields
 from app.services.tasks.template_catalog import (
     DEFAULT_TEMPLATE_KEY,
     resolve_template_repo_full_name,
@@ -157,6 +159,18 @@ async def create_submission(
         test_output=test_output,
         last_run_at=last_run_at,
     )
+    materialize_list_fields(submission)
     session.add(submission)
     await session.flush()
+    # Keep the session's progress counters in step, without touching status.
+    candidate_session.current_task_id = await cs_repo.next_open_task_id(
+        session, candidate_session, submitted_task_id=task.id
+    )
+    candidate_session.completed_task_count = (
+        candidate_session.completed_task_count or 0
+    ) + 1
+    candidate_session.last_submitted_at = max(
+        filter(None, (candidate_session.last_submitted_at, submission.submitted_at))
+    )
+    await session.flush()
     return submission
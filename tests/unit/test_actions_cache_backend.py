@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.integrations.github.actions_runner import GithubActionsRunner
+from app.integrations.github.actions_runner.cache import ActionsCache
+from app.integrations.github.actions_runner.cache_backend import (
+    InMemoryActionsCacheBackend,
+)
+from app.integrations.github.client import GithubClient, WorkflowRun
+from app.repositories.github_native.actions_cache.repository import (
+    DatabaseActionsCacheBackend,
+)
+
+
+def _results_zip() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr(
+            "tenon-test-results.json",
+            json.dumps({"passed": 3, "failed": 0, "total": 3, "stdout": "ok"}),
+        )
+    return buf.getvalue()
+
+
+class _RunClient(GithubClient):
+    def __init__(self, status: str = "completed"):
+        super().__init__(base_url="https://api.github.com", token="x")
+        self.status = status
+        self.calls: list[str] = []
+
+    async def get_workflow_run(self, repo_full_name, run_id):
+        self.calls.append("run")
+        completed = self.status == "completed"
+        return WorkflowRun(
+            id=run_id,
+            status=self.status,
+            conclusion="success" if completed else None,
+            html_url=None,
+            head_sha="abc",
+        )
+
+    async def list_artifacts(self, repo_full_name, run_id):
+        self.calls.append("artifacts")
+        return [{"id": 9, "name": "tenon-test-results", "expired": False}]
+
+    async def download_artifact_file(self, repo_full_name, artifact_id):
+        self.calls.append("download")
+        return io.BytesIO(_results_zip())
+
+
+def _runner(client: GithubClient, backend) -> GithubActionsRunner:
+    return GithubActionsRunner(
+        client,
+        workflow_file="ci.yml",
+        poll_interval_seconds=0.5,
+        cache=ActionsCache(backend=backend, running_ttl_seconds=60),
+    )
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_expires_and_deletes_by_prefix(monkeypatch):
+    backend = InMemoryActionsCacheBackend(max_entries=2)
+    await backend.set("artifact:org/repo:1:1", {"v": 1}, ttl_seconds=None)
+    await backend.set("artifact:org/repo:12:1", {"v": 2}, ttl_seconds=None)
+    await backend.delete_prefix("artifact:org/repo:1:")
+    assert await backend.get("artifact:org/repo:1:1") is None
+    assert await backend.get("artifact:org/repo:12:1") == {"v": 2}
+
+    await backend.set("a", {"v": 3}, ttl_seconds=None)
+    await backend.set("b", {"v": 4}, ttl_seconds=None)
+    assert await backend.get("artifact:org/repo:12:1") is None
+
+    await backend.set("short", {"v": 5}, ttl_seconds=0.01)
+    monkeypatch.setattr(
+        "app.integrations.github.actions_runner.cache_backend.time.monotonic",
+        lambda: 1e12,
+    )
+    assert await backend.get("short") is None
+    await backend.delete("a", "missing")
+    assert await backend.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_database_backend_shares_results_between_workers(
+    async_session, db_engine
+):
+    backend = DatabaseActionsCacheBackend(
+        async_sessionmaker(bind=db_engine, expire_on_commit=False, class_=AsyncSession)
+    )
+    first_client, second_client = _RunClient(), _RunClient()
+
+    first = await _runner(first_client, backend).fetch_run_result(
+        repo_full_name="org/repo", run_id=5
+    )
+    assert first.passed == 3
+    assert first_client.calls == ["run", "artifacts", "download"]
+
+    second = await _runner(second_client, backend).fetch_run_result(
+        repo_full_name="org/repo", run_id=5
+    )
+    assert second.passed == 3 and second.conclusion == "success"
+    assert second_client.calls == []
+
+    await backend.set("run:org/repo:6", {"stale": True}, ttl_seconds=-1)
+    assert await backend.get("run:org/repo:6") is None
+    await backend.set("run:org/repo:6", {"fresh": True}, ttl_seconds=None)
+    assert await backend.get("run:org/repo:6") == {"fresh": True}
+    await backend.delete_prefix("run:org/repo:")
+    await backend.delete()
+    assert await backend.get("run:org/repo:6") is None
+
+
+@pytest.mark.asyncio
+async def test_running_results_share_backoff_and_are_invalidated_on_completion():
+    backend = InMemoryActionsCacheBackend()
+    client = _RunClient(status="in_progress")
+    worker_a = _runner(client, backend)
+    worker_b = _runner(_RunClient(status="in_progress"), backend)
+
+    running = await worker_a.fetch_run_result(repo_full_name="org/repo", run_id=7)
+    assert running.status == "running"
+    assert running.poll_after_ms == 500
+    # Within the running TTL another worker reuses the shared result.
+    reused = await worker_b.fetch_run_result(repo_full_name="org/repo", run_id=7)
+    assert reused.status == "running"
+    assert worker_b.client.calls == []
+
+    # Once the TTL lapses the next worker continues the shared backoff.
+    await backend.delete("run:org/repo:7")
+    again = await worker_b.fetch_run_result(repo_full_name="org/repo", run_id=7)
+    assert again.poll_after_ms == 1000
+
+    # Artifacts seen mid-run are dropped when the run completes.
+    await worker_a.cache.store_artifact_result(("org/repo", 7, 9), None, "stale")
+    client.status = "completed"
+    client.calls.clear()
+    await backend.delete("run:org/repo:7")
+    done = await worker_a.fetch_run_result(repo_full_name="org/repo", run_id=7)
+    assert done.status == "passed"
+    assert client.calls == ["run", "artifacts", "download"]
+    assert await backend.get("attempts:org/repo:7") is None
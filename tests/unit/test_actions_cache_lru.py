@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from app.integrations.github.actions_runner.cache import ActionsCache
+from app.integrations.github.actions_runner.lru import (
+    ENTRY_OVERHEAD_BYTES,
+    SizedLRU,
+    estimate_size,
+)
+from app.integrations.github.actions_runner.models import ActionsRunResult
+from app.integrations.github.artifacts import ParsedTestResults
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _run(run_id: int, status: str = "passed") -> ActionsRunResult:
+    return ActionsRunResult(
+        status=status,
+        run_id=run_id,
+        conclusion="success" if status == "passed" else None,
+        passed=None,
+        failed=None,
+        total=None,
+        stdout=None,
+        stderr=None,
+        head_sha="abc",
+        html_url=None,
+        raw=None,
+    )
+
+
+def test_sized_lru_evicts_by_bytes_and_counts_stats():
+    evicted: list[str] = []
+    lru = SizedLRU(
+        max_entries=10,
+        max_bytes=3 * (100 + ENTRY_OVERHEAD_BYTES),
+        on_evict=lambda key, _value: evicted.append(key),
+    )
+    for key in ("a", "b", "c"):
+        lru.put(key, "x" * 100, ttl_seconds=None)
+    assert lru.get("a") == "x" * 100
+    lru.put("d", "x" * 100, ttl_seconds=None)
+
+    assert evicted == ["b"]
+    assert "b" not in lru and list(lru) == ["c", "a", "d"]
+    assert lru.get("b") is None
+    # Overwriting a key replaces its size without firing the eviction hook.
+    lru.put("a", "y", ttl_seconds=None)
+    assert evicted == ["b"]
+    assert lru.stats() == {
+        "entries": 3,
+        "bytes": 200 + 1 + 3 * ENTRY_OVERHEAD_BYTES,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+    }
+
+    # A value larger than the whole budget is not retained.
+    lru.put("huge", "x" * 10_000, ttl_seconds=None)
+    assert len(lru) == 0 and lru.bytes_held == 0
+
+
+def test_sized_lru_expires_entries_per_ttl():
+    clock = _Clock()
+    lru = SizedLRU(max_entries=10, max_bytes=10_000, clock=clock)
+    lru.put("short", 1, ttl_seconds=5)
+    lru.put("long", 2, ttl_seconds=100)
+    lru.put("forever", 3, ttl_seconds=None)
+
+    clock.now = 10
+    assert "short" not in lru
+    assert lru.get("long") == 2 and lru["forever"] == 3
+    clock.now = 1_000
+    assert lru.get("long") is None
+    assert lru.stats()["expirations"] == 2
+    assert lru.pop("missing", "default") == "default"
+
+
+def test_estimate_size_counts_nested_payloads():
+    parsed = ParsedTestResults(
+        passed=1, failed=0, total=1, stdout="o" * 500, stderr=None, summary=None
+    )
+    assert estimate_size(parsed) > 500
+    assert estimate_size({"k": ["v" * 10]}) > 10
+    assert estimate_size(object()) > 0
+
+
+def test_actions_cache_ttls_index_and_stats():
+    cache = ActionsCache(
+        max_entries=8,
+        running_ttl_seconds=1,
+        stale_running_ttl_seconds=30,
+        terminal_ttl_seconds=3_600,
+    )
+    clock = _Clock()
+    for lru in (cache.run_cache, cache.artifact_cache, cache.artifact_list_cache):
+        lru._clock = clock
+
+    cache.poll_attempts[("org/repo", 1)] = 3
+    cache.cache_run(("org/repo", 1), _run(1, status="running"))
+    cache.cache_run(("org/repo", 2), _run(2))
+    clock.now = 60
+    # Running results go stale quickly and take their backoff with them.
+    assert cache.run_cache.get(("org/repo", 1)) is None
+    assert ("org/repo", 1) not in cache.poll_attempts
+    assert cache.run_cache.get(("org/repo", 2)).status == "passed"
+
+    cache.cache_artifact_list(("org/repo", 2), [{"id": 5}])
+    cache.cache_artifact_result(("org/repo", 2, 5), None, "boom")
+    cache.cache_artifact_result(("org/repo", 3, 6), None, "other")
+    assert cache.artifact_keys_by_run[("org/repo", 2)] == {("org/repo", 2, 5)}
+    cache.drop_run_artifacts(("org/repo", 2))
+    assert ("org/repo", 2) not in cache.artifact_list_cache
+    assert ("org/repo", 2, 5) not in cache.artifact_cache
+    assert ("org/repo", 2) not in cache.artifact_keys_by_run
+    assert ("org/repo", 3, 6) in cache.artifact_cache
+
+    cache.artifact_cache.pop(("org/repo", 3, 6))
+    assert cache.artifact_keys_by_run == {}
+
+    cache.max_entries = 2
+    assert cache.artifact_cache.max_entries == 2
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["runs"]["expirations"] == 1
+    assert stats["bytes"] == cache.run_cache.bytes_held
+    assert stats["pollAttempts"] == 0
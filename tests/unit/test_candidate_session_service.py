@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from types import SimpleNamespace
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import update
 
 from app.core.auth.principal import Principal
 from app.core.settings import settings
+from app.domains import CandidateSession
 from app.domains.candidate_sessions import service as cs_service
 from tests.factories import (
     create_candidate_session,
@@ -168,27 +171,17 @@ async def test_fetch_owned_session_updates_status(async_session):
 
 
 class _DummyDB:
-    def __init__(self, cs_for_update):
-        self.cs_for_update = cs_for_update
-
-    def begin_nested(self):
-        return self
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-
     async def commit(self):
         self.committed = True
 
-    async def refresh(self, obj):
-        self.refreshed = obj
+
+async def _lose_claim_race(db, candidate_session, *, expected_sub, values):
+    assert expected_sub is None
+    return False
 
 
 @pytest.mark.asyncio
-async def test_fetch_owned_session_missing_after_lock(monkeypatch):
+async def test_fetch_owned_session_missing_after_lost_claim(monkeypatch):
     principal = _principal("lock@test.com")
     cs_stub = type(
         "CS",
@@ -203,27 +196,22 @@ async def test_fetch_owned_session_missing_after_lock(monkeypatch):
             "status": "not_started",
         },
     )()
+    reads = iter([cs_stub, None])
 
-    async def fake_get_by_id(db, session_id):
-        return cs_stub
-
-    async def fake_get_by_id_for_update(db, session_id):
-        return None
+    async def fake_get_by_id(db, session_id, **_kw):
+        return next(reads)
 
     monkeypatch.setattr(cs_service.cs_repo, "get_by_id", fake_get_by_id)
-    monkeypatch.setattr(
-        cs_service.cs_repo, "get_by_id_for_update", fake_get_by_id_for_update
-    )
-    dummy_db = _DummyDB(None)
+    monkeypatch.setattr(cs_service.cs_repo, "update_if_owner", _lose_claim_race)
     with pytest.raises(HTTPException) as excinfo:
         await cs_service.fetch_owned_session(
-            dummy_db, 1, principal, now=datetime.now(UTC)
+            _DummyDB(), 1, principal, now=datetime.now(UTC)
         )
     assert excinfo.value.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_fetch_owned_session_conflict_after_lock(monkeypatch):
+async def test_fetch_owned_session_claimed_by_other_after_lost_claim(monkeypatch):
     principal = _principal("conflict@test.com")
     cs_stub = type(
         "CS",
@@ -251,23 +239,78 @@ async def test_fetch_owned_session_conflict_after_lock(monkeypatch):
             "status": "not_started",
         },
     )()
+    reads = iter([cs_stub, conflicting])
 
-    async def fake_get_by_id(db, session_id):
-        return cs_stub
-
-    async def fake_get_by_id_for_update(db, session_id):
-        return conflicting
+    async def fake_get_by_id(db, session_id, **_kw):
+        return next(reads)
 
     monkeypatch.setattr(cs_service.cs_repo, "get_by_id", fake_get_by_id)
-    monkeypatch.setattr(
-        cs_service.cs_repo, "get_by_id_for_update", fake_get_by_id_for_update
-    )
-    dummy_db = _DummyDB(conflicting)
+    monkeypatch.setattr(cs_service.cs_repo, "update_if_owner", _lose_claim_race)
+    dummy_db = _DummyDB()
     with pytest.raises(HTTPException) as excinfo:
         await cs_service.fetch_owned_session(
             dummy_db, 1, principal, now=datetime.now(UTC)
         )
     assert excinfo.value.status_code == 404
+    assert not hasattr(dummy_db, "committed")
+
+
+@pytest.mark.asyncio
+async def test_fetch_owned_session_same_principal_won_claim_race(async_session):
+    recruiter = await create_recruiter(async_session, email="race@sim.com")
+    sim, _ = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(async_session, simulation=sim)
+    principal = _principal(cs.invite_email)
+    await async_session.commit()
+
+    # Claimed by a concurrent request of the same candidate after our read.
+    await async_session.execute(
+        update(CandidateSession)
+        .where(CandidateSession.id == cs.id)
+        .values(candidate_auth0_sub=principal.sub, status="in_progress")
+        .execution_options(synchronize_session=False)
+    )
+    loaded = await cs_service.fetch_owned_session(async_session, cs.id, principal)
+    assert loaded.candidate_auth0_sub == principal.sub
+    assert loaded.status == "in_progress"
+
+
+@pytest.mark.asyncio
+async def test_fetch_owned_session_is_lock_free(async_session, db_engine):
+    from sqlalchemy import event
+
+    recruiter = await create_recruiter(async_session, email="lockfree@sim.com")
+    sim, _ = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="not_started"
+    )
+    principal = _principal(cs.invite_email)
+    await async_session.commit()
+
+    statements: list[str] = []
+
+    def _on_execute(_conn, _cursor, statement, *_args):
+        statements.append(" ".join(statement.split()).upper())
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _on_execute)
+    try:
+        claimed = await cs_service.fetch_owned_session(async_session, cs.id, principal)
+        first = list(statements)
+        statements.clear()
+        again = await cs_service.fetch_owned_session(async_session, cs.id, principal)
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", _on_execute)
+
+    assert claimed.candidate_auth0_sub == principal.sub
+    assert claimed.status == "in_progress"
+    assert claimed.claimed_at is not None and claimed.started_at is not None
+    # Read, then one conditional UPDATE ... RETURNING; no lock, no refresh.
+    assert len(first) == 2, first
+    assert first[1].startswith("UPDATE CANDIDATE_SESSIONS")
+    assert not any("FOR UPDATE" in s for s in first)
+    # Already bound and in progress: a single plain SELECT.
+    assert again is claimed
+    assert len(statements) == 1 and statements[0].startswith("SELECT")
 
 
 @pytest.mark.asyncio
@@ -387,3 +430,133 @@ async def test_invite_list_for_principal_includes_progress(async_session):
     assert invite.candidateSessionId == cs.id
     assert invite.progress.completed == 1
     assert invite.progress.total == len(tasks)
+
+
+@pytest.mark.asyncio
+async def test_invite_list_progress_uses_constant_queries(async_session, db_engine):
+    from sqlalchemy import event
+
+    recruiter = await create_recruiter(async_session, email="bulk@sim.com")
+    sims = [
+        await create_simulation(async_session, created_by=recruiter) for _ in range(3)
+    ]
+    for sim, tasks in sims:
+        cs = await create_candidate_session(
+            async_session,
+            simulation=sim,
+            invite_email="bulk@example.com",
+            status="in_progress",
+        )
+        await create_submission(
+            async_session, candidate_session=cs, task=tasks[0], content_text="d1"
+        )
+    await async_session.commit()
+
+    statements: list[str] = []
+
+    def _on_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _on_execute)
+    try:
+        invites = await cs_service.invite_list_for_principal(
+            async_session, _principal("bulk@example.com")
+        )
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", _on_execute)
+
+    assert len(invites) == 3
+    assert {(i.progress.completed, i.progress.total) for i in invites} == {
+        (1, len(sims[0][1]))
+    }
+    # Sessions (with simulation/company loads), last activity and progress,
+    # independent of the invite count; this used to add two queries per invite.
+    assert len(statements) <= 5, statements
+
+
+@pytest.mark.asyncio
+async def test_progress_counters_follow_submissions(async_session, db_engine):
+    from sqlalchemy import event
+
+    from app.domains.submissions import service_candidate as submission_service
+
+    recruiter = await create_recruiter(async_session, email="counters@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    await async_session.commit()
+
+    current, completed, total, is_complete = await cs_service.progress_counters(
+        async_session, cs
+    )
+    assert (current.id, completed, total, is_complete) == (tasks[0].id, 0, 5, False)
+
+    now = datetime.now(UTC)
+    await submission_service.create_submission(
+        async_session, cs, tasks[0], SimpleNamespace(contentText="d1"), now=now
+    )
+    assert cs.completed_task_count == 1
+    assert cs.current_task_id == tasks[1].id
+    assert cs.last_submitted_at is not None
+
+    statements: list[str] = []
+
+    def _on_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _on_execute)
+    try:
+        current, completed, total, is_complete = await cs_service.progress_counters(
+            async_session, cs
+        )
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", _on_execute)
+    assert (current.id, completed, total, is_complete) == (tasks[1].id, 1, 5, False)
+    # Counters live on the session and the task list in the process cache.
+    assert statements == []
+
+    for task in tasks[1:]:
+        await submission_service.create_submission(
+            async_session, cs, task, SimpleNamespace(contentText="x"), now=now
+        )
+    assert cs.status == "completed"
+    assert cs.completed_at is not None
+    current, completed, total, is_complete = await cs_service.progress_counters(
+        async_session, cs
+    )
+    assert (current, completed, total, is_complete) == (None, 5, 5, True)
+    assert await cs_service.check_progress_counters(async_session, [cs.id]) == []
+
+
+@pytest.mark.asyncio
+async def test_check_progress_counters_reports_and_repairs_drift(async_session):
+    recruiter = await create_recruiter(async_session, email="drift@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    fresh = await create_candidate_session(
+        async_session, simulation=sim, invite_email="fresh@example.com"
+    )
+    sub = await create_submission(
+        async_session, candidate_session=cs, task=tasks[0], content_text="d1"
+    )
+    cs.completed_task_count = 0
+    cs.current_task_id = None
+    await async_session.commit()
+
+    drift = await cs_service.check_progress_counters(async_session)
+    assert [d.candidate_session_id for d in drift] == [cs.id]
+    assert drift[0].completed_task_count == 1
+    assert drift[0].current_task_id == tasks[1].id
+    assert drift[0].last_submitted_at.replace(tzinfo=None) == sub.submitted_at.replace(
+        tzinfo=None
+    )
+
+    await cs_service.check_progress_counters(async_session, [cs.id], repair=True)
+    await async_session.refresh(cs)
+    assert (cs.completed_task_count, cs.current_task_id) == (1, tasks[1].id)
+    assert (
+        await cs_service.check_progress_counters(async_session, [cs.id, fresh.id]) == []
+    )
@@ -83,21 +83,20 @@ async def test_get_current_task_marks_completed(monkeypatch):
         assert session_id == cs.id
         return cs
 
-    async def _progress_snapshot(db, candidate_session):
-        return (
-            [current_task],
-            {1, 2, 3},
-            current_task,
-            3,
-            3,
-            True,
-        )
+    async def _progress_counters(db, candidate_session):
+        return (current_task, 3, 3, True)
+
+    async def _completed_task_ids(db, candidate_session_id):
+        return {1, 2, 3}
 
     monkeypatch.setattr(
         candidate_sessions.cs_service, "fetch_owned_session", _fetch_by_id
     )
     monkeypatch.setattr(
-        candidate_sessions.cs_service, "progress_snapshot", _progress_snapshot
+        candidate_sessions.cs_service, "progress_counters", _progress_counters
+    )
+    monkeypatch.setattr(
+        candidate_sessions.cs_service, "completed_task_ids", _completed_task_ids
     )
 
     resp = await candidate_sessions.get_current_task(
@@ -71,8 +71,6 @@ async def test_candidate_session_rate_limits(monkeypatch):
 
     async def fake_progress(db, cs):
         return (
-            [],
-            set(),
             SimpleNamespace(
                 id=9, day_index=1, title="Task", type="code", description=""
             ),
@@ -81,6 +79,9 @@ async def test_candidate_session_rate_limits(monkeypatch):
             True,
         )
 
+    async def fake_completed_ids(db, cs_id):
+        return set()
+
     async def fake_invites(db, principal):
         return []
 
@@ -91,7 +92,10 @@ async def test_candidate_session_rate_limits(monkeypatch):
         candidate_sessions.cs_service, "fetch_owned_session", fake_fetch
     )
     monkeypatch.setattr(
-        candidate_sessions.cs_service, "progress_snapshot", fake_progress
+        candidate_sessions.cs_service, "progress_counters", fake_progress
+    )
+    monkeypatch.setattr(
+        candidate_sessions.cs_service, "completed_task_ids", fake_completed_ids
     )
     monkeypatch.setattr(
         candidate_sessions.cs_service, "invite_list_for_principal", fake_invites
@@ -113,10 +113,10 @@ async def test_init_codespace_success_path(monkeypatch, async_session):
     )
 
     async def _return_snapshot(*_a, **_k):
-        return ([], set(), task, 0, 1, False)
+        return (task, 0, 1, False)
 
     monkeypatch.setattr(
-        candidate_submissions.cs_service, "progress_snapshot", _return_snapshot
+        candidate_submissions.cs_service, "progress_counters", _return_snapshot
     )
     monkeypatch.setattr(
         candidate_submissions.submission_service,
@@ -174,10 +174,10 @@ async def test_init_codespace_normalizes_legacy_url(monkeypatch, async_session):
     )
 
     async def _return_snapshot(*_a, **_k):
-        return ([], set(), task, 0, 1, False)
+        return (task, 0, 1, False)
 
     monkeypatch.setattr(
-        candidate_submissions.cs_service, "progress_snapshot", _return_snapshot
+        candidate_submissions.cs_service, "progress_counters", _return_snapshot
     )
     monkeypatch.setattr(
         candidate_submissions.submission_service,
@@ -234,10 +234,10 @@ async def test_init_codespace_missing_repo_full_name(monkeypatch, async_session)
     )
 
     async def _return_snapshot(*_a, **_k):
-        return ([], set(), task, 0, 1, False)
+        return (task, 0, 1, False)
 
     monkeypatch.setattr(
-        candidate_submissions.cs_service, "progress_snapshot", _return_snapshot
+        candidate_submissions.cs_service, "progress_counters", _return_snapshot
     )
     monkeypatch.setattr(
         candidate_submissions.submission_service,
@@ -290,10 +290,10 @@ async def test_init_codespace_maps_github_error(monkeypatch, async_session):
     )
 
     async def _return_snapshot(*_a, **_k):
-        return ([], set(), task, 0, 1, False)
+        return (task, 0, 1, False)
 
     monkeypatch.setattr(
-        candidate_submissions.cs_service, "progress_snapshot", _return_snapshot
+        candidate_submissions.cs_service, "progress_counters", _return_snapshot
     )
 
     async def _raise_workspace(*_a, **_kw):
@@ -558,7 +558,7 @@ async def test_get_run_result_success_direct(monkeypatch, async_session):
     )
 
     class Runner:
-        async def fetch_run_result(self, **_kwargs):
+        async def poll_run_result(self, **_kwargs):
             return result
 
     resp = await candidate_submissions.get_run_result(
@@ -602,10 +602,10 @@ async def test_submit_task_code_path(monkeypatch, async_session):
     )
 
     async def _return_snapshot(*_a, **_k):
-        return ([], set(), task, 0, 1, False)
+        return (task, 0, 1, False)
 
     monkeypatch.setattr(
-        candidate_submissions.cs_service, "progress_snapshot", _return_snapshot
+        candidate_submissions.cs_service, "progress_counters", _return_snapshot
     )
     monkeypatch.setattr(
         candidate_submissions.submission_service,
@@ -713,10 +713,10 @@ async def test_compute_current_task_returns_current(monkeypatch, async_session):
     current = _stub_task()
 
     async def _fake_snapshot(db, _cs):
-        return ([], set(), current, 0, 1, False)
+        return (current, 0, 1, False)
 
     monkeypatch.setattr(
-        candidate_submissions.cs_service, "progress_snapshot", _fake_snapshot
+        candidate_submissions.cs_service, "progress_counters", _fake_snapshot
     )
     assert (
         await candidate_submissions._compute_current_task(async_session, cs) is current
@@ -921,7 +921,7 @@ async def test_get_run_result_github_error(monkeypatch, async_session):
     )
 
     class Runner:
-        async def fetch_run_result(self, **_kw):
+        async def poll_run_result(self, **_kw):
             raise GithubError("fail")
 
     with pytest.raises(HTTPException) as excinfo:
@@ -961,10 +961,10 @@ async def test_submit_task_missing_workspace(monkeypatch, async_session):
     )
 
     async def _return_snapshot(*_a, **_k):
-        return ([], set(), task, 0, 1, False)
+        return (task, 0, 1, False)
 
     monkeypatch.setattr(
-        candidate_submissions.cs_service, "progress_snapshot", _return_snapshot
+        candidate_submissions.cs_service, "progress_counters", _return_snapshot
     )
     monkeypatch.setattr(
         candidate_submissions.submission_service,
@@ -1010,10 +1010,10 @@ async def test_submit_task_github_error(monkeypatch, async_session):
     workspace = _stub_workspace()
 
     async def _return_snapshot(*_a, **_k):
-        return ([], set(), task, 0, 1, False)
+        return (task, 0, 1, False)
 
     monkeypatch.setattr(
-        candidate_submissions.cs_service, "progress_snapshot", _return_snapshot
+        candidate_submissions.cs_service, "progress_counters", _return_snapshot
     )
     monkeypatch.setattr(
         candidate_submissions.submission_service,
@@ -221,7 +221,7 @@ async def test_fetch_run_result_and_artifact_parsing_paths(monkeypatch):
                 {"id": 99, "name": "other"},
             ]
 
-        async def download_artifact_zip(self, *_a, **_k):
+        async def download_artifact_file(self, *_a, **_k):
             raise GithubError("fail")
 
     runner = GithubActionsRunner(ArtifactClient(), workflow_file="ci.yml")
@@ -403,7 +403,7 @@ async def test_parse_artifacts_uses_cache():
             self.list_calls += 1
             return [{"id": 123, "name": "tenon-test-results"}]
 
-        async def download_artifact_zip(self, *_a, **_k):
+        async def download_artifact_file(self, *_a, **_k):
             self.downloads += 1
             buf = io.BytesIO()
             with zipfile.ZipFile(buf, "w") as zf:
@@ -411,7 +411,8 @@ async def test_parse_artifacts_uses_cache():
                     "tenon-test-results.json",
                     json.dumps({"passed": 1, "failed": 0, "total": 1}),
                 )
-            return buf.getvalue()
+            buf.seek(0)
+            return buf
 
     client = CacheClient()
     runner = GithubActionsRunner(client, workflow_file="ci.yml")
@@ -562,7 +563,169 @@ async def test_dispatch_with_fallbacks_and_errors(monkeypatch):
 
     runner._workflow_fallbacks = ["bad.yml"]
     with pytest.raises(GithubError):
-        await runner._dispatch_with_fallbacks("org/repo", ref="main", inputs=None)
+        await runner._dispatch_with_fallbacks("org/other", ref="main", inputs=None)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_remembers_working_workflow_per_repo_and_template():
+    class StubClient(GithubClient):
+        def __init__(self):
+            super().__init__(base_url="https://api.github.com", token="x")
+            self.calls = []
+
+        async def trigger_workflow_dispatch(self, repo_full_name, wf, ref, inputs=None):
+            self.calls.append((repo_full_name, wf))
+            if wf != "tenon-ci.yml":
+                raise GithubError("missing", status_code=404)
+
+    client = StubClient()
+    runner = GithubActionsRunner(client, workflow_file="preferred.yml")
+    used = await runner._dispatch_with_fallbacks(
+        "org/repo-1",
+        ref="main",
+        inputs=None,
+        workflow_hints=(None, "org/template"),
+    )
+    assert used == "tenon-ci.yml"
+    assert client.calls == [
+        ("org/repo-1", "preferred.yml"),
+        ("org/repo-1", "tenon-ci.yml"),
+    ]
+
+    # Same repo again, and a new repo from the same template, skip the 404s.
+    client.calls.clear()
+    await runner._dispatch_with_fallbacks("org/repo-1", ref="main", inputs=None)
+    await runner._dispatch_with_fallbacks(
+        "org/repo-2",
+        ref="main",
+        inputs=None,
+        workflow_hints=(None, "org/template"),
+    )
+    assert client.calls == [
+        ("org/repo-1", "tenon-ci.yml"),
+        ("org/repo-2", "tenon-ci.yml"),
+    ]
+
+    # A file persisted on the workspace is trusted by a fresh worker.
+    fresh = GithubActionsRunner(client, workflow_file="preferred.yml")
+    client.calls.clear()
+    await fresh._dispatch_with_fallbacks(
+        "org/repo-3", ref="main", inputs=None, workflow_hints=("tenon-ci.yml", None)
+    )
+    assert client.calls == [("org/repo-3", "tenon-ci.yml")]
+
+    # A remembered file that stops working falls back and is replaced.
+    fresh.cache.cache_workflow_file("org/repo-3", "gone.yml")
+    client.calls.clear()
+    await fresh._dispatch_with_fallbacks("org/repo-3", ref="main", inputs=None)
+    assert client.calls[0] == ("org/repo-3", "gone.yml")
+    assert fresh.cache.workflow_file_for("org/repo-3") == "tenon-ci.yml"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_and_wait_resolves_run_by_correlation_id():
+    class CorrelatedClient(GithubClient):
+        def __init__(self):
+            super().__init__(base_url="https://api.github.com", token="x")
+            self.correlation_id = None
+            self.list_kwargs = []
+            self.get_calls = 0
+
+        async def trigger_workflow_dispatch(self, repo_full_name, wf, ref, inputs=None):
+            self.correlation_id = inputs["tenon_correlation_id"]
+
+        def _run(self, run_id, title, status="in_progress", conclusion=None):
+            return WorkflowRun(
+                id=run_id,
+                status=status,
+                conclusion=conclusion,
+                html_url=None,
+                head_sha="abc",
+                event="workflow_dispatch",
+                created_at=datetime.now(UTC).isoformat(),
+                display_title=title,
+            )
+
+        async def list_workflow_runs(self, repo_full_name, wf, **kwargs):
+            self.list_kwargs.append(kwargs)
+            # A concurrent dispatch created the newer run; only #1 is ours.
+            return [
+                self._run(2, "tenon other-id"),
+                self._run(1, f"tenon {self.correlation_id}"),
+            ]
+
+        async def get_workflow_run(self, repo_full_name, run_id):
+            self.get_calls += 1
+            return self._run(run_id, "", "completed", "success")
+
+        async def list_artifacts(self, *_a, **_k):
+            return []
+
+    client = CorrelatedClient()
+    runner = GithubActionsRunner(
+        client,
+        workflow_file="ci.yml",
+        poll_interval_seconds=0.01,
+        max_poll_seconds=1,
+        correlation_input="tenon_correlation_id",
+    )
+    result = await runner.dispatch_and_wait(
+        repo_full_name="org/repo", ref="main", inputs={"a": "b"}
+    )
+
+    assert result.run_id == 1
+    assert len(client.list_kwargs) == 1
+    assert client.list_kwargs[0]["event"] == "workflow_dispatch"
+    assert client.list_kwargs[0]["created"].startswith(">=")
+    assert client.get_calls == 1
+    assert runner.cache.correlated_runs[client.correlation_id] == ("org/repo", 1)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_run_returns_once_run_exists():
+    class QueuedClient(_StubClient):
+        async def list_workflow_runs(self, *args, **kwargs):
+            self.run_calls += 1
+            if self.run_calls == 1:
+                return []
+            return [
+                WorkflowRun(
+                    id=4,
+                    status="queued",
+                    conclusion=None,
+                    html_url=None,
+                    head_sha="abc",
+                    event="workflow_dispatch",
+                    created_at=datetime.now(UTC).isoformat(),
+                )
+            ]
+
+    client = QueuedClient()
+    runner = GithubActionsRunner(
+        client, workflow_file="ci.yml", poll_interval_seconds=0.01, max_poll_seconds=1
+    )
+    result = await runner.dispatch_run(repo_full_name="org/repo", ref="main")
+    assert result.status == "running"
+    assert result.run_id == 4
+    assert result.poll_after_ms
+    assert client.run_calls == 2
+
+    completed = await GithubActionsRunner(
+        _StubClient(), workflow_file="ci.yml", poll_interval_seconds=0.01
+    ).dispatch_run(repo_full_name="org/repo", ref="main")
+    assert completed.run_id == 1 and completed.conclusion == "success"
+
+    class NoRunClient(_StubClient):
+        async def list_workflow_runs(self, *args, **kwargs):
+            return []
+
+    with pytest.raises(GithubError):
+        await GithubActionsRunner(
+            NoRunClient(),
+            workflow_file="ci.yml",
+            poll_interval_seconds=0.01,
+            max_poll_seconds=0.03,
+        ).dispatch_run(repo_full_name="org/repo", ref="main")
 
 
 @pytest.mark.asyncio
@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 import io
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 from zipfile import ZipFile
 
+import pytest
+
 from app.integrations.github.actions_runner import GithubActionsRunner
-from app.integrations.github.artifacts import parse_test_results_zip
-from app.integrations.github.client import GithubClient, WorkflowRun
+from app.integrations.github.artifacts import (
+    ArtifactLimits,
+    ArtifactParseExecutor,
+    ArtifactParseTimeout,
+    ArtifactRejected,
+    parse_test_results_zip,
+)
+from app.integrations.github.artifacts.executor import _run_with_cpu_limit
+from app.integrations.github.client import (
+    GithubArtifactTooLarge,
+    GithubClient,
+    WorkflowRun,
+)
+from app.integrations.github.template_health.artifacts import (
+    _extract_test_results_json,
+)
 
 
 def test_parse_test_results_prefers_json():
@@ -64,8 +83,8 @@ class _StubClient(GithubClient):
     async def list_artifacts(self, repo_full_name: str, run_id: int):
         return self._artifacts
 
-    async def download_artifact_zip(self, repo_full_name: str, artifact_id: int):
-        return self._contents[artifact_id]
+    async def download_artifact_file(self, repo_full_name: str, artifact_id: int):
+        return io.BytesIO(self._contents[artifact_id])
 
 
 async def test_parse_artifacts_prefers_named():
@@ -147,6 +166,32 @@ async def test_parse_artifacts_handles_bad_zip_without_crashing():
     assert error == "artifact_corrupt"
 
 
+async def test_parse_artifacts_caches_oversized_artifact():
+    class _TooLargeClient(_StubClient):
+        downloads = 0
+
+        async def download_artifact_file(self, repo_full_name: str, artifact_id: int):
+            self.downloads += 1
+            raise GithubArtifactTooLarge("url", 10)
+
+    client = _TooLargeClient(
+        artifacts=[{"id": 1, "name": "tenon-test-results"}], contents={}
+    )
+    runner = GithubActionsRunner(client, workflow_file="ci.yml")
+    assert await runner._parse_artifacts("org/repo", 7) == (None, "artifact_too_large")
+    assert await runner._parse_artifacts("org/repo", 7) == (None, "artifact_too_large")
+    assert client.downloads == 1
+
+
+def test_parse_test_results_reads_file_objects(tmp_path):
+    path = tmp_path / "artifact.zip"
+    with ZipFile(path, "w") as zf:
+        zf.writestr("tenon-test-results.json", '{"passed":2,"failed":0,"total":2}')
+    with path.open("rb") as fp:
+        parsed = parse_test_results_zip(fp)
+    assert parsed and parsed.total == 2
+
+
 def test_parse_test_results_json_fallback_and_bad_xml():
     """Non-preferred JSON should be parsed; invalid XML ignored."""
     buf = io.BytesIO()
@@ -176,3 +221,176 @@ def test_safe_json_load_returns_none_for_non_dict():
         zf.writestr("array.json", "[1,2,3]")
     parsed = parse_test_results_zip(buf.getvalue())
     assert parsed is None
+
+
+def _results_zip(**members: str) -> bytes:
+    buf = io.BytesIO()
+    with ZipFile(buf, "w") as zf:
+        for name, body in members.items():
+            zf.writestr(name, body)
+    return buf.getvalue()
+
+
+def test_zip_bomb_guards_reject_before_reading():
+    payload = _results_zip(
+        **{"tenon-test-results.json": '{"passed":1,"failed":0,"total":1}'},
+        extra="x" * 2048,
+    )
+    with pytest.raises(ArtifactRejected) as members_exc:
+        parse_test_results_zip(payload, limits=ArtifactLimits(max_members=1))
+    assert members_exc.value.reason == "too_many_members"
+    with pytest.raises(ArtifactRejected) as size_exc:
+        _extract_test_results_json(
+            payload, limits=ArtifactLimits(max_uncompressed_bytes=1024)
+        )
+    assert size_exc.value.reason == "uncompressed_too_large"
+    assert parse_test_results_zip(payload, limits=None).total == 1
+
+
+async def test_parse_executor_thread_and_process_modes():
+    payload = _results_zip(
+        **{"tenon-test-results.json": '{"passed":4,"failed":1,"total":5}'}
+    )
+    thread_pool = ArtifactParseExecutor()
+    parsed = await thread_pool.run(parse_test_results_zip, io.BytesIO(payload))
+    assert parsed.total == 5
+
+    process_pool = ArtifactParseExecutor(mode="process", max_workers=1, cpu_seconds=5)
+    spool = io.BytesIO(payload)
+    try:
+        parsed = await process_pool.run(parse_test_results_zip, spool)
+        assert parsed.passed == 4
+        assert process_pool.stats()["parsed"] == 1
+    finally:
+        process_pool.shutdown()
+    # Handed to the worker as a temp file, so the spool is released up front.
+    assert spool.closed
+
+    with pytest.raises(ValueError):
+        ArtifactParseExecutor(mode="fork")
+
+
+async def test_parse_executor_times_out_slow_parses():
+    def _slow(_content, *, limits):
+        time.sleep(0.2)
+
+    pool = ArtifactParseExecutor(timeout_seconds=0.01)
+    with pytest.raises(ArtifactParseTimeout):
+        await pool.run(_slow, b"")
+    assert pool.stats()["timeouts"] == 1
+    pool.shutdown()
+
+
+async def test_parse_executor_keeps_overrunning_parses_accounted():
+    release = threading.Event()
+
+    def _stuck(content, *, limits):
+        release.wait(5)
+        return content.read()
+
+    pool = ArtifactParseExecutor(max_workers=1, timeout_seconds=0.01)
+    spool = io.BytesIO(b"zip")
+    with pytest.raises(ArtifactParseTimeout):
+        await pool.run(_stuck, spool)
+    # The thread is still reading, so its file stays open and its slot taken.
+    assert not spool.closed
+    assert pool.stats()["stuckWorkers"] == 1
+
+    queued = io.BytesIO(b"next")
+    with pytest.raises(ArtifactParseTimeout, match="still busy"):
+        await pool.run(_stuck, queued)
+    assert queued.closed
+
+    release.set()
+    for _ in range(100):
+        if not pool.stats()["stuckWorkers"]:
+            break
+        await asyncio.sleep(0.01)
+    assert pool.stats()["stuckWorkers"] == 0
+    assert spool.closed
+    assert await pool.run(_stuck, io.BytesIO(b"ok")) == b"ok"
+    pool.shutdown()
+
+
+def test_cpu_limited_worker_reads_artifacts_by_path(tmp_path):
+    payload = _results_zip(
+        **{"tenon-test-results.json": '{"passed":2,"failed":0,"total":2}'}
+    )
+    path = tmp_path / "artifact.zip"
+    path.write_bytes(payload)
+    parsed = _run_with_cpu_limit(
+        parse_test_results_zip, str(path), ArtifactLimits(), None
+    )
+    assert parsed.total == 2
+
+
+def test_cpu_limit_interrupts_runaway_parse():
+    def _burn(_content, *, limits):
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            pass
+
+    with pytest.raises(ArtifactParseTimeout):
+        _run_with_cpu_limit(_burn, b"", ArtifactLimits(), 0)
+
+
+async def test_parse_artifacts_reports_rejected_and_timed_out_archives():
+    payload = _results_zip(
+        **{"tenon-test-results.json": '{"passed":1,"failed":0,"total":1}'}
+    )
+    client = _StubClient(
+        artifacts=[{"id": 1, "name": "tenon-test-results"}], contents={1: payload}
+    )
+    client.artifact_parser = ArtifactParseExecutor(limits=ArtifactLimits(max_members=0))
+    runner = GithubActionsRunner(client, workflow_file="ci.yml")
+    assert await runner._parse_artifacts("org/repo", 1) == (None, "artifact_rejected")
+    assert runner._artifact_cache[("org/repo", 1, 1)] == (None, "artifact_rejected")
+
+    client.artifact_parser = ArtifactParseExecutor(timeout_seconds=0)
+    assert await runner._parse_artifacts("org/repo", 2) == (
+        None,
+        "artifact_parse_timeout",
+    )
+    assert ("org/repo", 2, 1) not in runner._artifact_cache
+
+
+def test_parse_junit_streams_every_file_and_honours_suite_attributes():
+    counted = """
+    <testsuites>
+        <testsuite name="outer" tests="5" failures="1" errors="1" skipped="1">
+            <testsuite name="inner" tests="2" failures="1">
+                <testcase classname="c" name="a" time="0.5"><failure/></testcase>
+                <testcase classname="c" name="b"/>
+            </testsuite>
+            <testcase classname="c" name="d" time="1.25"><error/></testcase>
+            <testcase classname="c" name="e"><skipped/></testcase>
+            <testcase classname="c" name="f"/>
+        </testsuite>
+    </testsuites>
+    """
+    uncounted = """
+    <testsuite name="plain">
+        <testcase classname="p" name="g"/>
+        <testcase classname="p" name="h"><skipped/></testcase>
+        <testcase classname="p" name="i"><failure/></testcase>
+    </testsuite>
+    """
+    payload = _results_zip(
+        **{"a.xml": counted, "b.xml": uncounted, "c.xml": "<testsuite><bad"}
+    )
+
+    parsed = parse_test_results_zip(payload, max_failures=2)
+    assert (parsed.passed, parsed.failed, parsed.total) == (3, 3, 8)
+    assert parsed.summary["files"] == 2
+    assert parsed.summary["skipped"] == 2
+    assert parsed.summary["failures"] == [
+        {"name": "a", "classname": "c", "time": 0.5},
+        {"name": "d", "classname": "c", "time": 1.25},
+    ]
+    assert parsed.summary["failuresTruncated"] is True
+
+    assert parse_test_results_zip(payload).summary == {
+        "format": "junit",
+        "files": 2,
+        "skipped": 2,
+    }
@@ -3,7 +3,11 @@ from __future__ import annotations
 import httpx
 import pytest
 
-from app.integrations.github.client import GithubClient, GithubError
+from app.integrations.github.client import (
+    GithubArtifactTooLarge,
+    GithubClient,
+    GithubError,
+)
 
 
 def _mock_client(handler) -> GithubClient:
@@ -177,6 +181,48 @@ async def test_github_client_get_bytes_errors():
         await client.download_artifact_zip("org/repo", 9)
 
 
+@pytest.mark.asyncio
+async def test_download_artifact_file_follows_redirect_and_spools():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "api.github.com":
+            return httpx.Response(
+                302, headers={"Location": "https://blob.example/artifact.zip"}
+            )
+        return httpx.Response(200, content=b"zip-bytes" * 10)
+
+    client = _mock_client(handler)
+    with await client.download_artifact_file("org/repo", 1) as spool:
+        assert spool.read() == b"zip-bytes" * 10
+
+
+@pytest.mark.asyncio
+async def test_download_artifact_file_aborts_past_size_cap():
+    async def _chunks():
+        for _ in range(4):
+            yield b"x" * 10
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/1/zip"):
+            return httpx.Response(200, headers={"Content-Length": "1000"})
+        return httpx.Response(200, content=_chunks())
+
+    client = GithubClient(
+        base_url="https://api.github.com",
+        token="token123",
+        transport=httpx.MockTransport(handler),
+        artifact_max_bytes=25,
+    )
+    with pytest.raises(GithubArtifactTooLarge):
+        await client.download_artifact_file("org/repo", 1)
+    with pytest.raises(GithubArtifactTooLarge) as excinfo:
+        await client.download_artifact_file("org/repo", 2)
+    assert excinfo.value.max_bytes == 25
+
+    client = _mock_client(lambda r: httpx.Response(500, text="boom"))
+    with pytest.raises(GithubError):
+        await client.download_artifact_file("org/repo", 3)
+
+
 @pytest.mark.asyncio
 async def test_github_client_misc_methods(monkeypatch):
     client = GithubClient(base_url="https://api.github.com", token="t")
@@ -204,3 +250,290 @@ async def test_github_client_misc_methods(monkeypatch):
 
     with pytest.raises(GithubError):
         await client.get_repo("bad-name")
+
+
+@pytest.mark.asyncio
+async def test_github_client_conditional_cache_serves_304_from_memory():
+    seen_validators: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_validators.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            json={"default_branch": "main"},
+        )
+
+    client = GithubClient(
+        base_url="https://api.github.com",
+        token="token123",
+        transport=httpx.MockTransport(handler),
+        conditional_cache_max_bytes=1024,
+    )
+
+    first = await client.get_repo("org/repo")
+    first["default_branch"] = "mutated"
+    second = await client.get_repo("org/repo")
+
+    assert second == {"default_branch": "main"}
+    assert seen_validators == [None, '"v1"']
+    stats = client.transport.conditional_cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_github_client_conditional_cache_keys_on_params_and_skips_writes():
+    requests_seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.method == "POST":
+            return httpx.Response(201, headers={"ETag": '"p"'}, json={"ok": True})
+        return httpx.Response(
+            200,
+            headers={"ETag": f'"{request.url.params.get("ref")}"'},
+            json={"content": ""},
+        )
+
+    client = GithubClient(
+        base_url="https://api.github.com",
+        token="token123",
+        transport=httpx.MockTransport(handler),
+        conditional_cache_max_bytes=1024,
+    )
+    await client.get_file_contents("org/repo", "a.txt", ref="main")
+    await client.get_file_contents("org/repo", "a.txt", ref="dev")
+    await client._post_json("/repos/org/repo/things", json={})
+    await client._post_json("/repos/org/repo/things", json={})
+
+    assert requests_seen[1].headers.get("If-None-Match") is None
+    assert requests_seen[3].headers.get("If-None-Match") is None
+    assert client.transport.conditional_cache.stats()["entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_github_client_conditional_cache_refetches_when_entry_evicted():
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if request.headers.get("If-None-Match"):
+            client.transport.conditional_cache._entries.clear()
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, json={"id": 1})
+
+    client = GithubClient(
+        base_url="https://api.github.com",
+        token="token123",
+        transport=httpx.MockTransport(handler),
+        conditional_cache_max_bytes=1024,
+    )
+    await client.get_repo("org/repo")
+    assert await client.get_repo("org/repo") == {"id": 1}
+    assert calls["count"] == 3
+
+
+def test_conditional_cache_evicts_least_recent_by_bytes():
+    from app.integrations.github.client.conditional_cache import (
+        ConditionalRequestCache,
+    )
+
+    cache = ConditionalRequestCache(max_bytes=20)
+    first = cache.key("/a", None)
+    second = cache.key("/b", {"per_page": 5})
+    cache.record(first, {"ETag": '"a"'}, b'{"a": 1234567}')
+    cache.record(second, {"ETag": '"b"'}, b'{"b": 1234567}')
+    assert cache.validators(first) == {}
+    assert cache.validators(second) == {"If-None-Match": '"b"'}
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == len(b'{"b": 1234567}')
+
+    cache.record(first, {}, b"{}")
+    cache.record(first, {"ETag": '"big"'}, b"x" * 64)
+    assert cache.hit(first) is None
+    assert cache.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_budget_tracks_headers_and_sheds_low_priority_lanes():
+    import time
+
+    from app.integrations.github.client import GithubRateLimited, github_lane
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={
+                "X-RateLimit-Limit": "100",
+                "X-RateLimit-Remaining": "20",
+                "X-RateLimit-Reset": str(int(time.time()) + 600),
+            },
+            json={"id": 1},
+        )
+
+    client = _mock_client(handler)
+    await client.get_repo("org/repo")
+    budget = client.transport.rate_budget
+    assert budget.limit == 100 and budget.remaining == 20
+
+    with github_lane("health"), pytest.raises(GithubRateLimited) as excinfo:
+        await client.get_repo("org/repo")
+    assert excinfo.value.status_code == 429
+
+    with github_lane("poll"):
+        await client.get_repo("org/repo")
+    budget.remaining = 10
+    with github_lane("poll"), pytest.raises(GithubRateLimited):
+        await client.get_repo("org/repo")
+
+    await client.get_repo("org/repo")
+    snapshot = budget.snapshot()
+    assert snapshot["shed"]["health"] == 1 and snapshot["shed"]["poll"] == 1
+    assert snapshot["requests"]["submit"] == 2 and snapshot["requests"]["poll"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_budget_honors_secondary_limit_retry_after(monkeypatch):
+    from app.integrations.github.client import GithubRateLimited, github_lane
+    from app.integrations.github.client import rate_budget as rate_budget_module
+
+    slept: list[float] = []
+
+    async def _fake_sleep(seconds):
+        slept.append(seconds)
+        client.transport.rate_budget.paused_until = None
+
+    monkeypatch.setattr(rate_budget_module.asyncio, "sleep", _fake_sleep)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/limited"):
+            return httpx.Response(429, headers={"Retry-After": "5"}, json={})
+        return httpx.Response(200, json={"ok": True})
+
+    client = _mock_client(handler)
+    with pytest.raises(GithubError) as excinfo:
+        await client._get_json("/limited")
+    assert excinfo.value.status_code == 429
+
+    with github_lane("poll"), pytest.raises(GithubRateLimited):
+        await client._get_json("/ok")
+    assert await client._get_json("/ok") == {"ok": True}
+    assert slept and 0 < slept[0] <= 5
+    assert client.transport.rate_budget.delayed["submit"] == 1
+
+
+def test_rate_budget_refills_after_reset_and_ignores_other_resources():
+    import time
+
+    from app.integrations.github.client import RateLimitBudget
+
+    budget = RateLimitBudget()
+    budget.observe(
+        200,
+        {
+            "X-RateLimit-Resource": "search",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Limit": "30",
+        },
+    )
+    assert budget.remaining is None
+    budget.observe(
+        200,
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) - 1),
+            "Retry-After": "bogus",
+        },
+    )
+    assert budget._wait_seconds("health") == 0
+    assert budget.remaining is None
+
+
+@pytest.mark.asyncio
+async def test_github_client_coalesces_identical_inflight_gets():
+    import asyncio
+
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await release.wait()
+        if request.url.path.endswith("/runs"):
+            return httpx.Response(200, json={"workflow_runs": []})
+        return httpx.Response(200, json={"id": 7, "status": "queued"})
+
+    client = _mock_client(handler)
+    waiters = [
+        asyncio.create_task(client.get_workflow_run("org/repo", 7)) for _ in range(3)
+    ] + [
+        asyncio.create_task(client.list_workflow_runs("org/repo", "ci.yml"))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert all(run.id == 7 for run in results[:3])
+    assert calls.count("/repos/org/repo/actions/runs/7") == 1
+    assert calls.count("/repos/org/repo/actions/workflows/ci.yml/runs") == 2
+    stats = client.transport.single_flight.stats()
+    assert stats == {"inFlight": 0, "leaders": 1, "coalesced": 2}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_errors_and_retries_configured_ones():
+    import asyncio
+
+    from app.integrations.github.client.single_flight import SingleFlight
+
+    flight = SingleFlight()
+    gate = asyncio.Event()
+    attempts = {"count": 0}
+
+    async def failing():
+        attempts["count"] += 1
+        await gate.wait()
+        raise GithubError("boom", status_code=500)
+
+    tasks = [asyncio.create_task(flight.run("k", failing)) for _ in range(2)]
+    await asyncio.sleep(0)
+    gate.set()
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(o, GithubError) for o in outcomes)
+    assert attempts["count"] == 1
+
+    class Retryable(Exception):
+        pass
+
+    calls = {"count": 0}
+    gate.clear()
+
+    async def flaky():
+        calls["count"] += 1
+        if calls["count"] == 1:
+            await gate.wait()
+            raise Retryable()
+        return {"ok": True}
+
+    tasks = [
+        asyncio.create_task(flight.run("r", flaky, retry_on=(Retryable,)))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    gate.set()
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    assert isinstance(outcomes[0], Retryable)
+    assert outcomes[1] == {"ok": True}
+
+    gate.clear()
+    leader = asyncio.create_task(flight.run("c", flaky))
+    calls["count"] = 0
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flight.run("c", flaky))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await waiter == {"ok": True}
@@ -30,3 +30,27 @@ def test_actions_runner_singleton_reused_and_custom_client_gets_new_runner():
 
     github_native._github_client_singleton.cache_clear()
     github_native._actions_runner_singleton.cache_clear()
+
+
+def test_github_client_wires_webhook_run_events_when_secret_set(monkeypatch):
+    monkeypatch.setattr(
+        github_native.settings.github, "GITHUB_WEBHOOK_SECRET", "hook-secret"
+    )
+    github_native._github_client_singleton.cache_clear()
+
+    client = github_native.get_github_client()
+    assert client.run_events is github_native.get_workflow_run_events()
+
+    github_native._github_client_singleton.cache_clear()
+
+
+def test_actions_runner_uses_database_cache_backend_when_configured(monkeypatch):
+    monkeypatch.setattr(
+        github_native.settings.github, "GITHUB_ACTIONS_CACHE_BACKEND", "database"
+    )
+    github_native._actions_runner_singleton.cache_clear()
+
+    runner = github_native._actions_runner_singleton()
+    assert isinstance(runner.cache.backend, github_native.DatabaseActionsCacheBackend)
+
+    github_native._actions_runner_singleton.cache_clear()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+from datetime import UTC, datetime
+
+import pytest
+
+from app.integrations.github.actions_runner import GithubActionsRunner
+from app.integrations.github.client import GithubClient, GithubError
+from app.integrations.github.template_health.live_dispatch import dispatch_and_poll
+from app.integrations.github.webhooks import WorkflowRunEventStore, verify_signature
+
+
+def _run_event(run_id: int, status: str, conclusion: str | None = None) -> dict:
+    return {
+        "action": "completed" if conclusion else "in_progress",
+        "repository": {"full_name": "Org/Repo"},
+        "workflow_run": {
+            "id": run_id,
+            "status": status,
+            "conclusion": conclusion,
+            "html_url": f"https://github.com/org/repo/actions/runs/{run_id}",
+            "head_sha": "abc123",
+            "head_branch": "main",
+            "event": "workflow_dispatch",
+            "path": ".github/workflows/ci.yml",
+            "created_at": datetime.now(UTC).isoformat(),
+        },
+    }
+
+
+class _DispatchOnlyClient(GithubClient):
+    def __init__(self, run_events: WorkflowRunEventStore):
+        super().__init__(base_url="https://api.github.com", token="x")
+        self.run_events = run_events
+        self.list_calls = 0
+
+    async def trigger_workflow_dispatch(self, *args, **kwargs):
+        return None
+
+    async def list_workflow_runs(self, *args, **kwargs):
+        self.list_calls += 1
+        return []
+
+    async def list_artifacts(self, *args, **kwargs):
+        return []
+
+
+def test_verify_signature():
+    body = b'{"zen": "hi"}'
+    digest = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+    assert verify_signature("s3cret", body, f"sha256={digest}") is True
+    assert verify_signature("s3cret", body + b" ", f"sha256={digest}") is False
+    assert verify_signature("s3cret", body, f"sha1={digest}") is False
+    assert verify_signature("s3cret", body, None) is False
+    assert verify_signature("", body, f"sha256={digest}") is False
+
+
+def test_store_ingest_keeps_completed_runs_and_tracks_jobs():
+    store = WorkflowRunEventStore(max_runs=1)
+    assert store.ingest("workflow_run", _run_event(1, "completed", "success"))
+    assert store.ingest("workflow_run", _run_event(1, "in_progress"))
+    assert store.get("org/repo", 1).conclusion == "success"
+    assert store.ingest(
+        "workflow_job",
+        {
+            "repository": {"full_name": "org/repo"},
+            "workflow_job": {"id": 9, "run_id": 1},
+        },
+    )
+    assert (
+        store.ingest("workflow_job", {"repository": {"full_name": "org/repo"}}) is False
+    )
+    assert store.ingest("push", _run_event(2, "queued")) is False
+    assert store.ingest("workflow_run", {"workflow_run": {"id": 3}}) is False
+    store.ingest("workflow_run", _run_event(4, "queued"))
+    assert store.get("org/repo", 1) is None
+    assert store.stats() == {"runs": 1, "events": 4, "ignored": 3, "waiters": 0}
+
+
+@pytest.mark.asyncio
+async def test_dispatch_and_wait_completes_from_webhook_without_polling():
+    store = WorkflowRunEventStore(first_event_seconds=1.0)
+    client = _DispatchOnlyClient(store)
+    runner = GithubActionsRunner(
+        client, workflow_file="ci.yml", poll_interval_seconds=0.01, max_poll_seconds=2
+    )
+
+    async def deliver():
+        await asyncio.sleep(0.01)
+        store.ingest("workflow_run", _run_event(7, "in_progress"))
+        await asyncio.sleep(0.01)
+        store.ingest("workflow_run", _run_event(7, "completed", "success"))
+
+    delivery = asyncio.create_task(deliver())
+    result = await runner.dispatch_and_wait(repo_full_name="org/repo", ref="main")
+    await delivery
+
+    assert result.run_id == 7
+    assert result.conclusion == "success"
+    assert client.list_calls == 0
+    # A later fetch is served from the webhook state instead of the API.
+    fetched = await runner.fetch_run_result(repo_full_name="org/repo", run_id=7)
+    assert fetched.run_id == 7
+
+
+@pytest.mark.asyncio
+async def test_dispatch_and_wait_returns_running_when_events_stall():
+    store = WorkflowRunEventStore(first_event_seconds=1.0)
+    store.ingest("workflow_run", _run_event(8, "in_progress"))
+    client = _DispatchOnlyClient(store)
+    runner = GithubActionsRunner(
+        client,
+        workflow_file="ci.yml",
+        poll_interval_seconds=0.01,
+        max_poll_seconds=0.05,
+    )
+    result = await runner.dispatch_and_wait(repo_full_name="org/repo", ref="main")
+    assert result.status == "running"
+    assert result.run_id == 8
+    assert client.list_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatch_falls_back_to_polling_without_events():
+    store = WorkflowRunEventStore(first_event_seconds=0.02)
+    client = _DispatchOnlyClient(store)
+    runner = GithubActionsRunner(
+        client, workflow_file="ci.yml", poll_interval_seconds=0.01, max_poll_seconds=0.1
+    )
+    with pytest.raises(GithubError):
+        await runner.dispatch_and_wait(repo_full_name="org/repo", ref="main")
+    assert client.list_calls >= 1
+    assert store.stats()["waiters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_template_health_dispatch_uses_webhook_state():
+    store = WorkflowRunEventStore(first_event_seconds=0.05)
+    store.ingest("workflow_run", _run_event(5, "completed", "failure"))
+    client = _DispatchOnlyClient(store)
+    errors, run_id, conclusion = await dispatch_and_poll(
+        client,
+        repo_full_name="org/repo",
+        workflow_file="ci.yml",
+        default_branch="main",
+        timeout_seconds=1,
+    )
+    assert (errors, run_id, conclusion) == ([], 5, "failure")
+
+    store = WorkflowRunEventStore(first_event_seconds=0.05)
+    store.ingest("workflow_run", _run_event(6, "queued"))
+    errors, run_id, _ = await dispatch_and_poll(
+        _DispatchOnlyClient(store),
+        repo_full_name="org/repo",
+        workflow_file="ci.yml",
+        default_branch="main",
+        timeout_seconds=0.05,
+    )
+    assert errors == ["workflow_run_timeout"] and run_id is None
@@ -149,7 +149,8 @@ async def test_recruiter_list_builds_diff_url(monkeypatch):
         code_repo_path="org/repo",
         workflow_run_id="99",
         commit_sha="sha",
-        diff_summary_json=json.dumps({"base": "a", "head": "b"}),
+        diff_base="a",
+        diff_head="b",
     )
     task = SimpleNamespace(day_index=2, type="code")
 
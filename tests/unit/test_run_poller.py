@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.integrations.github.actions_runner import GithubActionsRunner
+from app.integrations.github.actions_runner.models import ActionsRunResult
+from app.integrations.github.actions_runner.run_poller import (
+    RunPoller,
+    run_phase,
+    run_state,
+)
+from app.integrations.github.client import GithubClient, GithubError, WorkflowRun
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _result(run_id: int, status: str = "running", poll_after_ms=None):
+    return ActionsRunResult(
+        status=status,
+        run_id=run_id,
+        conclusion=None if status == "running" else "success",
+        passed=None,
+        failed=None,
+        total=None,
+        stdout=None,
+        stderr=None,
+        head_sha="abc",
+        html_url=None,
+        poll_after_ms=poll_after_ms,
+    )
+
+
+class _Fetcher:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int]] = []
+        self.statuses: dict[int, str] = {}
+        self.errors: dict[int, Exception] = {}
+
+    async def __call__(self, repo_full_name: str, run_id: int) -> ActionsRunResult:
+        self.calls.append((repo_full_name, run_id))
+        await asyncio.sleep(0)
+        if run_id in self.errors:
+            raise self.errors[run_id]
+        return _result(run_id, self.statuses.get(run_id, "running"), poll_after_ms=4000)
+
+
+@pytest.mark.asyncio
+async def test_run_poller_shares_one_fetch_per_interval():
+    fetcher, clock = _Fetcher(), _Clock()
+    poller = RunPoller(fetcher, min_interval_seconds=2, clock=clock)
+
+    first = await asyncio.gather(*(poller.get("org/repo", 1) for _ in range(5)))
+    assert [r.status for r in first] == ["running"] * 5
+    assert fetcher.calls == [("org/repo", 1)]
+
+    # Before the backoff interval elapses callers are served from memory.
+    clock.now += 1
+    cached = await poller.get("org/repo", 1)
+    assert cached.poll_after_ms == 3000
+    assert fetcher.calls == [("org/repo", 1)]
+
+    clock.now += 5
+    fetcher.statuses[1] = "passed"
+    done = await poller.get("org/repo", 1)
+    assert done.status == "passed"
+    assert len(fetcher.calls) == 2
+    assert poller.stats() == {"tracked": 0, "waiting": 0, "polls": 2, "shared": 5}
+    await poller.aclose()
+
+
+@pytest.mark.asyncio
+async def test_run_poller_fans_out_errors_and_drops_idle_runs():
+    fetcher, clock = _Fetcher(), _Clock()
+    poller = RunPoller(fetcher, min_interval_seconds=2, idle_seconds=30, clock=clock)
+    fetcher.errors[2] = GithubError("boom", status_code=502)
+
+    results = await asyncio.gather(
+        poller.get("org/repo", 2), poller.get("org/repo", 2), return_exceptions=True
+    )
+    assert all(isinstance(r, GithubError) for r in results)
+    assert fetcher.calls == [("org/repo", 2)]
+    assert poller.stats()["tracked"] == 0
+
+    await poller.get("org/repo", 3)
+    assert poller.stats()["tracked"] == 1
+    # Nobody asked for run 3 within the idle window, so it is no longer polled.
+    clock.now += 60
+    await poller.get("org/repo", 4)
+    await asyncio.sleep(0)
+    assert ("org/repo", 3) not in poller._runs
+    await poller.aclose()
+    assert poller.stats()["tracked"] == 0
+
+
+@pytest.mark.asyncio
+async def test_run_poller_watch_follows_phases_until_completed():
+    phases = iter(["queued", "in_progress", "in_progress", "completed"])
+
+    async def fetch(repo_full_name, run_id):
+        phase = next(phases)
+        result = _result(run_id, "passed" if phase == "completed" else "running")
+        result.raw = {"status": phase}
+        result.poll_after_ms = 1
+        return result
+
+    poller = RunPoller(fetch, min_interval_seconds=0)
+    seen = [run_phase(r) async for r in poller.watch("org/repo", 5)]
+    assert seen == ["queued", "in_progress", "in_progress", "completed"]
+    assert run_state(_result(1)) != run_state(_result(1, "passed"))
+    await poller.aclose()
+
+
+@pytest.mark.asyncio
+async def test_runner_poll_run_result_coalesces_github_calls():
+    class RunClient(GithubClient):
+        def __init__(self):
+            super().__init__(base_url="https://api.github.com", token="x")
+            self.run_calls = 0
+
+        async def get_workflow_run(self, repo_full_name, run_id):
+            self.run_calls += 1
+            await asyncio.sleep(0.01)
+            return WorkflowRun(
+                id=run_id,
+                status="in_progress",
+                conclusion=None,
+                html_url=None,
+                head_sha="abc",
+            )
+
+        async def list_artifacts(self, repo_full_name, run_id):
+            return []
+
+    client = RunClient()
+    runner = GithubActionsRunner(client, workflow_file="ci.yml")
+    results = await asyncio.gather(
+        *(runner.poll_run_result(repo_full_name="org/repo", run_id=9) for _ in range(4))
+    )
+    assert {r.status for r in results} == {"running"}
+    assert client.run_calls == 1
+    await runner.run_poller.aclose()
+    await client.aclose()
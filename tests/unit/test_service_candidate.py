@@ -49,6 +49,7 @@ async def test_record_run_result_persists_fields(async_session):
         head_sha="newsha",
         html_url="https://example.com/run/777",
         raw={"summary": {"status": "failed"}},
+        workflow_file="tenon-ci.yml",
     )
 
     saved = await svc.record_run_result(async_session, workspace, result)
@@ -56,6 +57,22 @@ async def test_record_run_result_persists_fields(async_session):
     assert saved.last_workflow_conclusion == "failure"
     assert saved.latest_commit_sha == "newsha"
     assert saved.last_test_summary_json
+    assert saved.workflow_file == "tenon-ci.yml"
+
+    class RecordingRunner:
+        def __init__(self):
+            self.kwargs = None
+
+        async def dispatch_and_wait(self, **kwargs):
+            self.kwargs = kwargs
+            return result
+
+    runner = RecordingRunner()
+    await svc.run_actions_tests(
+        runner=runner, workspace=saved, branch="main", workflow_inputs=None
+    )
+    assert runner.kwargs["workflow_file"] == "tenon-ci.yml"
+    assert runner.kwargs["template_repo_full_name"] == saved.template_repo_full_name
 
 
 @pytest.mark.asyncio
@@ -286,10 +303,10 @@ async def test_load_task_or_404_branches(monkeypatch, async_session):
     async def _return_none(db, task_id):
         return None
 
-    monkeypatch.setattr(svc.tasks_repo, "get_by_id", _return_task)
+    monkeypatch.setattr(svc.tasks_repo, "get_snapshot", _return_task)
     assert await svc.load_task_or_404(async_session, 1) is not None
 
-    monkeypatch.setattr(svc.tasks_repo, "get_by_id", _return_none)
+    monkeypatch.setattr(svc.tasks_repo, "get_snapshot", _return_none)
     with pytest.raises(HTTPException):
         await svc.load_task_or_404(async_session, 99)
 
@@ -360,3 +377,271 @@ async def test_ensure_workspace_reuses_existing(async_session):
 
     assert ws.id == existing.id
     assert calls == [("owner/repo", "octocat")]
+
+
+@pytest.mark.asyncio
+async def test_pending_run_poller_expires_stale_runs_and_survives_errors(
+    async_session,
+):
+    from datetime import timedelta
+
+    from app.services.submissions.pending_runs import PendingRunPoller
+
+    recruiter = await create_recruiter(async_session, email="pending@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    workspace = await workspace_repo.create_workspace(
+        async_session,
+        candidate_session_id=cs.id,
+        task_id=tasks[1].id,
+        template_repo_full_name=tasks[1].template_repo or "",
+        repo_full_name="org/pending-repo",
+        repo_id=1,
+        default_branch="main",
+        base_template_sha="base",
+        created_at=datetime.now(UTC),
+    )
+    workspace.last_workflow_run_id = "77"
+    workspace.pending_run_dispatched_at = datetime.now(UTC) - timedelta(hours=3)
+    await async_session.commit()
+
+    class FailingRunner:
+        async def poll_run_result(self, **_kwargs):
+            raise GithubError("boom", status_code=502)
+
+    class _SessionMaker:
+        def __call__(self):
+            return self
+
+        async def __aenter__(self):
+            return async_session
+
+        async def __aexit__(self, *_exc):
+            return False
+
+    poller = PendingRunPoller(
+        session_maker=_SessionMaker(),
+        runner_factory=FailingRunner,
+        interval_seconds=0.01,
+    )
+    assert await poller.poll_once() == 0
+    await async_session.refresh(workspace)
+    assert workspace.pending_run_dispatched_at is None
+    assert workspace.last_workflow_run_id == "77"
+
+    poller.start()
+    await poller.stop()
+    await poller.stop()
+
+
+@pytest.mark.asyncio
+async def test_poll_pending_runs_rotates_past_the_limit(async_session):
+    from app.services.submissions.pending_runs import poll_pending_runs
+
+    recruiter = await create_recruiter(async_session, email="rotate@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    workspaces = []
+    for idx, task in enumerate(tasks[1:4], start=1):
+        workspace = await workspace_repo.create_workspace(
+            async_session,
+            candidate_session_id=cs.id,
+            task_id=task.id,
+            template_repo_full_name=task.template_repo or "",
+            repo_full_name=f"org/rotate-{idx}",
+            repo_id=idx,
+            default_branch="main",
+            base_template_sha="base",
+            created_at=datetime.now(UTC),
+        )
+        workspace.last_workflow_run_id = str(idx)
+        workspace.pending_run_dispatched_at = datetime.now(UTC)
+        workspaces.append(workspace)
+    await async_session.commit()
+
+    polled: list[str] = []
+
+    class RunningRunner:
+        async def poll_run_result(self, *, repo_full_name, run_id):
+            polled.append(repo_full_name)
+            return ActionsRunResult(
+                status="running",
+                run_id=run_id,
+                conclusion=None,
+                passed=None,
+                failed=None,
+                total=None,
+                stdout=None,
+                stderr=None,
+                head_sha=None,
+                html_url=None,
+            )
+
+    assert await poll_pending_runs(async_session, RunningRunner(), limit=2) == 0
+    assert await poll_pending_runs(async_session, RunningRunner(), limit=2) == 0
+
+    # The run skipped by the first pass is served first by the second one.
+    assert polled[:2] == ["org/rotate-1", "org/rotate-2"]
+    assert polled[2] == "org/rotate-3"
+    assert all(ws.pending_run_checked_at is not None for ws in workspaces)
+
+
+@pytest.mark.asyncio
+async def test_poll_pending_runs_skips_workspaces_redispatched_meanwhile(
+    async_session,
+):
+    from sqlalchemy import update
+
+    from app.integrations.github.workspaces.workspace import Workspace
+    from app.services.submissions.pending_runs import poll_pending_runs
+
+    recruiter = await create_recruiter(async_session, email="swap@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    workspace = await workspace_repo.create_workspace(
+        async_session,
+        candidate_session_id=cs.id,
+        task_id=tasks[1].id,
+        template_repo_full_name=tasks[1].template_repo or "",
+        repo_full_name="org/swap-repo",
+        repo_id=1,
+        default_branch="main",
+        base_template_sha="base",
+        created_at=datetime.now(UTC),
+    )
+    workspace.last_workflow_run_id = "77"
+    workspace.pending_run_dispatched_at = datetime.now(UTC)
+    await async_session.commit()
+    workspace_id = workspace.id
+
+    class RedispatchingRunner:
+        async def poll_run_result(self, *, repo_full_name, run_id):
+            # The candidate dispatches run 88 while run 77 is being fetched.
+            await async_session.execute(
+                update(Workspace)
+                .where(Workspace.id == workspace_id)
+                .values(last_workflow_run_id="88")
+                .execution_options(synchronize_session=False)
+            )
+            return ActionsRunResult(
+                status="passed",
+                run_id=run_id,
+                conclusion="success",
+                passed=1,
+                failed=0,
+                total=1,
+                stdout=None,
+                stderr=None,
+                head_sha="sha-of-77",
+                html_url=None,
+            )
+
+    assert await poll_pending_runs(async_session, RedispatchingRunner()) == 0
+    await async_session.refresh(workspace)
+    assert workspace.last_workflow_run_id == "88"
+    assert workspace.last_workflow_conclusion is None
+    assert workspace.latest_commit_sha != "sha-of-77"
+    assert workspace.pending_run_dispatched_at is not None
+
+
+@pytest.mark.asyncio
+async def test_save_run_result_stores_terminal_runs_once(async_session):
+    running = ActionsRunResult(
+        status="running",
+        run_id=41,
+        conclusion=None,
+        passed=None,
+        failed=None,
+        total=None,
+        stdout=None,
+        stderr=None,
+        head_sha=None,
+        html_url=None,
+    )
+    assert not await svc.save_run_result(
+        async_session, repo_full_name="org/repo", result=running
+    )
+
+    finished = ActionsRunResult(
+        status="failed",
+        run_id=41,
+        conclusion="failure",
+        passed=1,
+        failed=2,
+        total=3,
+        stdout="out",
+        stderr="err",
+        head_sha="sha",
+        html_url="https://example.com/run/41",
+        raw={"summary": {"failures": ["t1"]}},
+    )
+    assert await svc.save_run_result(
+        async_session, repo_full_name="org/repo", result=finished
+    )
+    await async_session.commit()
+    assert not await svc.save_run_result(
+        async_session, repo_full_name="org/repo", result=finished
+    )
+
+    loaded = await svc.load_run_result(
+        async_session, repo_full_name="org/repo", run_id=41
+    )
+    assert loaded == finished
+    assert (
+        await svc.load_run_result(async_session, repo_full_name="org/other", run_id=41)
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_run_result_skips_transient_artifact_errors(async_session):
+    def errored(run_id: int, artifact_error: str) -> ActionsRunResult:
+        return ActionsRunResult(
+            status="error",
+            run_id=run_id,
+            conclusion="success",
+            passed=None,
+            failed=None,
+            total=None,
+            stdout=None,
+            stderr="Test results artifact missing or unreadable.",
+            head_sha="sha",
+            html_url=None,
+            raw={"artifact_error": artifact_error},
+        )
+
+    for run_id, error in enumerate(
+        ["artifact_download_failed", "artifact_parse_timeout"], start=50
+    ):
+        assert not errored(run_id, error).is_settled
+        assert not await svc.save_run_result(
+            async_session, repo_full_name="org/repo", result=errored(run_id, error)
+        )
+
+    # A corrupt artifact stays corrupt, so that outcome is final.
+    assert await svc.save_run_result(
+        async_session,
+        repo_full_name="org/repo",
+        result=errored(60, "artifact_corrupt"),
+    )
+
+
+def test_stored_run_result_refetches_errors():
+    workspace = SimpleNamespace(
+        last_workflow_run_id="7",
+        last_workflow_conclusion="success",
+        last_test_summary_json='{"status": "error", "stderr": "missing"}',
+        pending_run_dispatched_at=None,
+        latest_commit_sha="sha",
+        repo_full_name="org/repo",
+    )
+    assert svc.stored_run_result(workspace, 7) is None
+
+    workspace.last_test_summary_json = '{"status": "passed", "passed": 1}'
+    assert svc.stored_run_result(workspace, 7).passed == 1
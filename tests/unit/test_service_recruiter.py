@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from app.domains.submissions import service_recruiter as svc
+from app.domains.submissions.presenter.materialize import list_fields
 
 
 def test_derive_test_status_variants():
@@ -97,3 +100,56 @@ async def test_list_submissions_with_limit_offset():
     )
     assert rows == []
     assert session.received is not None
+
+
+def test_list_fields_materializes_test_and_diff_columns():
+    output = {
+        "status": "failed",
+        "passed": 1,
+        "failed": 2,
+        "stdout": "token ghp_1234567890abcdef " + "x" * 5000,
+        "runId": 91,
+        "conclusion": "TIMED_OUT",
+        "summary": {"note": "n"},
+    }
+    diff = {
+        "base": "b",
+        "head": "h",
+        "files": [
+            {"filename": "a", "additions": 3, "deletions": 1},
+            {"filename": "b", "additions": "2", "deletions": None},
+        ],
+    }
+    sub = type(
+        "Row",
+        (),
+        {
+            "test_output": json.dumps(output),
+            "diff_summary_json": json.dumps(diff),
+            "workflow_run_id": "91",
+            "tests_passed": None,
+            "tests_failed": None,
+        },
+    )()
+    fields = list_fields(sub)
+    assert (fields["tests_passed"], fields["tests_failed"], fields["tests_total"]) == (
+        1,
+        2,
+        3,
+    )
+    assert fields["test_status"] == "failed"
+    assert fields["test_run_id"] == "91"
+    assert fields["test_conclusion"] == "timed_out"
+    assert fields["test_timeout"] is True
+    assert fields["test_stdout_truncated"] is True
+    assert "ghp_" not in fields["test_stdout_preview"]
+    assert fields["test_summary"] == {"note": "n"}
+    assert fields["test_artifact_present"] is True
+    assert (
+        fields["diff_files_changed"],
+        fields["diff_additions"],
+        fields["diff_deletions"],
+    ) == (2, 5, 1)
+
+    empty = list_fields(type("Row", (), {"diff_summary_json": "{bad"})())
+    assert all(value is None for value in empty.values())
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.domains import SubmissionJob
+from app.integrations.github.actions_runner import ActionsRunResult
+from app.integrations.github.client import GithubError
+from app.integrations.github.workspaces import repository as workspace_repo
+from app.repositories.submissions import job_repository as job_repo
+from app.services.submissions.submission_jobs import (
+    RUNNING_JOB_EXPIRY,
+    SubmissionJobWorker,
+    build_job_payload,
+    process_submission_job,
+    retry_delay,
+)
+from tests.factories import (
+    create_candidate_session,
+    create_recruiter,
+    create_simulation,
+    create_submission,
+)
+
+
+def _result(status: str, run_id: int = 501) -> ActionsRunResult:
+    return ActionsRunResult(
+        status=status,
+        run_id=run_id,
+        conclusion=None if status == "running" else "success",
+        passed=None if status == "running" else 3,
+        failed=None if status == "running" else 0,
+        total=None if status == "running" else 3,
+        stdout=None,
+        stderr=None,
+        head_sha="head-sha",
+        html_url=None,
+        workflow_file="ci.yml",
+    )
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.compares: list[tuple[str, str, str]] = []
+
+    async def get_compare(self, repo_full_name, base, head):
+        self.compares.append((repo_full_name, base, head))
+        return {"ahead_by": 1, "behind_by": 0, "total_commits": 1, "files": []}
+
+
+def _transient_error(run_id: int = 501) -> ActionsRunResult:
+    result = _result("error", run_id)
+    result.passed = result.failed = result.total = None
+    result.raw = {"artifact_error": "artifact_download_failed"}
+    return result
+
+
+class _Runner:
+    def __init__(
+        self, *statuses: str | ActionsRunResult, error: Exception | None = None
+    ) -> None:
+        self.client = _Client()
+        self.statuses = list(statuses)
+        self.error = error
+        self.dispatched: list[dict] = []
+        self.polled: list[int] = []
+
+    async def dispatch_run(self, **kwargs):
+        if self.error:
+            raise self.error
+        self.dispatched.append(kwargs)
+        return _result(self.statuses.pop(0))
+
+    async def poll_run_result(self, *, repo_full_name, run_id):
+        if self.error:
+            raise self.error
+        self.polled.append(run_id)
+        status = self.statuses.pop(0)
+        if isinstance(status, ActionsRunResult):
+            return status
+        return _result(status, run_id)
+
+
+class _SessionMaker:
+    def __init__(self, session) -> None:
+        self.session = session
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self.session
+
+    async def __aexit__(self, *_exc):
+        return False
+
+
+async def _queued_submission(async_session):
+    recruiter = await create_recruiter(async_session, email="jobs@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    await workspace_repo.create_workspace(
+        async_session,
+        candidate_session_id=cs.id,
+        task_id=tasks[1].id,
+        template_repo_full_name=tasks[1].template_repo or "",
+        repo_full_name="org/jobs-repo",
+        repo_id=1,
+        default_branch="main",
+        base_template_sha="base",
+        created_at=datetime.now(UTC),
+    )
+    submission = await create_submission(
+        async_session,
+        candidate_session=cs,
+        task=tasks[1],
+        code_repo_path="org/jobs-repo",
+    )
+    submission.processing_status = "processing"
+    job = await job_repo.enqueue(
+        async_session,
+        submission_id=submission.id,
+        payload_json=build_job_payload(branch="main", workflow_inputs=None),
+        now=datetime.now(UTC) - timedelta(seconds=1),
+    )
+    await async_session.commit()
+    return submission, job
+
+
+async def _claim(async_session, owner: str = "w1") -> list[int]:
+    return await job_repo.claim_due(
+        async_session, owner=owner, now=datetime.now(UTC), lease_seconds=60
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_idempotent_and_claims_are_exclusive(async_session):
+    submission, job = await _queued_submission(async_session)
+    again = await job_repo.enqueue(
+        async_session,
+        submission_id=submission.id,
+        payload_json=None,
+        now=datetime.now(UTC),
+    )
+    assert again.id == job.id
+
+    assert await _claim(async_session, "w1") == [job.id]
+    # The lease is held, so another worker gets nothing.
+    assert await _claim(async_session, "w2") == []
+
+    later = datetime.now(UTC) + timedelta(minutes=5)
+    reclaimed = await job_repo.claim_due(
+        async_session, owner="w2", now=later, lease_seconds=60
+    )
+    assert reclaimed == [job.id]
+    await async_session.refresh(job)
+    assert job.lease_owner == "w2"
+
+
+@pytest.mark.asyncio
+async def test_job_dispatches_once_then_completes_submission(async_session):
+    submission, job = await _queued_submission(async_session)
+    runner = _Runner("running", "running", "passed")
+
+    await _claim(async_session)
+    status = await process_submission_job(
+        async_session, job.id, runner=runner, owner="w1"
+    )
+    assert status == "pending"
+    assert json.loads(job.payload_json)["runId"] == 501
+    assert job.attempts == 0
+
+    job.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+    await async_session.commit()
+    await _claim(async_session)
+    assert (
+        await process_submission_job(async_session, job.id, runner=runner, owner="w1")
+        == "pending"
+    )
+
+    job.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+    await async_session.commit()
+    await _claim(async_session)
+    assert (
+        await process_submission_job(async_session, job.id, runner=runner, owner="w1")
+        == "succeeded"
+    )
+    assert len(runner.dispatched) == 1
+    assert runner.polled == [501, 501]
+    assert runner.client.compares == [("org/jobs-repo", "base", "head-sha")]
+
+    await async_session.refresh(submission)
+    assert submission.processing_status == "ready"
+    assert submission.workflow_run_id == "501"
+    assert submission.tests_passed == 3
+    assert submission.test_status is not None
+    assert json.loads(submission.diff_summary_json)["head"] == "head-sha"
+    assert submission.diff_head == "head-sha"
+    assert job.lease_owner is None
+
+
+@pytest.mark.asyncio
+async def test_job_retries_with_backoff_then_fails_submission(async_session):
+    submission, job = await _queued_submission(async_session)
+    runner = _Runner(error=GithubError("boom", status_code=502))
+
+    await _claim(async_session)
+    before = datetime.now(UTC)
+    status = await process_submission_job(
+        async_session, job.id, runner=runner, owner="w1", max_attempts=2
+    )
+    assert status == "pending"
+    assert job.attempts == 1
+    assert "boom" in job.last_error
+    next_attempt = job.next_attempt_at
+    if next_attempt.tzinfo is None:
+        next_attempt = next_attempt.replace(tzinfo=UTC)
+    assert next_attempt >= before + retry_delay(1)
+    # Not due yet, so nobody can claim it.
+    assert await _claim(async_session) == []
+    # A job leased by someone else is left alone.
+    assert (
+        await process_submission_job(async_session, job.id, runner=runner, owner="w9")
+        is None
+    )
+
+    job.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+    await async_session.commit()
+    await _claim(async_session)
+    status = await process_submission_job(
+        async_session, job.id, runner=runner, owner="w1", max_attempts=2
+    )
+    assert status == "failed"
+    await async_session.refresh(submission)
+    assert submission.processing_status == "failed"
+    assert retry_delay(20) == timedelta(seconds=300)
+
+
+@pytest.mark.asyncio
+async def test_job_repolls_runs_whose_results_were_unreadable(async_session):
+    submission, job = await _queued_submission(async_session)
+    runner = _Runner("running", _transient_error(), "passed")
+
+    await _claim(async_session)
+    assert (
+        await process_submission_job(async_session, job.id, runner=runner, owner="w1")
+        == "pending"
+    )
+
+    job.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+    await async_session.commit()
+    await _claim(async_session)
+    status = await process_submission_job(
+        async_session, job.id, runner=runner, owner="w1"
+    )
+    assert status == "pending"
+    assert job.attempts == 1
+    assert "artifact_download_failed" in job.last_error
+    await async_session.refresh(submission)
+    assert submission.processing_status == "processing"
+
+    job.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+    await async_session.commit()
+    await _claim(async_session)
+    assert (
+        await process_submission_job(async_session, job.id, runner=runner, owner="w1")
+        == "succeeded"
+    )
+    assert len(runner.dispatched) == 1
+    assert runner.polled == [501, 501]
+    await async_session.refresh(submission)
+    assert submission.tests_passed == 3
+
+
+@pytest.mark.asyncio
+async def test_job_fails_when_its_run_never_finishes(async_session):
+    submission, job = await _queued_submission(async_session)
+    job.created_at = datetime.now(UTC) - RUNNING_JOB_EXPIRY - timedelta(minutes=1)
+    await async_session.commit()
+    runner = _Runner("running")
+
+    await _claim(async_session)
+    status = await process_submission_job(
+        async_session, job.id, runner=runner, owner="w1"
+    )
+    assert status == "failed"
+    assert job.attempts == 0
+    assert "run 501 still unfinished" in job.last_error
+    await async_session.refresh(submission)
+    assert submission.processing_status == "failed"
+
+
+@pytest.mark.asyncio
+async def test_job_discards_work_once_its_lease_lapses(async_session):
+    submission, job = await _queued_submission(async_session)
+    runner = _Runner("passed")
+
+    class _SlowClient(_Client):
+        async def get_compare(self, repo_full_name, base, head):
+            await asyncio.sleep(0.1)
+            return await super().get_compare(repo_full_name, base, head)
+
+    runner.client = _SlowClient()
+    await job_repo.claim_due(
+        async_session, owner="w1", now=datetime.now(UTC), lease_seconds=0.05
+    )
+    assert (
+        await process_submission_job(async_session, job.id, runner=runner, owner="w1")
+        is None
+    )
+    await async_session.refresh(job)
+    await async_session.refresh(submission)
+    assert job.status == "running"
+    assert job.lease_owner == "w1"
+    assert submission.processing_status == "processing"
+    assert submission.tests_passed is None
+    # The lapsed lease is free for another worker to take over.
+    assert await _claim(async_session, "w2") == [job.id]
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_due_jobs(async_session):
+    _, job = await _queued_submission(async_session)
+    worker = SubmissionJobWorker(
+        session_maker=_SessionMaker(async_session),
+        runner_factory=lambda: _Runner("passed"),
+        interval_seconds=0.01,
+    )
+    assert await worker.run_once() == ["succeeded"]
+    assert await worker.run_once() == []
+    stored = await async_session.get(SubmissionJob, job.id)
+    assert stored.status == "succeeded"
+
+    worker.start()
+    await worker.stop()
+    await worker.stop()
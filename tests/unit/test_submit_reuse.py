@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.domains.submissions import service_candidate as svc
+from app.integrations.github.actions_runner import ActionsRunResult
+from app.integrations.github.client import GithubError
+from app.integrations.github.workspaces import repository as workspace_repo
+from app.services.submissions.use_cases.submit_reuse import find_reusable_run
+from app.services.submissions.use_cases.submit_task_runner import (
+    run_code_submission,
+)
+from tests.factories import (
+    create_candidate_session,
+    create_recruiter,
+    create_simulation,
+)
+
+
+def _result(run_id: int, head_sha: str, status: str = "passed") -> ActionsRunResult:
+    return ActionsRunResult(
+        status=status,
+        run_id=run_id,
+        conclusion="success" if status == "passed" else None,
+        passed=4,
+        failed=0,
+        total=4,
+        stdout="ok",
+        stderr=None,
+        head_sha=head_sha,
+        html_url=None,
+    )
+
+
+class _Client:
+    def __init__(self, head_sha: str | None, error: Exception | None = None):
+        self.head_sha = head_sha
+        self.error = error
+        self.branch_calls = 0
+
+    async def get_branch(self, repo_full_name, branch):
+        self.branch_calls += 1
+        if self.error:
+            raise self.error
+        return {"commit": {"sha": self.head_sha}}
+
+    async def get_compare(self, repo_full_name, base, head):
+        return {"ahead_by": 1, "behind_by": 0, "total_commits": 1, "files": []}
+
+
+class _Runner:
+    def __init__(self, result: ActionsRunResult):
+        self.result = result
+        self.dispatches = 0
+
+    async def dispatch_and_wait(self, **_kwargs):
+        self.dispatches += 1
+        return self.result
+
+
+async def _workspace_with_run(async_session, *, status: str = "passed"):
+    recruiter = await create_recruiter(async_session, email="reuse@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    cs = await create_candidate_session(
+        async_session, simulation=sim, status="in_progress"
+    )
+    workspace = await workspace_repo.create_workspace(
+        async_session,
+        candidate_session_id=cs.id,
+        task_id=tasks[1].id,
+        template_repo_full_name=tasks[1].template_repo or "",
+        repo_full_name="org/reuse-repo",
+        repo_id=1,
+        default_branch="main",
+        base_template_sha="base",
+        created_at=datetime.now(UTC),
+    )
+    if status == "running":
+        workspace.pending_run_dispatched_at = datetime.now(UTC)
+    await svc.record_run_result(async_session, workspace, _result(70, "sha-1", status))
+    return cs, tasks[1], workspace
+
+
+@pytest.mark.asyncio
+async def test_submit_reuses_run_when_head_unchanged(async_session):
+    cs, task, _ = await _workspace_with_run(async_session)
+    client, runner = _Client("sha-1"), _Runner(_result(71, "sha-2"))
+
+    result, diff, _ = await run_code_submission(
+        db=async_session,
+        candidate_session_id=cs.id,
+        task_id=task.id,
+        payload=SimpleNamespace(branch=None, workflowInputs=None),
+        github_client=client,
+        actions_runner=runner,
+    )
+    assert runner.dispatches == 0
+    assert client.branch_calls == 1
+    assert (result.run_id, result.status, result.stdout) == (70, "passed", "ok")
+    assert '"head": "sha-1"' in diff.summary_json
+
+
+@pytest.mark.asyncio
+async def test_submit_dispatches_when_head_moved(async_session):
+    cs, task, workspace = await _workspace_with_run(async_session)
+    client, runner = _Client("sha-2"), _Runner(_result(71, "sha-2"))
+
+    result, _, _ = await run_code_submission(
+        db=async_session,
+        candidate_session_id=cs.id,
+        task_id=task.id,
+        payload=SimpleNamespace(branch="main", workflowInputs=None),
+        github_client=client,
+        actions_runner=runner,
+    )
+    assert runner.dispatches == 1
+    assert result.run_id == 71
+    assert workspace.last_workflow_run_id == "71"
+
+
+@pytest.mark.asyncio
+async def test_find_reusable_run_skips_running_and_failed_lookups(async_session):
+    _, _, workspace = await _workspace_with_run(async_session, status="running")
+    assert (
+        await find_reusable_run(async_session, _Client("sha-1"), workspace, "main")
+        is None
+    )
+
+    workspace.last_test_summary_json = None
+    workspace.last_workflow_run_id = "70"
+    failing = _Client(None, error=GithubError("boom", status_code=502))
+    assert await find_reusable_run(async_session, failing, workspace, "main") is None
+    assert failing.branch_calls == 1
+
+    workspace.last_workflow_run_id = None
+    assert await find_reusable_run(async_session, failing, workspace, "main") is None
+    assert failing.branch_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_find_reusable_run_requires_a_settled_run_with_the_same_inputs(
+    async_session,
+):
+    cs, task, workspace = await _workspace_with_run(async_session)
+    client = _Client("sha-1")
+    assert await find_reusable_run(async_session, client, workspace, "main")
+    assert (
+        await find_reusable_run(
+            async_session, client, workspace, "main", workflow_inputs={"suite": "x"}
+        )
+        is None
+    )
+
+    runner = _Runner(_result(71, "sha-1"))
+    await run_code_submission(
+        db=async_session,
+        candidate_session_id=cs.id,
+        task_id=task.id,
+        payload=SimpleNamespace(branch="main", workflowInputs={"suite": "x"}),
+        github_client=client,
+        actions_runner=runner,
+    )
+    assert runner.dispatches == 1
+    assert (
+        await find_reusable_run(
+            async_session, client, workspace, "main", workflow_inputs={"suite": "x"}
+        )
+    ).run_id == 71
+    assert await find_reusable_run(async_session, client, workspace, "main") is None
+
+    errored = _result(72, "sha-1", status="error")
+    await svc.record_run_result(async_session, workspace, errored)
+    workspace.last_workflow_inputs_json = None
+    assert await find_reusable_run(async_session, client, workspace, "main") is None
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import delete, event
+
+from app.domains import Task
+from app.domains.tasks import snapshot_cache
+from app.domains.tasks.snapshot_cache import TaskSnapshot, TaskSnapshotCache
+from tests.factories import create_recruiter, create_simulation
+
+
+def _task(task_id: int, simulation_id: int, day_index: int = 1) -> Task:
+    return Task(
+        id=task_id,
+        simulation_id=simulation_id,
+        day_index=day_index,
+        type="code",
+        title=f"Task {task_id}",
+        description="desc",
+    )
+
+
+@pytest.fixture
+def count_statements(db_engine):
+    statements: list[str] = []
+
+    def _on_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _on_execute)
+    yield statements
+    event.remove(db_engine.sync_engine, "before_cursor_execute", _on_execute)
+
+
+def test_snapshot_is_read_only():
+    snap = TaskSnapshot.from_task(_task(1, 10))
+    assert (snap.id, snap.simulation_id, snap.title) == (1, 10, "Task 1")
+    with pytest.raises(AttributeError):
+        snap.title = "changed"
+    assert not hasattr(snap, "__dict__")
+
+
+def test_cache_evicts_least_recently_used_simulation():
+    cache = TaskSnapshotCache(max_simulations=2)
+    cache.put(1, [_task(11, 1)])
+    cache.put(2, [_task(21, 2)])
+    assert cache.get_task(11).simulation_id == 1
+    cache.put(3, [_task(31, 3)])
+
+    assert cache.get_simulation(2) is None
+    assert cache.get_task(21) is None
+    assert [t.id for t in cache.get_simulation(1)] == [11]
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["simulations"] == 2
+
+    cache.put(4, [])
+    assert cache.get_simulation(4) is None
+    cache.invalidate_simulation(1)
+    assert cache.get_task(11) is None
+    cache.clear()
+    assert cache.stats()["tasks"] == 0
+
+
+@pytest.mark.asyncio
+async def test_task_lookups_hit_the_database_once(async_session, count_statements):
+    recruiter = await create_recruiter(async_session, email="cache@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    await async_session.commit()
+    count_statements.clear()
+
+    snap = await snapshot_cache.task_by_id(async_session, tasks[2].id)
+    assert (snap.id, snap.day_index) == (tasks[2].id, tasks[2].day_index)
+    ordered = await snapshot_cache.simulation_tasks(async_session, sim.id)
+    assert [t.id for t in ordered] == [t.id for t in tasks]
+    assert await snapshot_cache.task_by_id(async_session, tasks[0].id) is ordered[0]
+    assert len(count_statements) == 1
+
+    assert await snapshot_cache.task_by_id(async_session, 999_999) is None
+
+
+@pytest.mark.asyncio
+async def test_task_writes_invalidate_the_cache(async_session):
+    recruiter = await create_recruiter(async_session, email="edit@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    await async_session.commit()
+    await snapshot_cache.simulation_tasks(async_session, sim.id)
+
+    tasks[0].title = "Renamed"
+    await async_session.commit()
+    refreshed = await snapshot_cache.simulation_tasks(async_session, sim.id)
+    assert refreshed[0].title == "Renamed"
+
+    await async_session.execute(delete(Task).where(Task.simulation_id == sim.id))
+    await async_session.commit()
+    assert await snapshot_cache.simulation_tasks(async_session, sim.id) == ()
+
+    snapshot_cache.invalidate_simulation_tasks(sim.id)
+    assert snapshot_cache.task_cache.get_simulation(sim.id) is None
+
+
+@pytest.mark.asyncio
+async def test_task_writes_invalidate_only_once_committed(async_session):
+    recruiter = await create_recruiter(async_session, email="defer@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    await async_session.commit()
+    await snapshot_cache.simulation_tasks(async_session, sim.id)
+
+    # A reader re-caching between flush and commit would see the old rows.
+    tasks[0].title = "Renamed"
+    await async_session.flush()
+    assert snapshot_cache.task_cache.get_simulation(sim.id) is not None
+    await async_session.commit()
+    assert snapshot_cache.task_cache.get_simulation(sim.id) is None
+
+    await snapshot_cache.simulation_tasks(async_session, sim.id)
+    await async_session.execute(delete(Task).where(Task.id == tasks[1].id))
+    assert snapshot_cache.task_cache.get_simulation(sim.id) is not None
+    await async_session.commit()
+    assert snapshot_cache.task_cache.get_simulation(sim.id) is None
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_task_writes_drop_rows_cached_meanwhile(async_session):
+    recruiter = await create_recruiter(async_session, email="rollback@sim.com")
+    sim, tasks = await create_simulation(async_session, created_by=recruiter)
+    await async_session.commit()
+    sim_id = sim.id
+
+    tasks[0].title = "Draft"
+    await async_session.flush()
+    cached = await snapshot_cache.simulation_tasks(async_session, sim_id)
+    assert cached[0].title == "Draft"
+    await async_session.rollback()
+
+    assert snapshot_cache.task_cache.get_simulation(sim_id) is None
+    refreshed = await snapshot_cache.simulation_tasks(async_session, sim_id)
+    assert refreshed[0].title != "Draft"
@@ -107,10 +107,10 @@ class _LiveStubClient(GithubClient):
             raise self.responses["artifact_error"]
         return self.responses.get("artifacts", [])
 
-    async def download_artifact_zip(self, *a, **k):
+    async def download_artifact_file(self, *a, **k):
         if "download_error" in self.responses:
             raise self.responses["download_error"]
-        return self.responses.get("zip", b"")
+        return io.BytesIO(self.responses.get("zip", b""))
 
 
 @pytest.mark.asyncio
@@ -561,8 +561,8 @@ async def test_live_health_zip_missing_test_results_json():
         async def list_artifacts(self, *args, **kwargs):
             return [{"id": 1, "name": "tenon-test-results", "expired": False}]
 
-        async def download_artifact_zip(self, *args, **kwargs):
-            return _make_zip({"other.json": "{}"})
+        async def download_artifact_file(self, *args, **kwargs):
+            return io.BytesIO(_make_zip({"other.json": "{}"}))
 
     template_key = next(iter(TEMPLATE_CATALOG))
     response = await check_template_health(
@@ -599,11 +599,11 @@ async def test_live_health_invalid_schema():
         async def list_artifacts(self, *args, **kwargs):
             return [{"id": 1, "name": "tenon-test-results", "expired": False}]
 
-        async def download_artifact_zip(self, *args, **kwargs):
+        async def download_artifact_file(self, *args, **kwargs):
             body = (
                 '{"passed": "3", "failed": 0, "total": 3, "stdout": "", "stderr": ""}'
             )
-            return _make_zip({"tenon-test-results.json": body})
+            return io.BytesIO(_make_zip({"tenon-test-results.json": body}))
 
     template_key = next(iter(TEMPLATE_CATALOG))
     response = await check_template_health(
@@ -643,9 +643,9 @@ async def test_live_health_legacy_and_tenon_artifacts_prefers_tenon():
                 {"id": 2, "name": "tenon-test-results", "expired": False},
             ]
 
-        async def download_artifact_zip(self, *args, **kwargs):
+        async def download_artifact_file(self, *args, **kwargs):
             body = '{"passed": 1, "failed": 0, "total": 1, "stdout": "", "stderr": ""}'
-            return _make_zip({"tenon-test-results.json": body})
+            return io.BytesIO(_make_zip({"tenon-test-results.json": body}))
 
     template_key = next(iter(TEMPLATE_CATALOG))
     response = await check_template_health(
@@ -685,9 +685,9 @@ async def test_live_health_non_success_conclusion_marks_error():
         async def list_artifacts(self, *args, **kwargs):
             return [{"id": 1, "name": "tenon-test-results", "expired": False}]
 
-        async def download_artifact_zip(self, *args, **kwargs):
+        async def download_artifact_file(self, *args, **kwargs):
             body = '{"passed": 1, "failed": 0, "total": 1, "stdout": "", "stderr": ""}'
-            return _make_zip({"tenon-test-results.json": body})
+            return io.BytesIO(_make_zip({"tenon-test-results.json": body}))
 
     template_key = next(iter(TEMPLATE_CATALOG))
     response = await check_template_health(
@@ -727,9 +727,9 @@ async def test_live_health_timed_out_conclusion_marks_error():
         async def list_artifacts(self, *args, **kwargs):
             return [{"id": 1, "name": "tenon-test-results", "expired": False}]
 
-        async def download_artifact_zip(self, *args, **kwargs):
+        async def download_artifact_file(self, *args, **kwargs):
             body = '{"passed": 1, "failed": 0, "total": 1, "stdout": "", "stderr": ""}'
-            return _make_zip({"tenon-test-results.json": body})
+            return io.BytesIO(_make_zip({"tenon-test-results.json": body}))
 
     template_key = next(iter(TEMPLATE_CATALOG))
     response = await check_template_health(
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import json
+from types import SimpleNamespace
+
 import pytest
 from fastapi import HTTPException
 
 from app.domains.submissions import service_candidate as svc
+from app.services.submissions.diff_summary import (
+    extract_patches,
+    pack_patches,
+    unpack_patches,
+)
+from app.services.submissions.use_cases.submit_diff import build_diff_summary
 
 
 def test_validate_github_username_allows_standard():
@@ -66,6 +75,53 @@ def test_summarize_diff_includes_base_head():
     assert summary["head"] == "head123"
 
 
+def test_summarize_diff_drops_patches_into_separate_blob():
+    compare = {
+        "files": [
+            {"filename": "a.py", "status": "modified", "patch": "@@ -1 +1 @@"},
+            {"filename": "b.png", "status": "added"},
+        ]
+    }
+    summary = svc.summarize_diff(compare, base="b", head="h")
+    assert all("patch" not in f for f in summary["files"])
+
+    patches = extract_patches(compare)
+    assert patches == {"a.py": "@@ -1 +1 @@"}
+    assert unpack_patches(pack_patches(patches)) == patches
+    assert pack_patches({}) is None
+    assert unpack_patches(None) == {}
+    assert unpack_patches(b"not-zlib") == {}
+
+
+@pytest.mark.asyncio
+async def test_build_diff_summary_marks_compares_at_the_file_cap_truncated():
+    calls = []
+
+    class Client:
+        def __init__(self, count: int) -> None:
+            self.count = count
+
+        async def get_compare(self, repo, base, head):
+            calls.append((repo, base, head))
+            return {
+                "ahead_by": 1,
+                "files": [{"filename": f"f{i}"} for i in range(self.count)],
+            }
+
+    workspace = SimpleNamespace(repo_full_name="org/repo", base_template_sha="b")
+    capped = json.loads(
+        (await build_diff_summary(Client(300), workspace, "main", "h")).summary_json
+    )
+    assert calls == [("org/repo", "b", "h")]
+    assert capped["truncated"] is True
+    assert len(capped["files"]) == 300
+
+    complete = json.loads(
+        (await build_diff_summary(Client(299), workspace, "main", "h")).summary_json
+    )
+    assert "truncated" not in complete
+
+
 def test_validate_run_allowed_blocks_non_code_tasks():
     class FakeTask:
         def __init__(self, task_type):